@@ -0,0 +1,95 @@
+"""End-to-end throughput against the local `FakeNukiServer`.
+
+Run from the repository root with ``python -m benchmarks.bench_end_to_end``.
+"""
+import tempfile
+import time
+from pathlib import Path
+
+from nukiwebapi import NukiWebAPI, NukiWebAPIPool
+from nukiwebapi.recording import Recorder, ReplayTransport
+from nukiwebapi.simulator import FakeNukiServer
+from nukiwebapi.transport import InMemoryTransport, make_transport
+
+
+def bench_fleet_sweep(locks: int = 200, latency=(0.002, 0.01), max_workers: int = 32) -> dict:
+    """Lock every smartlock through `Fleet.lock` and report requests per second."""
+    with FakeNukiServer(locks=locks, auths_per_lock=0, logs_per_lock=0, latency=latency) as server:
+        client = NukiWebAPI("TOKEN", base_url=server.url)
+        client.lock_instances
+        report = client.fleet.lock(max_workers=max_workers)
+        summary = report.summary()
+    return {"throughput_rps": summary["throughput"], "p50_s": summary["latency"]["p50"],
+            "p99_s": summary["latency"]["p99"], "failed": summary["failed"]}
+
+
+def bench_pooled_refresh(accounts: int = 20, latency=(0.002, 0.01)) -> dict:
+    """Refresh all locks of many accounts through a shared-session `NukiWebAPIPool`."""
+    with FakeNukiServer(locks=50, auths_per_lock=0, logs_per_lock=0, latency=latency) as server:
+        with NukiWebAPIPool({f"acc{i}": f"TOKEN{i}" for i in range(accounts)}, base_url=server.url) as pool:
+            start = time.perf_counter()
+            results = pool.refresh_all_locks()
+            elapsed = time.perf_counter() - start
+    return {"elapsed_s": elapsed, "accounts_per_s": accounts / elapsed,
+            "failed": sum(not r.ok for r in results.values())}
+
+
+def bench_auth_listing(auths_per_lock: int = 50, locks: int = 100) -> dict:
+    """Fetch and iterate every auth of a large account over HTTP."""
+    with FakeNukiServer(locks=locks, auths_per_lock=auths_per_lock, logs_per_lock=0) as server:
+        client = NukiWebAPI("TOKEN", base_url=server.url)
+        start = time.perf_counter()
+        count = sum(1 for _ in client.smartlock_auth.list_auths())
+        elapsed = time.perf_counter() - start
+    return {"elapsed_s": elapsed, "auths": count}
+
+
+def bench_replayed_auth_listing(auths_per_lock: int = 50, locks: int = 100, rounds: int = 5) -> dict:
+    """Record the auth listing once, then replay it to time client-side work only."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "auths.jsonl.gz")
+        with FakeNukiServer(locks=locks, auths_per_lock=auths_per_lock, logs_per_lock=0) as server:
+            with Recorder(path) as recorder:
+                NukiWebAPI("TOKEN", base_url=server.url, recorder=recorder).smartlock_auth.list_auths()
+        transport = ReplayTransport(path)
+    client = NukiWebAPI("TOKEN", transport=transport)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        count = sum(1 for _ in client.smartlock_auth.list_auths())
+    elapsed = (time.perf_counter() - start) / rounds
+    return {"elapsed_s": elapsed, "auths": count}
+
+
+def bench_transports(locks: int = 100, max_workers: int = 16) -> dict:
+    """Run the same concurrent lock sweep over every available transport."""
+    results = {}
+    for name in ("requests", "urllib3", "httpx", "in_memory"):
+        with FakeNukiServer(locks=locks, auths_per_lock=0, logs_per_lock=0) as server:
+            try:
+                transport = InMemoryTransport(server) if name == "in_memory" else make_transport(name)
+            except ImportError:
+                continue
+            with transport:
+                client = NukiWebAPI("TOKEN", base_url=server.url, transport=transport)
+                client.lock_instances
+                summary = client.fleet.lock(max_workers=max_workers).summary()
+        results[name] = {"throughput_rps": summary["throughput"], "p50_s": summary["latency"]["p50"]}
+    return results
+
+
+BENCHMARKS = {
+    "fleet_sweep_200": bench_fleet_sweep,
+    "pooled_refresh_20_accounts": bench_pooled_refresh,
+    "auth_listing_5000": bench_auth_listing,
+    "replayed_auth_listing_5000": bench_replayed_auth_listing,
+    "transports_100": bench_transports,
+}
+
+
+def run() -> dict:
+    return {name: bench() for name, bench in BENCHMARKS.items()}
+
+
+if __name__ == "__main__":
+    for name, result in run().items():
+        print(f"{name:28} {result}")
@@ -0,0 +1,119 @@
+"""Micro-benchmarks for client-side hot paths (no network involved).
+
+Run from the repository root with ``python -m benchmarks.bench_hot_paths``.
+"""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from benchmarks.common import fake_smartlocks, json_response, measure
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.access import AccessEvaluator
+from nukiwebapi.smartlock_auth import build_bulk_payloads
+
+
+def bench_fetch_smartlocks(fleet_size: int = 2000) -> dict:
+    """`NukiWebAPI._fetch_smartlocks` on a large fleet (JSON decode + instance creation)."""
+    client = NukiWebAPI("TOKEN")
+    payload = fake_smartlocks(fleet_size)
+    with patch.object(client, "_request", side_effect=lambda *a, **k: json_response(payload)):
+        return measure(client._fetch_smartlocks, number=5)
+
+
+def bench_property_access(fleet_size: int = 2000) -> dict:
+    """Read name, is_locked and battery_charge of every `SmartlockInstance`."""
+    client = NukiWebAPI("TOKEN")
+    with patch.object(client, "_request", return_value=json_response(fake_smartlocks(fleet_size))):
+        locks = list(client._fetch_smartlocks().values())
+
+    def read_all():
+        for lock in locks:
+            lock.name, lock.is_locked, lock.battery_charge
+
+    return measure(read_all, number=20)
+
+
+def bench_json_decode(entries: int = 5000) -> dict:
+    """Decode a large auth list response with `Response.json()`."""
+    auths = [{"id": f"{i:024x}", "smartlockId": 1, "name": f"Guest {i}", "type": 0,
+              "enabled": True, "remoteAllowed": False, "allowedWeekDays": 127} for i in range(entries)]
+    response = json_response(auths)
+    return measure(response.json, number=10)
+
+
+def bench_auth_payload(number: int = 20000) -> dict:
+    """Payload building in `SmartlockAuth.create_auth_for_smartlock` (request mocked out)."""
+    client = NukiWebAPI("TOKEN")
+    with patch.object(client, "_request"):
+        return measure(lambda: client.smartlock_auth.create_auth_for_smartlock(
+            1, "Guest", True, allowed_from_date="2025-01-01T00:00:00Z", allowed_until_date="2025-01-08T00:00:00Z",
+            allowed_week_days=127, allowed_from_time=480, allowed_until_time=1080, type=13, code=245678,
+        ), number=number)
+
+
+def bench_bulk_auth_payloads(specs: int = 10000, locks: int = 50) -> dict:
+    """Validate and group auth specs with `build_bulk_payloads`."""
+    data = [{"smartlock_id": i % locks, "name": f"Guest {i // locks}", "remote_allowed": False,
+             "allowed_from_date": "2025-01-01T00:00:00Z", "allowed_until_date": "2025-01-08T00:00:00Z",
+             "allowed_week_days": 127} for i in range(specs)]
+    return measure(lambda: build_bulk_payloads(data), number=5)
+
+
+def bench_webhook_log_iteration(total: int = 5000) -> dict:
+    """Iterate and aggregate webhook logs via `AdvancedApi.webhook_log_stats`."""
+    client = NukiWebAPI("TOKEN")
+    logs = [{"id": f"{total - i:024x}", "url": "https://hook", "responseStatus": 200, "responseTime": i % 700,
+             "request": '{"feature": "DEVICE_STATUS"}'} for i in range(total)]
+    pages = {None: logs[:100]}
+    for i in range(100, total, 100):
+        pages[logs[i - 1]["id"]] = logs[i:i + 100]
+
+    def fake_get(api_key_id, id=None, limit=50):
+        return pages.get(id, [])
+
+    with patch.object(client.advanced_api, "get_webhook_logs", side_effect=fake_get):
+        return measure(lambda: client.advanced_api.webhook_log_stats(1), number=3)
+
+
+def _access_evaluator(auths: int = 50000, locks: int = 100):
+    base = datetime(2025, 1, 1)
+    data = [{"id": f"{i:024x}", "smartlockId": i % locks, "enabled": True,
+             "allowedFromDate": (base + timedelta(hours=i % 2000)).isoformat() + "Z",
+             "allowedUntilDate": (base + timedelta(hours=i % 2000 + 48)).isoformat() + "Z",
+             "allowedWeekDays": 127 if i % 3 else 31, "allowedFromTime": 480 if i % 2 else 0,
+             "allowedUntilTime": 1080 if i % 2 else 0} for i in range(auths)]
+    evaluator = AccessEvaluator(data)
+    len(evaluator)
+    return evaluator, base + timedelta(hours=1000, minutes=30)
+
+
+def bench_who_can_open(auths: int = 50000, locks: int = 100) -> dict:
+    """`AccessEvaluator.who_can_open` over many time-limited auths."""
+    evaluator, at = _access_evaluator(auths, locks)
+    return measure(lambda: evaluator.who_can_open(7, at), number=200)
+
+
+def bench_expired(auths: int = 50000, locks: int = 100) -> dict:
+    """`AccessEvaluator.expired` over many time-limited auths."""
+    evaluator, at = _access_evaluator(auths, locks)
+    return measure(lambda: evaluator.expired(at), number=20)
+
+
+BENCHMARKS = {
+    "fetch_smartlocks_2000": bench_fetch_smartlocks,
+    "property_access_2000": bench_property_access,
+    "json_decode_5000_auths": bench_json_decode,
+    "auth_payload_build": bench_auth_payload,
+    "bulk_auth_payloads_10000": bench_bulk_auth_payloads,
+    "webhook_log_stats_5000": bench_webhook_log_iteration,
+    "who_can_open_50000": bench_who_can_open,
+    "expired_auths_50000": bench_expired,
+}
+
+
+def run() -> dict:
+    return {name: bench() for name, bench in BENCHMARKS.items()}
+
+
+if __name__ == "__main__":
+    for name, result in run().items():
+        print(f"{name:28} {result['median_s'] * 1e3:10.3f} ms")
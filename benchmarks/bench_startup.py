@@ -0,0 +1,43 @@
+"""Cold-start benchmark: package import time and client construction cost.
+
+Run from the repository root with ``python -m benchmarks.bench_startup``.
+"""
+import statistics
+import subprocess
+import sys
+import timeit
+
+IMPORT_SNIPPET = (
+    "import sys, time; t = time.perf_counter(); import nukiwebapi; "
+    "print(time.perf_counter() - t, 'requests' in sys.modules)"
+)
+
+
+def bench_import(runs: int = 10) -> dict:
+    """Import `nukiwebapi` in fresh interpreters and report the median time."""
+    times = []
+    loads_requests = False
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], capture_output=True, text=True, check=True)
+        elapsed, requests_loaded = out.stdout.split()
+        times.append(float(elapsed))
+        loads_requests = loads_requests or requests_loaded == "True"
+    return {"import_median_s": statistics.median(times), "import_loads_requests": loads_requests}
+
+
+def bench_constructor(number: int = 10000) -> dict:
+    """Time `NukiWebAPI(...)` construction and the first sub-client access."""
+    from nukiwebapi import NukiWebAPI
+
+    construct = timeit.timeit(lambda: NukiWebAPI("TOKEN"), number=number) / number
+    first_access = timeit.timeit(lambda: NukiWebAPI("TOKEN").smartlock, number=number) / number
+    return {"constructor_us": construct * 1e6, "constructor_plus_smartlock_us": first_access * 1e6}
+
+
+def run() -> dict:
+    return {**bench_import(), **bench_constructor()}
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:32} {value}")
@@ -0,0 +1,42 @@
+"""Shared timing helpers and fixtures for the benchmark suite."""
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from requests.models import Response
+
+
+def measure(func: Callable[[], Any], number: int = 100, repeat: int = 5) -> Dict[str, float]:
+    """Run `func` `number` times per round for `repeat` rounds; report per-call seconds."""
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return {"median_s": statistics.median(rounds), "min_s": min(rounds), "number": number, "repeat": repeat}
+
+
+def json_response(payload: Any) -> Response:
+    """Build a `requests.Response` carrying `payload` as JSON, like the test suite does."""
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(payload).encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
+def fake_smartlocks(count: int) -> List[Dict[str, Any]]:
+    """Return `count` smartlock payloads shaped like GET /smartlock."""
+    return [
+        {
+            "smartlockId": 0x100000000 + i,
+            "type": 4,
+            "name": f"Door {i}",
+            "config": {"name": f"Door {i}", "latitude": 52.5, "longitude": 13.4},
+            "state": {"mode": 2, "state": 1, "batteryCritical": False, "batteryCharge": 80, "doorState": 2},
+        }
+        for i in range(count)
+    ]
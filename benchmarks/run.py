@@ -0,0 +1,89 @@
+"""Run the whole benchmark suite and store the results per release.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.run                     # print results
+    python -m benchmarks.run --save              # also write benchmarks/results/<version>.json
+    python -m benchmarks.run --compare 0.1.14    # show changes against a stored release
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tomllib
+from pathlib import Path
+
+from benchmarks import bench_end_to_end, bench_hot_paths, bench_startup
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+SUITES = {"startup": bench_startup, "hot_paths": bench_hot_paths, "end_to_end": bench_end_to_end}
+
+
+def package_version() -> str:
+    with open(ROOT / "pyproject.toml", "rb") as f:
+        return tomllib.load(f)["project"]["version"]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: dict, previous: dict) -> None:
+    old, new = flatten(previous["results"]), flatten(current["results"])
+    print(f"\nchanges against {previous['version']} ({previous['commit']}):")
+    for name in sorted(new):
+        if name in old and old[name] and not name.endswith(("number", "repeat")):
+            change = (new[name] - old[name]) / old[name] * 100
+            print(f"  {name:60} {old[name]:>12.6g} -> {new[name]:>12.6g} ({change:+.1f}%)")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=sorted(SUITES), action="append", help="Only run these suites.")
+    parser.add_argument("--save", action="store_true", help="Store results under benchmarks/results/.")
+    parser.add_argument("--compare", metavar="VERSION", help="Compare against a stored release.")
+    args = parser.parse_args(argv)
+
+    report = {
+        "version": package_version(),
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": {},
+    }
+    for name in args.suite or SUITES:
+        print(f"running {name} ...", file=sys.stderr)
+        report["results"][name] = SUITES[name].run()
+
+    print(json.dumps(report, indent=2))
+    if args.compare:
+        compare(report, json.loads((RESULTS_DIR / f"{args.compare}.json").read_text()))
+    if args.save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path = RESULTS_DIR / f"{report['version']}.json"
+        path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"saved {path.relative_to(ROOT)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,12 @@
 from .nuki_web_api import NukiWebAPI
 
-__all__ = ["NukiWebAPI"]
+__all__ = ["NukiWebAPI", "NukiWebAPIPool"]
+
+
+def __getattr__(name):
+    # The pool pulls in requests' adapters; only import it when asked for.
+    if name == "NukiWebAPIPool":
+        from .pool import NukiWebAPIPool
+
+        return NukiWebAPIPool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
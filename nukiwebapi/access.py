@@ -0,0 +1,183 @@
+import math
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+#: ``allowedWeekDays`` bit per `datetime.weekday()` (Monday=64 ... Sunday=1).
+WEEKDAY_BITS = (64, 32, 16, 8, 4, 2, 1)
+ALL_WEEKDAYS = 127
+
+
+def parse_date(value: Optional[str]) -> Optional[float]:
+    """Parse an API timestamp such as ``2025-01-01T10:00:00.000Z`` into a POSIX timestamp."""
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _timestamp(at: datetime) -> float:
+    return (at if at.tzinfo is not None else at.replace(tzinfo=timezone.utc)).timestamp()
+
+
+class _Window:
+    """Pre-parsed access window of one authorization."""
+
+    __slots__ = ("start", "end", "weekdays", "from_minute", "until_minute", "auth")
+
+    def __init__(self, auth: Dict[str, Any]):
+        start = parse_date(auth.get("allowedFromDate"))
+        end = parse_date(auth.get("allowedUntilDate"))
+        self.start = -math.inf if start is None else start
+        self.end = math.inf if end is None else end
+        self.weekdays = auth.get("allowedWeekDays") or ALL_WEEKDAYS
+        self.from_minute = auth.get("allowedFromTime") or 0
+        self.until_minute = auth.get("allowedUntilTime") or 0
+        self.auth = auth
+
+    def allows_time(self, weekday_bit: int, minute: int) -> bool:
+        if not self.weekdays & weekday_bit:
+            return False
+        if self.from_minute == self.until_minute == 0:
+            return True
+        if self.from_minute <= self.until_minute:
+            return self.from_minute <= minute <= self.until_minute
+        # Window spanning midnight, e.g. 22:00-06:00.
+        return minute >= self.from_minute or minute <= self.until_minute
+
+
+def is_allowed(auth: Dict[str, Any], at: datetime) -> bool:
+    """
+    Return True if an authorization grants access at `at`.
+
+    Checks ``enabled``, the ``allowedFromDate``/``allowedUntilDate`` range,
+    the ``allowedWeekDays`` bitmask and the ``allowedFromTime``/
+    ``allowedUntilTime`` minutes of the day. Weekday and time of day are taken
+    from `at` as given, so pass it in the lock's local time; naive datetimes
+    are treated as UTC for the date range.
+    """
+    if auth.get("enabled") is False:
+        return False
+    window = _Window(auth)
+    ts = _timestamp(at)
+    return window.start <= ts <= window.end and window.allows_time(WEEKDAY_BITS[at.weekday()], at.hour * 60 + at.minute)
+
+
+class AccessEvaluator:
+    """
+    Answer access questions from a local set of authorizations.
+
+    Authorizations are parsed once and indexed per smartlock both by the start
+    and by the end of their date range. `who_can_open` counts with two binary
+    searches how many have started by the given time and how many have not
+    ended yet, and only inspects the smaller of the two groups; `expired`
+    finds ended authorizations with a binary search over their end dates.
+
+    Example:
+        >>> evaluator = AccessEvaluator.from_client(client)
+        >>> evaluator.who_can_open(smartlock_id, datetime.now())
+        >>> client.smartlock_auth.delete_auths(evaluator.expired_ids())
+
+    Args:
+        auths (iterable[dict], optional): Authorizations as returned by the API.
+    """
+
+    def __init__(self, auths: Optional[Iterable[Dict[str, Any]]] = None):
+        self._pending: List[_Window] = []
+        self._by_lock: Dict[Any, Tuple[List[float], List[_Window], List[float], List[_Window]]] = {}
+        self._ends: List[float] = []
+        self._by_end: List[_Window] = []
+        self._count = 0
+        if auths is not None:
+            self.load(auths)
+
+    @classmethod
+    def from_client(cls, client, page_size: int = 100, types: Optional[str] = None) -> "AccessEvaluator":
+        """Build an evaluator from all authorizations of the account (via `SmartlockAuth.iter_auths`)."""
+        return cls(client.smartlock_auth.iter_auths(page_size=page_size, types=types))
+
+    def load(self, auths: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add authorizations; the index is rebuilt on the next query.
+
+        Returns:
+            int: Number of authorizations added.
+        """
+        before = len(self._pending)
+        self._pending.extend(_Window(auth) for auth in auths)
+        return len(self._pending) - before
+
+    def __len__(self) -> int:
+        self._build()
+        return self._count
+
+    def _build(self) -> None:
+        if not self._pending:
+            return
+        windows = [w for lock_windows in (v[1] for v in self._by_lock.values()) for w in lock_windows]
+        windows.extend(self._pending)
+        self._pending = []
+        grouped: Dict[Any, List[_Window]] = {}
+        for window in windows:
+            grouped.setdefault(window.auth.get("smartlockId"), []).append(window)
+        self._by_lock = {}
+        for smartlock_id, lock_windows in grouped.items():
+            by_start = sorted(lock_windows, key=lambda w: w.start)
+            by_end = sorted(lock_windows, key=lambda w: w.end)
+            self._by_lock[smartlock_id] = ([w.start for w in by_start], by_start, [w.end for w in by_end], by_end)
+        self._by_end = sorted(windows, key=lambda w: w.end)
+        self._ends = [w.end for w in self._by_end]
+        self._count = len(windows)
+
+    def who_can_open(self, smartlock_id: int, at: datetime, include_disabled: bool = False) -> List[Dict[str, Any]]:
+        """
+        Return the authorizations that grant access to a smartlock at `at`.
+
+        Args:
+            smartlock_id (int): The smartlock.
+            at (datetime): Point in time, in the lock's local time (see `is_allowed`).
+            include_disabled (bool): Also return disabled authorizations whose
+                schedule matches.
+
+        Returns:
+            list[dict]: Matching authorizations, in no particular order.
+        """
+        self._build()
+        entry = self._by_lock.get(smartlock_id)
+        if entry is None:
+            return []
+        starts, by_start, ends, by_end = entry
+        ts = _timestamp(at)
+        started = bisect_right(starts, ts)
+        not_ended = bisect_left(ends, ts)
+        # Scan whichever is smaller: the windows started by `ts` or those not ended before it.
+        if started <= len(ends) - not_ended:
+            candidates = [w for w in by_start[:started] if ts <= w.end]
+        else:
+            candidates = [w for w in by_end[not_ended:] if w.start <= ts]
+        weekday_bit = WEEKDAY_BITS[at.weekday()]
+        minute = at.hour * 60 + at.minute
+        return [
+            w.auth
+            for w in candidates
+            if (include_disabled or w.auth.get("enabled") is not False) and w.allows_time(weekday_bit, minute)
+        ]
+
+    def expired(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Return authorizations whose ``allowedUntilDate`` lies before `now`.
+
+        These can never grant access again and are safe to delete in bulk.
+
+        Args:
+            now (datetime, optional): Reference time (default: current UTC time).
+        """
+        self._build()
+        ts = _timestamp(now or datetime.now(timezone.utc))
+        return [w.auth for w in self._by_end[:bisect_left(self._ends, ts)]]
+
+    def expired_ids(self, now: Optional[datetime] = None) -> List[str]:
+        """Return the IDs of `expired` authorizations, ready for `SmartlockAuth.delete_auths`."""
+        return [auth["id"] for auth in self.expired(now) if auth.get("id") is not None]
@@ -327,3 +327,19 @@ class Account:
             Dict[str, Any]: API response confirming deletion.
         """
         return self.client._request("DELETE", f"/account/sub/{account_id}")
+
+    def aggregate_sub_accounts(self, client_for, max_workers: int = 8):
+        """
+        Create an aggregator that gathers resources across all sub-accounts.
+
+        Args:
+            client_for: Resolves a sub-account dict to its `NukiWebAPI` client
+                (callable, mapping or `NukiWebAPIPool` keyed by ``accountId``).
+            max_workers (int): Maximum number of concurrent fetches.
+
+        Returns:
+            SubAccountAggregator: Use `iter()` for a merged, account-tagged stream.
+        """
+        from nukiwebapi.sub_account_aggregator import SubAccountAggregator
+
+        return SubAccountAggregator(self.client, client_for, max_workers=max_workers)
@@ -1,4 +1,50 @@
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class UnitBatchReport:
+    """
+    Outcome of `Address.create_address_units`.
+
+    Attributes:
+        address_id (int): The address.
+        names (list[str]): Requested unit names, in input order.
+        ids (list[str | None]): Created unit IDs in input order; None where
+            creation failed.
+        failed (dict): Input index to the error of its failed creation.
+        rolled_back (bool): True if created units were deleted again because
+            of failures (see ``rollback``).
+        elapsed (float): Seconds spent.
+    """
+
+    def __init__(self, address_id: int, names: List[str]):
+        self.address_id = address_id
+        self.names = names
+        self.ids: List[Optional[str]] = [None] * len(names)
+        self.failed: Dict[int, BaseException] = {}
+        self.rolled_back = False
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if every unit was created."""
+        return not self.failed
+
+    @property
+    def created(self) -> List[str]:
+        """IDs of the units that were created."""
+        return [unit_id for unit_id in self.ids if unit_id is not None]
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the report as a plain dict."""
+        return {
+            "address_id": self.address_id,
+            "requested": len(self.names),
+            "created": len(self.created),
+            "failed": len(self.failed),
+            "rolled_back": self.rolled_back,
+            "elapsed": self.elapsed,
+        }
 
 
 class Address:
@@ -132,6 +178,71 @@ class Address:
         payload = {"name": name}
         return self.client._request("PUT", f"/address/{address_id}/unit", json=payload).json()
 
+    def create_address_units(
+        self,
+        address_id: int,
+        names: Iterable[str],
+        max_workers: int = 8,
+        rate_limiter=None,
+        retries: int = 0,
+        backoff: float = 0.5,
+        rollback: bool = False,
+    ) -> UnitBatchReport:
+        """
+        Create many units of an address concurrently.
+
+        Calls `create_address_unit` per name via `run_batch`, optionally rate
+        limited. A failed unit does not stop the others; with ``rollback=True``
+        the created units are removed with a single `delete_address_units`
+        call if any unit failed.
+
+        Creating a unit is not idempotent: after a timeout or a 5xx response
+        the server may already have created it, and a retry would create a
+        duplicate whose ID never reaches the report. Retries are therefore off
+        by default.
+
+        Args:
+            address_id (int): Address ID.
+            names (iterable[str]): Names of the new units.
+            max_workers (int): Concurrent requests.
+            rate_limiter (RateLimiter, optional): Limits the request rate.
+            retries (int): Retries per unit for transient errors. Only enable
+                them if duplicate units are acceptable.
+            backoff (float): Base delay in seconds between retries.
+            rollback (bool): Delete the created units again on partial failure.
+
+        Returns:
+            UnitBatchReport: Created IDs in input order and the failures.
+        """
+        from nukiwebapi.batch import run_batch
+
+        if not isinstance(address_id, int):
+            raise ValueError("address_id must be an integer")
+        names = list(names)
+        if not all(isinstance(name, str) and name for name in names):
+            raise ValueError("names must be non-empty strings")
+
+        report = UnitBatchReport(address_id, names)
+        start = time.perf_counter()
+        results = run_batch(
+            lambda name: self.create_address_unit(address_id, name),
+            names,
+            max_workers=max_workers,
+            rate_limiter=rate_limiter,
+            retries=retries,
+            backoff=backoff,
+        )
+        for result in results:
+            if result.ok:
+                report.ids[result.index] = (result.result or {}).get("id")
+            else:
+                report.failed[result.index] = result.error
+        if rollback and report.failed and report.created:
+            self.delete_address_units(address_id, report.created)
+            report.rolled_back = True
+        report.elapsed = time.perf_counter() - start
+        return report
+
     def delete_address_units(self, address_id: int, unit_ids: List[str]) -> Dict[str, Any]:
         """
         Delete multiple units of a given address asynchronously.
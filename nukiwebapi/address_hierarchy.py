@@ -0,0 +1,255 @@
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from nukiwebapi.batch import iter_batch
+
+_ADDRESS_PATH = re.compile(r"^/address(?:/(\d+)(/unit)?(?:/[^/]+)?)?/?$")
+
+
+class AddressHierarchy:
+    """
+    Cached model of addresses, their units, smartlocks and tokens.
+
+    Answers "which locks belong to this unit" and "which address/unit does
+    this lock belong to" from memory:
+
+    - ``address -> units -> smartlocks -> tokens``: a unit's smartlocks are
+      its own ``smartlockIds`` if the API provides them, otherwise those of
+      its address. Tokens are listed per address.
+    - Reverse indexes from smartlock ID to addresses and to units.
+
+    Data is loaded lazily per address and only re-fetched when it is stale:
+    after `ttl` seconds, after `invalidate`, or after a successful
+    `create_address`, `update_address`, `delete_address`,
+    `create_address_unit` or `delete_address_unit(s)` made through the
+    client. Those calls are observed with an ``after_response`` hook on the
+    client's `Instrumentation`, so watching needs a client created with
+    ``instrumentation=Instrumentation()``.
+
+    Example:
+        >>> hierarchy = AddressHierarchy(client).refresh()
+        >>> hierarchy.smartlocks(address_id, unit_id)
+        >>> hierarchy.units_for_smartlock(smartlock_id)
+
+    Args:
+        client (NukiWebAPI): Client of the account.
+        ttl (float, optional): Seconds after which cached data is re-fetched
+            on the next lookup. None keeps it until invalidated.
+        watch (bool, optional): Invalidate on address mutations made through
+            `client`. Defaults to watching if the client has instrumentation.
+        max_workers (int): Concurrent requests when loading many addresses.
+    """
+
+    def __init__(self, client, ttl: Optional[float] = None, watch: Optional[bool] = None, max_workers: int = 8):
+        self.client = client
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self._addresses: Dict[int, Dict[str, Any]] = {}
+        self._addresses_at: Optional[float] = None
+        self._units: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._tokens: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._addresses_by_lock: Dict[int, Set[int]] = {}
+        self._units_by_lock: Dict[int, Set[Tuple[int, str]]] = {}
+        self._indexed: Dict[int, List[Tuple[int, Any]]] = {}
+        self._lock = threading.RLock()
+        self._hook = None
+        if watch or (watch is None and client.instrumentation is not None):
+            self.watch()
+
+    # ---- Invalidation ----
+    def watch(self) -> None:
+        """
+        Invalidate on address mutations made through the client (see the class docs).
+
+        Raises:
+            ValueError: If the client has no `Instrumentation` to hook into.
+        """
+        if self._hook is not None:
+            return
+        if self.client.instrumentation is None:
+            raise ValueError("Watching needs a client created with instrumentation=Instrumentation()")
+        self._hook = self.client.instrumentation.add_hook("after_response", self._on_response)
+
+    def unwatch(self) -> None:
+        """Stop observing the client."""
+        if self._hook is not None:
+            self.client.instrumentation.remove_hook("after_response", self._hook)
+            self._hook = None
+
+    def _on_response(self, info) -> None:
+        if info.method == "GET" or not 200 <= (info.status_code or 0) < 300:
+            return
+        match = _ADDRESS_PATH.match(info.endpoint)
+        if match is None:
+            return
+        address_id, unit = match.group(1), match.group(2)
+        if address_id is None:
+            self.invalidate()
+        elif unit:
+            self.invalidate(int(address_id), units_only=True)
+        else:
+            self.invalidate(int(address_id))
+
+    def invalidate(self, address_id: Optional[int] = None, units_only: bool = False) -> None:
+        """
+        Mark cached data as stale.
+
+        Args:
+            address_id (int, optional): Only this address (and its units and
+                tokens). Without it, the address list is re-fetched on the next
+                lookup; units and tokens of unchanged addresses are kept.
+            units_only (bool): Only the units of `address_id`.
+        """
+        with self._lock:
+            if address_id is None or not units_only:
+                self._addresses_at = None
+            if address_id is not None:
+                self._units.pop(address_id, None)
+                if not units_only:
+                    self._tokens.pop(address_id, None)
+                self._reindex(address_id)
+
+    def _fresh(self, fetched_at: Optional[float]) -> bool:
+        return fetched_at is not None and (self.ttl is None or time.monotonic() - fetched_at < self.ttl)
+
+    # ---- Loading ----
+    def _load_addresses(self) -> None:
+        with self._lock:
+            if self._fresh(self._addresses_at):
+                return
+        addresses = {a["addressId"]: a for a in self.client.address.list_addresses()}
+        with self._lock:
+            for address_id, address in self._addresses.items():
+                new = addresses.get(address_id)
+                if new is None or new.get("smartlockIds") != address.get("smartlockIds"):
+                    self._units.pop(address_id, None)
+                    self._tokens.pop(address_id, None)
+            old = set(self._addresses)
+            self._addresses = addresses
+            self._addresses_at = time.monotonic()
+            for address_id in old | set(addresses):
+                self._reindex(address_id)
+
+    def _load_units(self, address_ids: List[int], tokens: bool = False) -> None:
+        cache = self._tokens if tokens else self._units
+        with self._lock:
+            missing = [a for a in address_ids if not self._fresh(cache.get(a, (None,))[0])]
+        if not missing:
+            return
+        fetch = self.client.address_token.list_tokens if tokens else self.client.address.list_address_units
+        errors = []
+        for result in iter_batch(fetch, missing, max_workers=self.max_workers):
+            if not result.ok:
+                errors.append(result.error)
+                continue
+            with self._lock:
+                cache[result.item] = (time.monotonic(), result.result or [])
+                if not tokens:
+                    self._reindex(result.item)
+        if errors:
+            raise errors[0]
+
+    def _reindex(self, address_id: int) -> None:
+        for smartlock_id, entry in self._indexed.pop(address_id, ()):
+            index = self._units_by_lock if isinstance(entry, tuple) else self._addresses_by_lock
+            entries = index.get(smartlock_id)
+            if entries is not None:
+                entries.discard(entry)
+                if not entries:
+                    del index[smartlock_id]
+        address = self._addresses.get(address_id)
+        if address is None:
+            return
+        indexed = []
+        for smartlock_id in address.get("smartlockIds") or []:
+            self._addresses_by_lock.setdefault(smartlock_id, set()).add(address_id)
+            indexed.append((smartlock_id, address_id))
+        for unit in self._units.get(address_id, (None, []))[1]:
+            for smartlock_id in self._unit_smartlocks(address, unit):
+                self._units_by_lock.setdefault(smartlock_id, set()).add((address_id, unit["id"]))
+                indexed.append((smartlock_id, (address_id, unit["id"])))
+        self._indexed[address_id] = indexed
+
+    @staticmethod
+    def _unit_smartlocks(address: Dict[str, Any], unit: Dict[str, Any]) -> List[int]:
+        return list(unit.get("smartlockIds") or address.get("smartlockIds") or [])
+
+    def refresh(self) -> "AddressHierarchy":
+        """
+        Load all addresses with their units and tokens (concurrently).
+
+        Returns:
+            AddressHierarchy: The hierarchy itself.
+        """
+        with self._lock:
+            self._addresses_at = None
+            self._units.clear()
+            self._tokens.clear()
+        self._load_addresses()
+        ids = list(self._addresses)
+        self._load_units(ids)
+        self._load_units(ids, tokens=True)
+        return self
+
+    # ---- Lookups ----
+    def addresses(self) -> List[Dict[str, Any]]:
+        """Return all addresses."""
+        self._load_addresses()
+        return list(self._addresses.values())
+
+    def address(self, address_id: int) -> Optional[Dict[str, Any]]:
+        """Return one address, or None if it does not exist."""
+        self._load_addresses()
+        return self._addresses.get(address_id)
+
+    def units(self, address_id: int) -> List[Dict[str, Any]]:
+        """Return the units of an address."""
+        if self.address(address_id) is None:
+            return []
+        self._load_units([address_id])
+        return list(self._units.get(address_id, (None, []))[1])
+
+    def unit(self, address_id: int, unit_id: str) -> Optional[Dict[str, Any]]:
+        """Return one unit of an address, or None."""
+        return next((u for u in self.units(address_id) if u.get("id") == unit_id), None)
+
+    def smartlocks(self, address_id: int, unit_id: Optional[str] = None) -> List[int]:
+        """Return the smartlock IDs of an address, or of one of its units."""
+        address = self.address(address_id)
+        if address is None:
+            return []
+        if unit_id is None:
+            return list(address.get("smartlockIds") or [])
+        unit = self.unit(address_id, unit_id)
+        return self._unit_smartlocks(address, unit) if unit is not None else []
+
+    def tokens(self, address_id: int) -> List[Dict[str, Any]]:
+        """Return the tokens of an address."""
+        if self.address(address_id) is None:
+            return []
+        self._load_units([address_id], tokens=True)
+        return list(self._tokens.get(address_id, (None, []))[1])
+
+    def addresses_for_smartlock(self, smartlock_id: int) -> List[Dict[str, Any]]:
+        """Return the addresses a smartlock belongs to."""
+        self._load_addresses()
+        with self._lock:
+            return [self._addresses[a] for a in sorted(self._addresses_by_lock.get(smartlock_id, ()))]
+
+    def units_for_smartlock(self, smartlock_id: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Return the units a smartlock belongs to as ``(address_id, unit)`` pairs.
+
+        Loads the units of the smartlock's addresses if they are not cached.
+        """
+        address_ids = [a["addressId"] for a in self.addresses_for_smartlock(smartlock_id)]
+        self._load_units(address_ids)
+        with self._lock:
+            units = {a: {u["id"]: u for u in self._units.get(a, (None, []))[1]} for a in address_ids}
+            return [
+                (address_id, units[address_id][unit_id])
+                for address_id, unit_id in sorted(self._units_by_lock.get(smartlock_id, ()))
+                if unit_id in units.get(address_id, {})
+            ]
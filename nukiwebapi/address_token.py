@@ -1,4 +1,10 @@
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+from nukiwebapi.cache import SingleFlight
+
+#: Seconds token info stays in the client cache by default.
+TOKEN_INFO_TTL = 10.0
 
 
 class AddressToken:
@@ -6,6 +12,9 @@ class AddressToken:
 
     def __init__(self, client):
         self.client = client
+        self._flights = SingleFlight()
+        self._versions: Dict[str, int] = {}
+        self._versions_lock = threading.Lock()
 
     # ---- Token Info ----
     def get_token_info(self, token_id: str) -> Dict[str, Any]:
@@ -89,3 +98,116 @@ class AddressToken:
         return self.client._request(
             "GET", f"/address/{address_id}/token"
         ).json()
+
+    # ---- Batch operations ----
+    def resolve_token(self, token_id: str, ttl: float = TOKEN_INFO_TTL) -> Dict[str, Any]:
+        """
+        Get token info through the client cache.
+
+        Results are cached in ``client.cache`` for `ttl` seconds, and
+        concurrent lookups of the same token share one request.
+
+        Args:
+            token_id (str): Token ID.
+            ttl (float): Seconds to cache the token info.
+
+        Returns:
+            Token representation as dict.
+        """
+        return self.client.cache.get_or_set(self._info_key(token_id), lambda: self.get_token_info(token_id), ttl)
+
+    def _info_key(self, token_id: str) -> Hashable:
+        # Redeeming bumps the version, so a lookup that started before the
+        # redeem finished stores its (stale) result under a key nobody reads.
+        with self._versions_lock:
+            return "address_token", token_id, self._versions.get(token_id, 0)
+
+    def _bump_version(self, token_id: str) -> None:
+        stale = self._info_key(token_id)
+        with self._versions_lock:
+            self._versions[token_id] = self._versions.get(token_id, 0) + 1
+        self.client.cache.invalidate(stale)
+
+    def _run_unique(self, func, token_ids: Iterable[str], max_workers: int, rate_limiter, retries: int,
+                    backoff: float) -> Dict[str, Any]:
+        from nukiwebapi.batch import run_batch
+
+        unique = list(dict.fromkeys(token_ids))
+        results = run_batch(func, unique, max_workers=max_workers, rate_limiter=rate_limiter,
+                            retries=retries, backoff=backoff)
+        return {result.item: result for result in results}
+
+    def resolve_tokens(
+        self,
+        token_ids: Iterable[str],
+        ttl: float = TOKEN_INFO_TTL,
+        max_workers: int = 8,
+        rate_limiter=None,
+        retries: int = 1,
+        backoff: float = 0.5,
+    ) -> Dict[str, Any]:
+        """
+        Get info for many tokens concurrently.
+
+        Duplicate IDs are looked up once, and cached tokens (see
+        `resolve_token`) need no request at all.
+
+        Args:
+            token_ids (iterable[str]): Token IDs.
+            ttl (float): Seconds to cache each token's info.
+            max_workers (int): Concurrent requests.
+            rate_limiter (RateLimiter, optional): Limits the request rate.
+            retries (int): Retries per token for transient errors.
+            backoff (float): Base delay in seconds between retries.
+
+        Returns:
+            dict: Token ID to its `BatchItemResult`; ``result`` holds the
+            token info, ``error`` the failure.
+        """
+        return self._run_unique(lambda token_id: self.resolve_token(token_id, ttl),
+                                token_ids, max_workers, rate_limiter, retries, backoff)
+
+    def redeem_tokens(
+        self,
+        token_ids: Iterable[str],
+        email: bool = True,
+        max_workers: int = 8,
+        rate_limiter=None,
+        retries: int = 0,
+        backoff: float = 0.5,
+    ) -> Dict[str, Any]:
+        """
+        Redeem many tokens concurrently.
+
+        Duplicate IDs are redeemed once, and a redeem of the same token that
+        is still in flight (e.g. from another thread) is joined instead of
+        repeated. Tokens redeemed by earlier calls are not tracked. The
+        token's cached info is dropped once the redeem request has finished,
+        before joined callers return.
+
+        Redeeming is not idempotent: after a timeout or a 5xx response the
+        token may already be redeemed, and a retry would redeem it again and
+        send the guest a second email. Retries are therefore off by default.
+
+        Args:
+            token_ids (iterable[str]): Token IDs.
+            email (bool): Whether to send an email per token.
+            max_workers (int): Concurrent requests.
+            rate_limiter (RateLimiter, optional): Limits the request rate.
+            retries (int): Retries per token for transient errors. Only enable
+                them if repeated redeems are acceptable.
+            backoff (float): Base delay in seconds between retries.
+
+        Returns:
+            dict: Token ID to its `BatchItemResult`.
+        """
+        def redeem_once(token_id):
+            try:
+                return self.redeem_token(token_id, email)
+            finally:
+                self._bump_version(token_id)
+
+        def redeem(token_id):
+            return self._flights.do(("redeem", token_id), lambda: redeem_once(token_id))
+
+        return self._run_unique(redeem, token_ids, max_workers, rate_limiter, retries, backoff)
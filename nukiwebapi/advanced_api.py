@@ -1,4 +1,10 @@
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from nukiwebapi.deadline import request_deadline
+from nukiwebapi.scheduler import interactive
+from nukiwebapi.tracing import traced
+from nukiwebapi.webhook_log_stats import WebhookLogStats
 
 
 class AdvancedApi:
@@ -97,6 +103,67 @@ class AdvancedApi:
             params=params
         ).json()
 
+    def iter_webhook_logs(
+        self,
+        api_key_id: int,
+        id: Optional[str] = None,
+        page_size: int = 100,
+        max_logs: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over the whole webhook log history (newest first).
+
+        Pages are fetched on demand via `get_webhook_logs`, using the ID of the
+        last log on each page as the cursor for the next one.
+
+        Args:
+            api_key_id (int): API key ID.
+            id (str, optional): Start with logs older than this ID.
+            page_size (int): Logs per request (1-100, default 100).
+            max_logs (int, optional): Stop after yielding this many logs.
+            deadline (float, optional): Seconds from the first call the page
+                fetches may take in total; a later page raises `DeadlineExceeded`.
+
+        Yields:
+            dict: Webhook log entries.
+        """
+        cursor = id
+        yielded = 0
+        expires = None if deadline is None else time.monotonic() + deadline
+        while max_logs is None or yielded < max_logs:
+            # Scoped per page so the deadline does not leak into the consumer between yields.
+            with request_deadline(None if expires is None else expires - time.monotonic()):
+                page = self.get_webhook_logs(api_key_id, id=cursor, limit=page_size)
+            for log in page[:None if max_logs is None else max_logs - yielded]:
+                yield log
+                yielded += 1
+            if len(page) < page_size or not page[-1].get("id"):
+                return
+            cursor = page[-1]["id"]
+
+    @traced("webhook_logs.sync", lambda self, api_key_id, *args, **kwargs: {"nuki.api_key_id": api_key_id})
+    def webhook_log_stats(
+        self, api_key_id: int, max_logs: Optional[int] = None, page_size: int = 100, deadline: Optional[float] = None
+    ) -> WebhookLogStats:
+        """
+        Compute delivery statistics over the webhook log history.
+
+        Logs are streamed through `iter_webhook_logs` and aggregated on the fly.
+
+        Args:
+            api_key_id (int): API key ID.
+            max_logs (int, optional): Only consider the newest `max_logs` logs.
+            page_size (int): Logs per request (1-100, default 100).
+            deadline (float, optional): Seconds the whole sync may take.
+
+        Returns:
+            WebhookLogStats: Latency percentiles and failure rates per feature/endpoint.
+        """
+        return WebhookLogStats().consume(
+            self.iter_webhook_logs(api_key_id, page_size=page_size, max_logs=max_logs, deadline=deadline)
+        )
+
     # ---- Smartlock Advanced Authorizations ----
     def create_smartlock_auth_advanced(self, auth_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -112,6 +179,7 @@ class AdvancedApi:
         """
         return self.client._request("PUT", "/smartlock/auth/advanced", json=auth_data).json()
 
+    @interactive
     def action_smartlock_advanced(self, smartlock_id: str, action_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a smartlock action with callback.
@@ -129,6 +197,7 @@ class AdvancedApi:
             "POST", f"/smartlock/{smartlock_id}/action/advanced", json=action_data
         ).json()
 
+    @interactive
     def lock_smartlock_advanced(self, smartlock_id: str, lock_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Lock a smartlock (advanced).
@@ -146,6 +215,7 @@ class AdvancedApi:
             "POST", f"/smartlock/{smartlock_id}/action/lock/advanced", json=lock_data or {}
         ).json()
 
+    @interactive
     def unlock_smartlock_advanced(self, smartlock_id: str, unlock_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Unlock a smartlock (advanced).
@@ -0,0 +1,218 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from nukiwebapi.access import parse_date
+from nukiwebapi.batch import BatchItemResult, run_batch
+from nukiwebapi.deadline import request_deadline
+from nukiwebapi.rate_limit import RateLimiter
+
+#: Built-in collection policies.
+POLICIES = ("expired", "disabled", "never_used")
+
+
+class AuthGCReport:
+    """
+    Outcome of an `AuthGC` scan and, after `AuthGC.run`, of the deletion.
+
+    Attributes:
+        scanned (int): Authorizations inspected.
+        candidates (list[tuple[dict, str]]): Authorizations selected for
+            deletion with the policy that matched.
+        deleted (list[str]): IDs deleted by `AuthGC.run`.
+        failed (dict): Authorization ID to the error of its failed batch.
+        dry_run (bool): True until the candidates were actually deleted.
+        elapsed (float): Seconds spent scanning and deleting.
+    """
+
+    def __init__(self):
+        self.scanned = 0
+        self.candidates: List[Tuple[Dict[str, Any], str]] = []
+        self.deleted: List[str] = []
+        self.failed: Dict[str, BaseException] = {}
+        self.dry_run = True
+        self.elapsed = 0.0
+
+    @property
+    def ids(self) -> List[str]:
+        """IDs of all candidates."""
+        return [auth["id"] for auth, _ in self.candidates]
+
+    def by_reason(self) -> Dict[str, int]:
+        """Number of candidates per policy."""
+        counts: Dict[str, int] = {}
+        for _, reason in self.candidates:
+            counts[reason] = counts.get(reason, 0) + 1
+        return counts
+
+    def by_smartlock(self) -> Dict[int, int]:
+        """Number of candidates per smartlock."""
+        counts: Dict[int, int] = {}
+        for auth, _ in self.candidates:
+            counts[auth.get("smartlockId")] = counts.get(auth.get("smartlockId"), 0) + 1
+        return counts
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the report as a plain dict."""
+        return {
+            "dry_run": self.dry_run,
+            "scanned": self.scanned,
+            "candidates": len(self.candidates),
+            "by_reason": self.by_reason(),
+            "deleted": len(self.deleted),
+            "failed": len(self.failed),
+            "elapsed": self.elapsed,
+        }
+
+
+class AuthGC:
+    """
+    Garbage collector for stale smartlock authorizations.
+
+    Authorizations are streamed with `SmartlockAuth.iter_auths` and matched
+    against the enabled policies:
+
+    - ``expired``: ``allowedUntilDate`` lies more than `grace` in the past.
+    - ``disabled``: ``enabled`` is false and the authorization is older than `grace`.
+    - ``never_used``: no ``lastActiveDate`` and created more than
+      `unused_after` ago.
+
+    `scan` produces a dry-run `AuthGCReport`; `run` deletes its candidates with
+    `SmartlockAuth.delete_auths` in batches, concurrently and rate limited.
+
+    Example:
+        >>> gc = AuthGC(client, policies=("expired", "disabled"))
+        >>> report = gc.scan()
+        >>> print(report.summary())
+        >>> gc.run(report)
+
+    Args:
+        client (NukiWebAPI): Client of the account.
+        policies (iterable[str]): Policies to apply (see `POLICIES`).
+        grace (timedelta): Minimum time since expiry before deletion.
+        unused_after (timedelta): Age after which unused authorizations are stale.
+        types (str, optional): Only scan these authorization types, e.g. ``"0,13"``.
+        protect (callable, optional): ``protect(auth)`` returning True keeps
+            an authorization regardless of the policies.
+    """
+
+    def __init__(
+        self,
+        client,
+        policies: Iterable[str] = ("expired",),
+        grace: timedelta = timedelta(0),
+        unused_after: timedelta = timedelta(days=90),
+        types: Optional[str] = None,
+        protect: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ):
+        self.client = client
+        self.policies = tuple(policies)
+        unknown = set(self.policies) - set(POLICIES)
+        if unknown:
+            raise ValueError(f"Unknown policies {sorted(unknown)}; choose from {POLICIES}")
+        self.grace = grace
+        self.unused_after = unused_after
+        self.types = types
+        self.protect = protect
+
+    def classify(self, auth: Dict[str, Any], now: datetime) -> Optional[str]:
+        """Return the first policy that selects `auth` for deletion, or None."""
+        if self.protect is not None and self.protect(auth):
+            return None
+        cutoff = (now - self.grace).timestamp()
+        for policy in self.policies:
+            if policy == "expired":
+                until = parse_date(auth.get("allowedUntilDate"))
+                if until is not None and until < cutoff:
+                    return policy
+            elif policy == "disabled":
+                created = parse_date(auth.get("creationDate"))
+                if auth.get("enabled") is False and (created is None or created < cutoff):
+                    return policy
+            elif policy == "never_used":
+                created = parse_date(auth.get("creationDate"))
+                if not auth.get("lastActiveDate") and created is not None \
+                        and created < (now - self.unused_after).timestamp():
+                    return policy
+        return None
+
+    def scan(self, now: Optional[datetime] = None, page_size: int = 100,
+             deadline: Optional[float] = None) -> AuthGCReport:
+        """
+        Stream all authorizations and collect deletion candidates (dry run).
+
+        Args:
+            now (datetime, optional): Reference time (default: current UTC time).
+            page_size (int): Authorizations per page request.
+            deadline (float, optional): Seconds the whole scan may take. A page
+                not fetched in time raises `DeadlineExceeded`.
+
+        Returns:
+            AuthGCReport: The candidates; nothing is deleted.
+        """
+        now = now or datetime.now(timezone.utc)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        report = AuthGCReport()
+        start = time.perf_counter()
+        with request_deadline(deadline):
+            for auth in self.client.smartlock_auth.iter_auths(page_size=page_size, types=self.types):
+                report.scanned += 1
+                reason = self.classify(auth, now)
+                if reason is not None and auth.get("id") is not None:
+                    report.candidates.append((auth, reason))
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def run(
+        self,
+        report: Optional[AuthGCReport] = None,
+        batch_size: int = 100,
+        max_workers: int = 4,
+        rate: Optional[float] = 5.0,
+        retries: int = 2,
+        backoff: float = 0.5,
+        deadline: Optional[float] = None,
+    ) -> AuthGCReport:
+        """
+        Delete the candidates of a report (scanning first if none is given).
+
+        IDs are sent in chunks of `batch_size` per ``DELETE /smartlock/auth``
+        call; chunks run concurrently, rate limited and retried on transient
+        errors. A failed chunk marks its IDs in `AuthGCReport.failed`.
+
+        Args:
+            report (AuthGCReport, optional): Result of `scan`.
+            batch_size (int): Authorization IDs per delete request.
+            max_workers (int): Concurrent delete requests.
+            rate (float, optional): Maximum delete requests per second.
+            retries (int): Retries per chunk for transient errors.
+            backoff (float): Base delay in seconds between retries.
+            deadline (float, optional): Seconds the whole run, including the
+                scan, may take. Chunks not deleted in time fail with
+                `DeadlineExceeded`.
+
+        Returns:
+            AuthGCReport: The report, updated with deleted and failed IDs.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        with request_deadline(deadline):
+            if report is None:
+                report = self.scan()
+            start = time.perf_counter()
+            ids = report.ids
+            chunks = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+            rate_limiter = RateLimiter(rate) if rate else None
+            results: List[BatchItemResult] = run_batch(
+                self.client.smartlock_auth.delete_auths, chunks,
+                max_workers=max_workers, rate_limiter=rate_limiter, retries=retries, backoff=backoff,
+            )
+        for result in results:
+            if result.ok:
+                report.deleted.extend(result.item)
+            else:
+                report.failed.update(dict.fromkeys(result.item, result.error))
+        report.dry_run = False
+        report.elapsed += time.perf_counter() - start
+        return report
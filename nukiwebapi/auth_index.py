@@ -0,0 +1,231 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+def _key(text: Optional[str]) -> Optional[str]:
+    return text.strip().casefold() if text else None
+
+
+class AccountUserAuthIndex:
+    """
+    Local index from account users to their authorizations on all smartlocks.
+
+    Maps ``accountUserId``, account user email and authorization name to
+    authorization IDs, so offboarding a person is a dictionary lookup plus a
+    single ``DELETE /smartlock/auth`` with all IDs, instead of one listing and
+    one delete per lock.
+
+    The index is built once with `refresh` and kept current incrementally with
+    `add`, `remove`, `sync_smartlock` or `handle_webhook`.
+
+    Example:
+        >>> index = AccountUserAuthIndex(client).refresh()
+        >>> index.revoke(email="leaver@example.com")
+
+    Args:
+        client (NukiWebAPI, optional): Client used by `refresh`, `sync_smartlock`
+            and `revoke`.
+    """
+
+    def __init__(self, client=None):
+        self.client = client
+        self._auths: Dict[str, Dict[str, Any]] = {}
+        self._by_user: Dict[int, Set[str]] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        self._by_lock: Dict[Any, Set[str]] = {}
+        self._user_by_email: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    # ---- Building ----
+    def refresh(self, page_size: int = 100) -> "AccountUserAuthIndex":
+        """
+        Rebuild the index from all account users and authorizations of the account.
+
+        Uses `AccountUser.list_account_users` and `SmartlockAuth.iter_auths`.
+
+        Returns:
+            AccountUserAuthIndex: The index itself.
+        """
+        users = self.client.account_user.list_account_users()
+        auths = list(self.client.smartlock_auth.iter_auths(page_size=page_size))
+        with self._lock:
+            self._auths.clear()
+            self._by_user.clear()
+            self._by_name.clear()
+            self._by_lock.clear()
+            self._user_by_email.clear()
+            self.load_users(users)
+            self.load(auths)
+        return self
+
+    def load_users(self, users: Iterable[Dict[str, Any]]) -> None:
+        """Add account users, so their email resolves to their ``accountUserId``."""
+        with self._lock:
+            for user in users:
+                if user.get("accountUserId") is not None and user.get("email"):
+                    self._user_by_email[_key(user["email"])] = user["accountUserId"]
+
+    def load(self, auths: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add or replace authorizations.
+
+        Returns:
+            int: Number of authorizations indexed.
+        """
+        count = 0
+        with self._lock:
+            for auth in auths:
+                if auth.get("id") is not None:
+                    self.add(auth)
+                    count += 1
+        return count
+
+    def add(self, auth: Dict[str, Any]) -> None:
+        """Index an authorization, replacing an older version with the same ID."""
+        with self._lock:
+            self.remove(auth["id"])
+            auth_id = auth["id"]
+            self._auths[auth_id] = auth
+            if auth.get("accountUserId") is not None:
+                self._by_user.setdefault(auth["accountUserId"], set()).add(auth_id)
+            if auth.get("name"):
+                self._by_name.setdefault(auth["name"], set()).add(auth_id)
+            self._by_lock.setdefault(auth.get("smartlockId"), set()).add(auth_id)
+
+    def remove(self, auth_id: str) -> Optional[Dict[str, Any]]:
+        """Drop an authorization from the index and return it, if it was indexed."""
+        with self._lock:
+            auth = self._auths.pop(auth_id, None)
+            if auth is None:
+                return None
+            for index, key in (
+                (self._by_user, auth.get("accountUserId")),
+                (self._by_name, auth.get("name")),
+                (self._by_lock, auth.get("smartlockId")),
+            ):
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(auth_id)
+                    if not ids:
+                        del index[key]
+            return auth
+
+    def replace_smartlock(self, smartlock_id: int, auths: Iterable[Dict[str, Any]]) -> None:
+        """Replace all indexed authorizations of one smartlock with `auths`."""
+        with self._lock:
+            for auth_id in list(self._by_lock.get(smartlock_id, ())):
+                self.remove(auth_id)
+            for auth in auths:
+                self.add({"smartlockId": smartlock_id, **auth})
+
+    def sync_smartlock(self, smartlock_id: int) -> None:
+        """Re-read one smartlock's authorizations via `SmartlockAuth.list_auths_for_smartlock`."""
+        self.replace_smartlock(smartlock_id, self.client.smartlock_auth.list_auths_for_smartlock(smartlock_id))
+
+    def handle_webhook(self, event: Dict[str, Any]) -> bool:
+        """
+        Update the index from a ``DEVICE_AUTHS`` webhook event.
+
+        The event's ``smartlockAuths`` list replaces the indexed authorizations
+        of its ``smartlockId``.
+
+        Returns:
+            bool: True if the event was applied.
+        """
+        auths = event.get("smartlockAuths")
+        if event.get("feature") not in (None, "DEVICE_AUTHS") or auths is None or event.get("smartlockId") is None:
+            return False
+        self.replace_smartlock(event["smartlockId"], auths)
+        return True
+
+    # ---- Lookups ----
+    def __len__(self) -> int:
+        return len(self._auths)
+
+    def auth_ids(
+        self,
+        account_user_id: Optional[int] = None,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Return the IDs of all authorizations of a person on any smartlock.
+
+        The person is identified by `account_user_id` and/or `email` (the
+        account user with that email, case-insensitive); both select the
+        authorizations of those account users. `name` matches the
+        authorization name exactly: together with a user criterion it narrows
+        the result to authorizations with that name, on its own it selects all
+        authorizations with that name, whoever they belong to.
+
+        Returns:
+            list[str]: Authorization IDs, sorted.
+        """
+        user_ids = {account_user_id} if account_user_id is not None else set()
+        with self._lock:
+            if email is not None and _key(email) in self._user_by_email:
+                user_ids.add(self._user_by_email[_key(email)])
+            if account_user_id is None and email is None:
+                ids = set(self._by_name.get(name, ())) if name is not None else set()
+            else:
+                ids = set()
+                for user_id in user_ids:
+                    ids.update(self._by_user.get(user_id, ()))
+                if name is not None:
+                    ids &= self._by_name.get(name, set())
+        return sorted(ids)
+
+    def auths(self, account_user_id: Optional[int] = None, name: Optional[str] = None,
+              email: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the authorizations matched by `auth_ids`."""
+        return [self._auths[i] for i in self.auth_ids(account_user_id, name, email)]
+
+    def smartlocks(self, account_user_id: Optional[int] = None, name: Optional[str] = None,
+                   email: Optional[str] = None) -> Set[int]:
+        """Return the smartlocks a person holds authorizations for."""
+        return {auth.get("smartlockId") for auth in self.auths(account_user_id, name, email)}
+
+    # ---- Offboarding ----
+    def revoke(
+        self,
+        account_user_id: Optional[int] = None,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+        dry_run: bool = False,
+        match_name: bool = False,
+    ) -> List[str]:
+        """
+        Delete all authorizations of a person with a single `SmartlockAuth.delete_auths` call.
+
+        Matching follows `auth_ids`. Names are not unique, so revoking by
+        `name` alone requires `match_name=True`. The IDs are removed from the
+        index once the request succeeded.
+
+        Args:
+            account_user_id (int, optional): The account user.
+            name (str, optional): Exact authorization name.
+            email (str, optional): Account user email.
+            dry_run (bool): Only return the IDs that would be deleted.
+            match_name (bool): Allow `name` as the only criterion, revoking
+                every authorization with that name.
+
+        Returns:
+            list[str]: The revoked authorization IDs (empty if none matched;
+            no request is sent then).
+
+        Raises:
+            ValueError: If no criterion is given, or only `name` without `match_name`.
+        """
+        if account_user_id is None and email is None:
+            if name is None:
+                raise ValueError("Give account_user_id, email or name")
+            if not match_name:
+                raise ValueError("Revoking by name alone needs match_name=True; names are not unique")
+        ids = self.auth_ids(account_user_id, name, email)
+        if not ids or dry_run:
+            return ids
+        self.client.smartlock_auth.delete_auths(ids)
+        with self._lock:
+            for auth_id in ids:
+                self.remove(auth_id)
+        return ids
@@ -0,0 +1,376 @@
+import re
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from nukiwebapi.access import parse_date
+from nukiwebapi.deadline import request_deadline
+
+_CAMEL = re.compile(r"_([a-z])")
+
+
+def _camel(name: str) -> str:
+    return _CAMEL.sub(lambda m: m.group(1).upper(), name)
+
+
+def _same_value(field: str, expected: Any, actual: Any) -> bool:
+    # The API normalizes dates (e.g. "...T10:00:00Z" comes back as "...T10:00:00.000Z").
+    if field.endswith("Date") and isinstance(expected, str) and isinstance(actual, str):
+        return parse_date(expected) == parse_date(actual)
+    return expected == actual
+
+
+class _Operation:
+    __slots__ = ("kind", "future", "pending", "expected", "submitted", "expires", "found", "exclude")
+
+    def __init__(self, kind: str, pending: Set[Any], expected: Dict[str, Any], timeout: Optional[float],
+                 exclude: Optional[Set[Any]] = None):
+        self.kind = kind
+        self.future: Future = Future()
+        self.pending = pending
+        self.expected = expected
+        self.submitted = time.time()
+        self.expires = None if timeout is None else time.monotonic() + timeout
+        self.found: Dict[Any, Dict[str, Any]] = {}
+        self.exclude = exclude if exclude is not None else set()
+
+
+class AuthOperationTracker:
+    """
+    Track completion of asynchronous authorization changes.
+
+    Creating, updating and deleting authorizations returns before the
+    smartlocks applied the change. The tracker returns a `Future` per
+    operation and resolves it once the change shows up in the account's
+    authorization list:
+
+    - create: a new authorization with the same name (and type/code, if
+      given) exists on every target smartlock. Authorizations that were
+      listed before the creation was submitted never match, and each
+      authorization is claimed by one tracked create only, so same-name
+      creates do not resolve each other. The result is the list of created
+      authorizations.
+    - update: the authorization carries all changed field values (dates are
+      compared as points in time). The result is the updated authorization.
+    - delete: none of the IDs is listed any more. The result is the ID list.
+
+    One ``GET /smartlock/auth`` per `poll` checks all pending operations at
+    once. `wait` polls with exponential backoff, `start` does so in a
+    background thread, and `handle_webhook` resolves operations from
+    ``DEVICE_AUTHS`` webhook events without polling.
+
+    Example:
+        >>> tracker = AuthOperationTracker(client)
+        >>> futures = [tracker.create(f"Guest {i}", [lock_id], remote_allowed=False) for i in range(50)]
+        >>> tracker.wait(futures, timeout=120)
+
+    Args:
+        client (NukiWebAPI): Client of the account.
+        timeout (float, optional): Seconds after which an operation's future
+            fails with `TimeoutError`.
+        clock_skew (float): Tolerance in seconds when comparing server
+            ``creationDate`` values with the local submission time.
+    """
+
+    def __init__(self, client, timeout: Optional[float] = 300.0, clock_skew: float = 300.0):
+        self.client = client
+        self.timeout = timeout
+        self.clock_skew = clock_skew
+        self._pending: List[_Operation] = []
+        self._seen: Optional[Set[Any]] = None  # auth IDs of the last full listing, plus later webhook IDs
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    # ---- Registering operations ----
+    def _add(self, kind: str, pending: Set[Any], expected: Dict[str, Any],
+             exclude: Optional[Set[Any]] = None) -> Future:
+        operation = _Operation(kind, pending, expected, self.timeout, exclude)
+        if not pending:
+            operation.future.set_result([])
+            return operation.future
+        with self._lock:
+            self._pending.append(operation)
+        self._wakeup.set()
+        return operation.future
+
+    def track_create(self, name: str, smartlock_ids: Iterable[int], type: Optional[int] = None,
+                     code: Optional[int] = None, existing: Optional[Iterable[str]] = None) -> Future:
+        """
+        Track an authorization creation that was already submitted.
+
+        Args:
+            name (str): Name of the new authorizations.
+            smartlock_ids (iterable[int]): Target smartlocks.
+            type (int, optional): Expected authorization type.
+            code (int, optional): Expected keypad code.
+            existing (iterable[str], optional): IDs of the authorizations that
+                existed before the creation was submitted. Defaults to the IDs
+                known from the last poll.
+        """
+        expected: Dict[str, Any] = {"name": name}
+        if type is not None:
+            expected["type"] = type
+        if code is not None:
+            expected["code"] = code
+        exclude = set(existing) if existing is not None else self._known_ids()
+        return self._add("create", set(smartlock_ids), expected, exclude)
+
+    def track_update(self, auth_id: str, changes: Dict[str, Any]) -> Future:
+        """Track an update (API field names, e.g. ``{"enabled": False}``) that was already submitted."""
+        return self._add("update", {auth_id}, dict(changes))
+
+    def track_delete(self, ids: Iterable[str]) -> Future:
+        """Track a deletion that was already submitted."""
+        ids = list(ids)
+        return self._add("delete", set(ids), {"ids": ids})
+
+    # ---- Submitting and tracking ----
+    def create(self, name: str, smartlock_ids: List[int], remote_allowed: bool = False, **kwargs) -> Future:
+        """
+        Call `SmartlockAuth.create_auth_for_smartlocks` and track its completion.
+
+        The existing authorization IDs are snapshotted first; this lists the
+        authorizations once if the tracker has not polled yet.
+        """
+        existing = self._known_ids(fetch=True)
+        self.client.smartlock_auth.create_auth_for_smartlocks(name, smartlock_ids, remote_allowed, **kwargs)
+        return self.track_create(name, smartlock_ids, type=kwargs.get("type"), code=kwargs.get("code"),
+                                 existing=existing)
+
+    def update(self, smartlock_id: int, auth_id: str, **kwargs) -> Future:
+        """Call `SmartlockAuth.update_auth` and track its completion."""
+        self.client.smartlock_auth.update_auth(smartlock_id, auth_id, **kwargs)
+        return self.track_update(auth_id, {_camel(k): v for k, v in kwargs.items() if v is not None})
+
+    def update_bulk(self, auth_list: List[Dict[str, Any]]) -> List[Future]:
+        """Call `SmartlockAuth.update_auths_bulk` and track every entry."""
+        self.client.smartlock_auth.update_auths_bulk(auth_list)
+        return [self.track_update(a["id"], {k: v for k, v in a.items() if k != "id"}) for a in auth_list]
+
+    def delete(self, ids: List[str]) -> Future:
+        """Call `SmartlockAuth.delete_auths` and track its completion."""
+        self.client.smartlock_auth.delete_auths(ids)
+        return self.track_delete(ids)
+
+    @property
+    def pending(self) -> int:
+        """Number of unresolved operations."""
+        with self._lock:
+            return len(self._pending)
+
+    # ---- Resolution ----
+    def _known_ids(self, fetch: bool = False) -> Set[Any]:
+        """Return the auth IDs known to exist, listing them first if none are known and `fetch` is set."""
+        if fetch and self._seen is None:
+            self._apply(self.client.smartlock_auth.list_auths())
+        with self._lock:
+            known = set(self._seen or ())
+            for operation in self._pending:
+                known.update(a.get("id") for a in operation.found.values())
+        return known
+
+    def _matches_create(self, operation: _Operation, auth: Dict[str, Any]) -> bool:
+        if auth.get("id") in operation.exclude or any(auth.get(k) != v for k, v in operation.expected.items()):
+            return False
+        created = parse_date(auth.get("creationDate"))
+        return created is None or created >= operation.submitted - self.clock_skew
+
+    def _apply(self, auths: List[Dict[str, Any]], smartlock_id: Optional[int] = None) -> int:
+        """Check pending operations against a list of authorizations.
+
+        With `smartlock_id` the list only covers that smartlock; otherwise it
+        is the full account list.
+        """
+        by_id = {a.get("id"): a for a in auths}
+        done = []
+        with self._lock:
+            for operation in self._pending:
+                if operation.kind == "create":
+                    for auth in auths:
+                        lock = auth.get("smartlockId")
+                        if lock in operation.pending and self._matches_create(operation, auth):
+                            operation.pending.discard(lock)
+                            operation.found[lock] = auth
+                            for other in self._pending:
+                                if other is not operation and other.kind == "create":
+                                    other.exclude.add(auth.get("id"))
+                elif operation.kind == "update":
+                    for auth_id in list(operation.pending):
+                        auth = by_id.get(auth_id)
+                        if auth is not None and all(
+                            _same_value(k, v, auth.get(k)) for k, v in operation.expected.items()
+                        ):
+                            operation.pending.discard(auth_id)
+                            operation.found[auth_id] = auth
+                elif smartlock_id is None:
+                    operation.pending.difference_update(operation.pending - by_id.keys())
+                if not operation.pending:
+                    done.append(operation)
+            for operation in done:
+                self._pending.remove(operation)
+            if smartlock_id is None:
+                self._seen = set(by_id)
+            elif self._seen is not None:
+                self._seen.update(by_id)
+        self._finish(done)
+        return len(done) + self._expire()
+
+    def _expire(self) -> int:
+        """Fail operations whose timeout has passed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [op for op in self._pending if op.expires is not None and now >= op.expires]
+            for operation in expired:
+                self._pending.remove(operation)
+        self._finish(expired)
+        return len(expired)
+
+    def _finish(self, done: List[_Operation]) -> None:
+        for operation in done:
+            if operation.pending:
+                operation.future.set_exception(
+                    TimeoutError(f"{operation.kind} not confirmed for {sorted(map(str, operation.pending))}")
+                )
+            elif operation.kind == "create":
+                operation.future.set_result(list(operation.found.values()))
+            elif operation.kind == "update":
+                operation.future.set_result(next(iter(operation.found.values())))
+            else:
+                operation.future.set_result(operation.expected["ids"])
+
+    def poll(self, deadline: Optional[float] = None) -> int:
+        """
+        Fetch the authorization list once and resolve finished operations.
+
+        Timed-out operations fail even if fetching the list fails, so callers
+        are not left waiting during an outage; the error is re-raised.
+
+        Args:
+            deadline (float, optional): Seconds the listing may take before
+                it fails with `DeadlineExceeded`.
+
+        Returns:
+            int: Number of operations resolved (completed or timed out).
+        """
+        if not self.pending:
+            return 0
+        try:
+            with request_deadline(deadline):
+                auths = self.client.smartlock_auth.list_auths()
+        except Exception:
+            self._expire()
+            raise
+        return self._apply(auths)
+
+    def handle_webhook(self, event: Dict[str, Any]) -> int:
+        """
+        Resolve operations from a ``DEVICE_AUTHS`` webhook event.
+
+        The event's ``smartlockAuths`` list is the full authorization list of
+        ``smartlockId``; create and update operations are resolved from it.
+        Deletions are only confirmed by `poll`, as the owning smartlock of a
+        deleted ID is unknown.
+
+        Returns:
+            int: Number of operations resolved.
+        """
+        auths = event.get("smartlockAuths")
+        if event.get("feature") not in (None, "DEVICE_AUTHS") or auths is None:
+            return 0
+        smartlock_id = event.get("smartlockId")
+        for auth in auths:
+            auth.setdefault("smartlockId", smartlock_id)
+        return self._apply(auths, smartlock_id=smartlock_id)
+
+    def wait(
+        self,
+        futures: Optional[Iterable[Future]] = None,
+        timeout: Optional[float] = None,
+        interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 2.0,
+        deadline: Optional[float] = None,
+    ) -> bool:
+        """
+        Poll with exponential backoff until the given futures (default: all) are done.
+
+        Args:
+            futures (iterable[Future], optional): Futures to wait for.
+            timeout (float, optional): Give up after this many seconds.
+            interval (float): First delay between polls.
+            max_interval (float): Upper bound for the delay.
+            backoff (float): Factor applied to the delay after each poll.
+            deadline (float, optional): Seconds each poll may take (see `poll`).
+
+        Returns:
+            bool: True if everything waited for is done.
+        """
+        futures = list(futures) if futures is not None else None
+        expires = None if timeout is None else time.monotonic() + timeout
+
+        def finished():
+            return all(f.done() for f in futures) if futures is not None else not self.pending
+
+        while True:
+            self.poll(deadline)
+            if finished():
+                return True
+            delay = interval
+            if expires is not None:
+                delay = min(delay, expires - time.monotonic())
+                if delay <= 0:
+                    return False
+            time.sleep(delay)
+            interval = min(interval * backoff, max_interval)
+
+    # ---- Background polling ----
+    def start(self, interval: float = 0.5, max_interval: float = 10.0, backoff: float = 2.0,
+              deadline: Optional[float] = None) -> "AuthOperationTracker":
+        """
+        Poll in a daemon thread while operations are pending; the delay resets on new operations.
+
+        `deadline` bounds each poll (see `poll`), so a hanging request cannot
+        stall the thread.
+        """
+        if self._thread is not None:
+            return self
+        self._stopped.clear()
+
+        def loop():
+            delay = interval
+            while not self._stopped.is_set():
+                if not self.pending:
+                    self._wakeup.wait()
+                    self._wakeup.clear()
+                    delay = interval
+                    continue
+                try:
+                    self.poll(deadline)
+                except Exception:
+                    pass  # transient poll failures are retried with the next delay
+                if self._wakeup.wait(delay):
+                    self._wakeup.clear()
+                    delay = interval
+                else:
+                    delay = min(delay * backoff, max_interval)
+
+        self._thread = threading.Thread(target=loop, name="nukiwebapi-auth-tracker", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the background thread started by `start`."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,169 @@
+import contextvars
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+import requests
+
+from nukiwebapi.deadline import remaining_time
+from nukiwebapi.rate_limit import RateLimiter
+
+#: HTTP status codes worth retrying: rate limiting and server-side failures.
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Return True if a failed request is worth retrying.
+
+    Connection errors, timeouts and 429/5xx responses are considered transient;
+    any other error (validation, 4xx) is not.
+    """
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code in TRANSIENT_STATUS_CODES
+    return False
+
+
+def retry_delay(exc: BaseException, attempt: int, backoff: float, max_backoff: float = 30.0) -> float:
+    """
+    Compute how long to wait before retry number `attempt` (starting at 1).
+
+    Honors a numeric ``Retry-After`` header on 429/503 responses, otherwise uses
+    exponential backoff with full jitter.
+    """
+    response = getattr(exc, "response", None)
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(max_backoff, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+    return random.uniform(0, min(max_backoff, backoff * 2 ** (attempt - 1)))
+
+
+class BatchItemResult:
+    """
+    Outcome of a single item processed by `run_batch`.
+
+    Attributes:
+        index (int): Position of the item in the input.
+        item: The input item.
+        result: Return value of the function, if it succeeded.
+        error (Exception, optional): Last error raised, if it failed.
+        attempts (int): Number of calls made, including retries.
+        duration (float): Seconds spent on the item, including retries.
+    """
+
+    def __init__(self, index: int, item: Any):
+        self.index = index
+        self.item = item
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.attempts = 0
+        self.duration = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the item was processed successfully."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchItemResult(index={self.index}, item={self.item!r}, {status}, attempts={self.attempts})"
+
+
+def _process(
+    func: Callable[[Any], Any],
+    index: int,
+    item: Any,
+    rate_limiter: Optional[RateLimiter],
+    retries: int,
+    backoff: float,
+) -> BatchItemResult:
+    outcome = BatchItemResult(index, item)
+    start = time.perf_counter()
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        outcome.attempts += 1
+        try:
+            outcome.result = func(item)
+            outcome.error = None
+            break
+        except Exception as e:
+            outcome.error = e
+            if outcome.attempts > retries or not is_transient_error(e):
+                break
+            delay = retry_delay(e, outcome.attempts, backoff)
+            remaining = remaining_time()
+            if remaining is not None and delay >= remaining:
+                break
+            time.sleep(delay)
+    outcome.duration = time.perf_counter() - start
+    return outcome
+
+
+def iter_batch(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 8,
+    rate_limiter: Optional[RateLimiter] = None,
+    retries: int = 0,
+    backoff: float = 0.5,
+) -> Iterator[BatchItemResult]:
+    """
+    Apply `func` to every item concurrently, yielding results as they complete.
+
+    Each worker runs in a copy of the caller's context, so context-local
+    settings (request priority, deadlines, tracing) carry over to the threads.
+    Errors never propagate: they are recorded on the yielded result instead.
+
+    Args:
+        func (callable): Function called with a single item.
+        items (iterable): Items to process.
+        max_workers (int): Maximum number of concurrent calls.
+        rate_limiter (RateLimiter, optional): Limiter consulted before every call,
+            including retries.
+        retries (int): Retries for transient errors (see `is_transient_error`).
+            No retry is attempted if its delay would outlast the active
+            `request_deadline`.
+        backoff (float): Base delay in seconds for exponential backoff.
+
+    Yields:
+        BatchItemResult: One result per item, in completion order.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _process, func, index, item, rate_limiter, retries, backoff,
+            )
+            for index, item in enumerate(items)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_batch(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 8,
+    rate_limiter: Optional[RateLimiter] = None,
+    retries: int = 0,
+    backoff: float = 0.5,
+) -> List[BatchItemResult]:
+    """
+    Like `iter_batch`, but wait for all items and return results in input order.
+
+    Returns:
+        list[BatchItemResult]: One result per item, ordered like `items`.
+    """
+    results = list(iter_batch(func, items, max_workers, rate_limiter, retries, backoff))
+    results.sort(key=lambda r: r.index)
+    return results
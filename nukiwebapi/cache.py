@@ -0,0 +1,167 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small thread-safe in-memory cache with per-entry expiry.
+
+    Args:
+        ttl (float): Default time-to-live in seconds.
+        max_entries (int, optional): Evict the oldest entries beyond this size.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: Optional[int] = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key` for `ttl` seconds (default: the cache TTL)."""
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (expires, value)
+            if self.max_entries is not None:
+                while len(self._data) > self.max_entries:
+                    del self._data[next(iter(self._data))]
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value for `key`, computing and storing it with `factory` on a miss.
+
+        Concurrent misses for the same key share one `factory` call: the
+        other callers wait for it and get its result (or exception).
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        def fill():
+            value = self.get(key, _MISSING)  # stored by a call that finished meanwhile
+            if value is _MISSING:
+                value = factory()
+                self.set(key, value, ttl)
+            return value
+
+        return self._flights.do(key, fill)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every entry whose key satisfies `predicate`."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def invalidate_prefix(self, prefix: tuple) -> None:
+        """Remove every entry whose tuple key starts with `prefix`."""
+        n = len(prefix)
+        self.invalidate_where(lambda k: isinstance(k, tuple) and k[:n] == prefix)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def namespace(self, name: Hashable) -> "CacheNamespace":
+        """Return a view of this cache whose keys are prefixed with `name`."""
+        return CacheNamespace(self, name)
+
+
+class CacheNamespace:
+    """
+    View on a `TTLCache` that keys every entry by ``(name, key)``.
+
+    Used to give each account its own cache space on top of a shared store.
+    """
+
+    def __init__(self, cache: TTLCache, name: Hashable):
+        self.cache = cache
+        self.name = name
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self.cache.get((self.name, key), default)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self.cache.set((self.name, key), value, ttl)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        return self.cache.get_or_set((self.name, key), factory, ttl)
+
+    def invalidate(self, key: Hashable) -> None:
+        self.cache.invalidate((self.name, key))
+
+    def invalidate_prefix(self, prefix: tuple) -> None:
+        n = len(prefix)
+        self.cache.invalidate_where(
+            lambda k: isinstance(k, tuple) and len(k) == 2 and k[0] == self.name
+            and isinstance(k[1], tuple) and k[1][:n] == prefix
+        )
+
+    def clear(self) -> None:
+        self.cache.invalidate_prefix((self.name,))
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into a single call.
+
+    While a call for a key is running, further callers with that key wait for
+    it and get its result (or exception) instead of starting their own.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Return ``func()``, sharing the call with concurrent callers of the same `key`."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            value = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys with a call in progress."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,206 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from nukiwebapi.deadline import DeadlineExceeded
+from nukiwebapi.instrumentation import endpoint_template
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+#: Numeric values of the states, as exposed through metrics gauges.
+STATE_VALUES = {CLOSED: 0, OPEN: 1, HALF_OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while its circuit is open.
+
+    Attributes:
+        endpoint_class (str): The endpoint class whose circuit is open.
+        retry_after (float): Seconds until a probe request will be allowed.
+    """
+
+    def __init__(self, endpoint_class: str, retry_after: float):
+        super().__init__(f"Circuit for {endpoint_class!r} is open; retry in {retry_after:.1f}s")
+        self.endpoint_class = endpoint_class
+        self.retry_after = retry_after
+
+
+def endpoint_class(method: str, endpoint: str) -> str:
+    """
+    Group an endpoint into the class that shares one circuit.
+
+    The class is the first path segment, refined for smartlock actions, auths
+    and logs, which are served by different backends:
+    ``/smartlock/1/action/lock`` -> ``smartlock.action``,
+    ``/smartlock/auth`` -> ``smartlock.auth``, ``/account/user`` -> ``account``.
+    """
+    segments = [s for s in endpoint_template(endpoint).split("/") if s]
+    if not segments:
+        return "root"
+    for sub in ("action", "auth", "log"):
+        if sub in segments[1:]:
+            return f"{segments[0]}.{sub}"
+    return segments[0]
+
+
+def is_failure(exc: BaseException) -> bool:
+    """Return True for errors that indicate an unhealthy API: network errors, timeouts and 5xx responses."""
+    import requests
+
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code >= 500
+    return False
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes", "rejected")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint-class circuit breaker for `NukiWebAPI` requests.
+
+    A circuit opens after `failure_threshold` consecutive failures (see
+    `is_failure`); requests of that class then fail immediately with
+    `CircuitOpenError` instead of waiting on a degraded API. After
+    `recovery_timeout` seconds up to `half_open_max_calls` probe requests are
+    let through: a success closes the circuit, a failure opens it again.
+
+    Share one breaker between clients (e.g. via `NukiWebAPIPool`) so an outage
+    detected by one worker protects all of them.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open a circuit.
+        recovery_timeout (float): Seconds an open circuit waits before probing.
+        half_open_max_calls (int): Concurrent probe requests while half-open.
+        classify (callable): Maps ``(method, endpoint)`` to a circuit name.
+            Defaults to `endpoint_class`.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        classify: Callable[[str, str], str] = endpoint_class,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.classify = classify
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def before(self, method: str, endpoint: str) -> str:
+        """
+        Check the circuit of a request about to be sent.
+
+        Returns:
+            str: The circuit name, to pass to `record_success` / `record_failure`.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probe slots taken.
+        """
+        key = self.classify(method, endpoint)
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit()
+            if circuit.state == CLOSED:
+                return key
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(key, remaining)
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.probes >= self.half_open_max_calls:
+                circuit.rejected += 1
+                raise CircuitOpenError(key, 0.0)
+            circuit.probes += 1
+            return key
+
+    def record_success(self, key: str) -> None:
+        """Record that a request of circuit `key` got a healthy response."""
+        with self._lock:
+            circuit = self._circuits[key]
+            circuit.failures = 0
+            if circuit.state == HALF_OPEN:
+                circuit.state = CLOSED
+                circuit.probes = 0
+
+    def record_failure(self, key: str, exc: BaseException) -> None:
+        """
+        Record that a request of circuit `key` raised `exc`.
+
+        Errors that are not failures (see `is_failure`) count as success, except
+        `DeadlineExceeded` raised before the request was sent, which is ignored.
+        """
+        if isinstance(exc, DeadlineExceeded):
+            with self._lock:
+                circuit = self._circuits[key]
+                if circuit.state == HALF_OPEN:
+                    circuit.probes = max(0, circuit.probes - 1)
+            return
+        if not is_failure(exc):
+            self.record_success(key)
+            return
+        with self._lock:
+            circuit = self._circuits[key]
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probes = 0
+
+    def state(self, key: str) -> str:
+        """Return the state (``"closed"``, ``"open"`` or ``"half_open"``) of a circuit."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit is not None else CLOSED
+
+    def states(self) -> Dict[str, str]:
+        """Return the state of every circuit seen so far."""
+        with self._lock:
+            return {key: c.state for key, c in self._circuits.items()}
+
+    def rejections(self) -> Dict[str, int]:
+        """Return the number of fast-failed requests per circuit."""
+        with self._lock:
+            return {key: c.rejected for key, c in self._circuits.items()}
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Close one circuit, or all of them."""
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
+
+    def register_metrics(self, metrics) -> None:
+        """
+        Expose circuit states and rejections as gauges on a `RequestMetrics`.
+
+        Adds ``circuit_breaker_state`` (0=closed, 1=open, 2=half-open) and
+        ``circuit_breaker_rejections``, both labelled by circuit.
+        """
+        metrics.register_gauge(
+            "circuit_breaker_state", lambda: {k: STATE_VALUES[s] for k, s in self.states().items()}
+        )
+        metrics.register_gauge("circuit_breaker_rejections", self.rejections)
@@ -0,0 +1,68 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple, Union
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+#: Default ``(connect, read)`` timeout in seconds for `NukiWebAPI` requests.
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 30.0)
+
+_deadline: ContextVar[Optional[float]] = ContextVar("nukiwebapi_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request cannot complete before the active `request_deadline`."""
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Bound the total time of all requests made inside the block.
+
+    Every request checks the remaining time before it is sent and caps its
+    timeout to it, raising `DeadlineExceeded` once the deadline has passed.
+    Nested deadlines can only shorten the outer one. The deadline follows the
+    context, so work fanned out through `nukiwebapi.batch` inherits it.
+
+    Example:
+        >>> with request_deadline(5):
+        ...     client.fleet.lock()
+
+    Args:
+        seconds (float, optional): Time budget from now. ``None`` leaves the
+            current deadline unchanged.
+    """
+    if seconds is None:
+        yield
+        return
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Return the seconds left until the active deadline, or None without one."""
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def cap_timeout(timeout: Timeout, remaining: float) -> Timeout:
+    """
+    Shorten a `requests`-style timeout so it does not exceed `remaining` seconds.
+
+    Args:
+        timeout: ``None``, a number or a ``(connect, read)`` tuple.
+        remaining (float): Seconds left until the deadline.
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return (
+            remaining if connect is None else min(connect, remaining),
+            remaining if read is None else min(read, remaining),
+        )
+    return remaining if timeout is None else min(timeout, remaining)
@@ -0,0 +1,174 @@
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from nukiwebapi.batch import BatchItemResult, iter_batch
+from nukiwebapi.deadline import request_deadline
+from nukiwebapi.rate_limit import RateLimiter
+from nukiwebapi.stats import Histogram
+from nukiwebapi.tracing import traced
+
+
+class FleetActionReport:
+    """
+    Consolidated outcome of an action dispatched to many smartlocks.
+
+    Attributes:
+        action (int): The action code that was sent.
+        results (list[BatchItemResult]): Per-lock results, in input order.
+        elapsed (float): Wall-clock seconds for the whole run.
+        latency (Histogram): Per-lock completion times (including retries).
+    """
+
+    def __init__(self, action: int, results: List[BatchItemResult], elapsed: float):
+        self.action = action
+        self.results = results
+        self.elapsed = elapsed
+        self.latency = Histogram()
+        for r in results:
+            self.latency.observe(r.duration)
+
+    @property
+    def succeeded(self) -> List[int]:
+        """Smartlock IDs for which the action was accepted."""
+        return [r.item for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> Dict[int, BaseException]:
+        """Mapping of smartlock ID to the error that made the action fail."""
+        return {r.item: r.error for r in self.results if not r.ok}
+
+    @property
+    def retried(self) -> List[int]:
+        """Smartlock IDs that needed more than one attempt."""
+        return [r.item for r in self.results if r.attempts > 1]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the report as a plain dict.
+
+        Returns:
+            dict: Counts, elapsed time, throughput and latency percentiles.
+        """
+        total = len(self.results)
+        return {
+            "action": self.action,
+            "total": total,
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "retried": len(self.retried),
+            "elapsed": self.elapsed,
+            "throughput": total / self.elapsed if self.elapsed else None,
+            "latency": self.latency.summary(),
+        }
+
+
+class Fleet:
+    """
+    Sub-client for dispatching smartlock actions across many locks at once.
+
+    Actions are sent concurrently with bounded parallelism and an optional
+    request rate cap, transient failures (connection errors, 429, 5xx) are
+    retried with backoff, and a `FleetActionReport` summarises the run.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    @traced("fleet.action", lambda self, action, smartlock_ids=None, **kwargs: {"nuki.action": action})
+    def run_action(
+        self,
+        action: int,
+        smartlock_ids: Optional[Iterable[int]] = None,
+        option: Optional[int] = None,
+        advanced: bool = False,
+        callback_url: Optional[str] = None,
+        max_workers: int = 16,
+        rate: Optional[float] = None,
+        retries: int = 2,
+        backoff: float = 0.5,
+        on_complete: Optional[Callable[[BatchItemResult], None]] = None,
+        deadline: Optional[float] = None,
+    ) -> FleetActionReport:
+        """
+        Send an action to many smartlocks concurrently.
+
+        Uses `Smartlock.action` (POST /smartlock/{smartlockId}/action) or, with
+        ``advanced=True``, `AdvancedApi.action_smartlock_advanced`
+        (POST /smartlock/{smartlockId}/action/advanced).
+
+        Args:
+            action (int): Action code (1=unlock, 2=lock, 3=unlatch, 4=lock’n’go, 5=lock’n’go+unlatch).
+            smartlock_ids (iterable[int], optional): Target locks. Defaults to all
+                locks in `NukiWebAPI.lock_instances`.
+            option (int, optional): Option mask (2=force, 4=full lock).
+            advanced (bool): Use the advanced action endpoint.
+            callback_url (str, optional): Callback URL for advanced actions.
+            max_workers (int): Maximum number of concurrent requests.
+            rate (float, optional): Maximum requests per second across all workers.
+            retries (int): Retries per lock for transient failures.
+            backoff (float): Base delay in seconds between retries.
+            on_complete (callable, optional): Called with each lock's
+                `BatchItemResult` as soon as it finishes.
+            deadline (float, optional): Seconds the whole run may take. Locks
+                not done in time fail with `DeadlineExceeded`.
+
+        Returns:
+            FleetActionReport: Per-lock outcomes and timing percentiles.
+        """
+        with request_deadline(deadline):
+            return self._run_action(action, smartlock_ids, option, advanced, callback_url,
+                                    max_workers, rate, retries, backoff, on_complete)
+
+    def _run_action(self, action, smartlock_ids, option, advanced, callback_url,
+                    max_workers, rate, retries, backoff, on_complete) -> FleetActionReport:
+        if smartlock_ids is None:
+            smartlock_ids = list(self.client.lock_instances)
+        payload: Dict[str, Any] = {"action": action}
+        if option is not None:
+            payload["option"] = option
+        if advanced and callback_url is not None:
+            payload["callbackUrl"] = callback_url
+
+        if advanced:
+            def send(smartlock_id):
+                return self.client.advanced_api.action_smartlock_advanced(smartlock_id, dict(payload))
+        else:
+            def send(smartlock_id):
+                return self.client.smartlock.action(smartlock_id, dict(payload))
+
+        rate_limiter = RateLimiter(rate) if rate else None
+        start = time.perf_counter()
+        results = []
+        for result in iter_batch(send, smartlock_ids, max_workers, rate_limiter, retries, backoff):
+            results.append(result)
+            if on_complete is not None:
+                on_complete(result)
+        results.sort(key=lambda r: r.index)
+        return FleetActionReport(action, results, time.perf_counter() - start)
+
+    def lock(self, smartlock_ids: Optional[Iterable[int]] = None, full: bool = False, **kwargs) -> FleetActionReport:
+        """
+        Lock many smartlocks concurrently.
+
+        Args:
+            smartlock_ids (iterable[int], optional): Target locks (default: all).
+            full (bool): Request a full lock (option=4).
+            **kwargs: Passed on to `run_action`.
+
+        Returns:
+            FleetActionReport: Per-lock outcomes and timing percentiles.
+        """
+        return self.run_action(2, smartlock_ids, option=4 if full else None, **kwargs)
+
+    def unlock(self, smartlock_ids: Optional[Iterable[int]] = None, **kwargs) -> FleetActionReport:
+        """
+        Unlock many smartlocks concurrently.
+
+        Args:
+            smartlock_ids (iterable[int], optional): Target locks (default: all).
+            **kwargs: Passed on to `run_action`.
+
+        Returns:
+            FleetActionReport: Per-lock outcomes and timing percentiles.
+        """
+        return self.run_action(1, smartlock_ids, **kwargs)
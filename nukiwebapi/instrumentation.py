@@ -0,0 +1,271 @@
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from nukiwebapi.stats import Histogram
+
+_ID_SEGMENT = re.compile(r"\d+|[0-9a-fA-F-]{8,}|(?=[\w-]*\d)[\w-]{16,}")
+
+
+def _escape_label(value: Any) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Collapse IDs in an endpoint path so metrics aggregate per route.
+
+    Example:
+        ``/smartlock/12345/auth/5f2b...`` becomes ``/smartlock/{id}/auth/{id}``.
+    """
+    path = endpoint.split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.fullmatch(part) else part for part in path.split("/"))
+
+
+class RequestInfo:
+    """
+    Describes a single HTTP request as seen by instrumentation hooks.
+
+    Attributes:
+        method (str): HTTP method.
+        endpoint (str): Endpoint path as passed to `NukiWebAPI._request`.
+        template (str): `endpoint` with IDs replaced by ``{id}``.
+        url (str): Full request URL.
+        kwargs (dict): Keyword arguments for the HTTP call (params, json, ...).
+        start (float): `time.perf_counter()` when the request started.
+        elapsed (float, optional): Seconds until the response or error.
+        response: The HTTP response, once received.
+        error (Exception, optional): The error raised, if any.
+        context (dict): Free-form storage shared between hooks of one request.
+    """
+
+    def __init__(self, method: str, endpoint: str, url: str, kwargs: Dict[str, Any]):
+        self.method = method
+        self.endpoint = endpoint
+        self.template = endpoint_template(endpoint)
+        self.url = url
+        self.kwargs = kwargs
+        self.start = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.response = None
+        self.error: Optional[BaseException] = None
+        self.context: Dict[str, Any] = {}
+        self._finished = False
+
+    @property
+    def status_code(self) -> Optional[int]:
+        """Status code of the response, if one was received."""
+        return getattr(self.response, "status_code", None)
+
+
+class RequestMetrics:
+    """
+    Built-in request metrics fed by `Instrumentation`.
+
+    Tracks latency histograms per ``(method, endpoint template)``, request
+    counts per status code, error counts per exception type, request/response
+    byte counters and the number of requests in flight. Additional gauges
+    (scheduler queue, circuit breaker state, ...) can be registered with
+    `register_gauge`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        self.errors: Dict[Tuple[str, str, str], int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.in_flight = 0
+        self._gauges: Dict[str, Callable[[], Any]] = {}
+
+    def register_gauge(self, name: str, func: Callable[[], Any]) -> None:
+        """
+        Expose an extra gauge.
+
+        Args:
+            name (str): Metric name (without prefix).
+            func (callable): Returns a number, or a ``{label_value: number}`` dict.
+        """
+        self._gauges[name] = func
+
+    def _started(self, info: RequestInfo) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def _finished(self, info: RequestInfo) -> None:
+        key = (info.method, info.template)
+        status = str(info.status_code) if info.status_code is not None else "error"
+        sent = received = 0
+        if info.response is not None:
+            body = getattr(getattr(info.response, "request", None), "body", None)
+            sent = len(body) if isinstance(body, (bytes, str)) else 0
+            content = getattr(info.response, "content", None)
+            received = len(content) if isinstance(content, (bytes, str)) else 0
+        with self._lock:
+            self.in_flight -= 1
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = Histogram()
+            self.requests[key + (status,)] = self.requests.get(key + (status,), 0) + 1
+            self.bytes_sent += sent
+            self.bytes_received += received
+        histogram.observe(info.elapsed)
+
+    def _errored(self, info: RequestInfo) -> None:
+        key = (info.method, info.template, type(info.error).__name__)
+        with self._lock:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return all metrics as a plain dict.
+
+        Returns:
+            dict: ``latency`` summaries per ``"METHOD template"``, ``requests`` and
+            ``errors`` counters, byte counters, ``in_flight`` and custom gauges.
+        """
+        with self._lock:
+            latency = dict(self.latency)
+            requests = dict(self.requests)
+            errors = dict(self.errors)
+        return {
+            "latency": {f"{m} {t}": h.summary() for (m, t), h in latency.items()},
+            "requests": {f"{m} {t} {s}": c for (m, t, s), c in requests.items()},
+            "errors": {f"{m} {t} {e}": c for (m, t, e), c in errors.items()},
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "in_flight": self.in_flight,
+            "gauges": {name: func() for name, func in self._gauges.items()},
+        }
+
+    def collect(self) -> Iterator[Tuple[str, str, Dict[str, str], float]]:
+        """
+        Yield ``(name, type, labels, value)`` metric points.
+
+        This is the generic form used by `to_prometheus` and suitable for
+        feeding OpenTelemetry observable instruments or other sinks.
+        Histogram buckets are cumulative, Prometheus style.
+        """
+        with self._lock:
+            latency = dict(self.latency)
+            requests = dict(self.requests)
+            errors = dict(self.errors)
+        for (method, template), hist in latency.items():
+            labels = {"method": method, "endpoint": template}
+            for bound, count in hist.cumulative_buckets():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield "request_duration_seconds_bucket", "histogram", {**labels, "le": le}, count
+            yield "request_duration_seconds_sum", "histogram", labels, hist.sum
+            yield "request_duration_seconds_count", "histogram", labels, hist.count
+        for (method, template, status), count in requests.items():
+            yield "requests_total", "counter", {"method": method, "endpoint": template, "status": status}, count
+        for (method, template, error), count in errors.items():
+            yield "request_errors_total", "counter", {"method": method, "endpoint": template, "error": error}, count
+        yield "request_bytes_sent_total", "counter", {}, self.bytes_sent
+        yield "request_bytes_received_total", "counter", {}, self.bytes_received
+        yield "requests_in_flight", "gauge", {}, self.in_flight
+        for name, func in self._gauges.items():
+            value = func()
+            if isinstance(value, dict):
+                for label, v in value.items():
+                    yield name, "gauge", {"key": str(label)}, v
+            else:
+                yield name, "gauge", {}, value
+
+    def to_prometheus(self, prefix: str = "nukiwebapi") -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Prefix prepended to every metric name.
+
+        Returns:
+            str: Exposition text, ready to serve on a ``/metrics`` endpoint.
+        """
+        lines: List[str] = []
+        typed = set()
+        for name, kind, labels, value in self.collect():
+            family = re.sub(r"_(bucket|sum|count)$", "", name) if kind == "histogram" else name
+            if family not in typed:
+                lines.append(f"# TYPE {prefix}_{family} {kind}")
+                typed.add(family)
+            label_text = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+            lines.append(f"{prefix}_{name}{{{label_text}}} {value}" if label_text else f"{prefix}_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class Instrumentation:
+    """
+    Hook registry attached to a `NukiWebAPI` client.
+
+    Hooks are called with a `RequestInfo`:
+
+    - ``before_request``: before the HTTP call is made.
+    - ``after_response``: once a response was received (any status code).
+    - ``on_error``: when the call or status check raised an exception.
+
+    Args:
+        metrics (bool): Also collect the built-in `RequestMetrics`.
+    """
+
+    EVENTS = ("before_request", "after_response", "on_error")
+
+    def __init__(self, metrics: bool = True):
+        self.hooks: Dict[str, List[Callable[[RequestInfo], None]]] = {event: [] for event in self.EVENTS}
+        self.metrics: Optional[RequestMetrics] = RequestMetrics() if metrics else None
+
+    def add_hook(self, event: str, func: Callable[[RequestInfo], None]) -> Callable[[RequestInfo], None]:
+        """
+        Register a callback for an event.
+
+        Args:
+            event (str): One of ``before_request``, ``after_response``, ``on_error``.
+            func (callable): Called with the `RequestInfo`.
+
+        Returns:
+            callable: `func`, so this can be used as a decorator factory target.
+        """
+        if event not in self.hooks:
+            raise ValueError(f"event must be one of {self.EVENTS}")
+        self.hooks[event].append(func)
+        return func
+
+    def remove_hook(self, event: str, func: Callable[[RequestInfo], None]) -> None:
+        """Unregister a callback added with `add_hook`."""
+        self.hooks[event].remove(func)
+
+    # ---- Called by NukiWebAPI._request ----
+    def before(self, method: str, endpoint: str, url: str, kwargs: Dict[str, Any]) -> RequestInfo:
+        info = RequestInfo(method, endpoint, url, kwargs)
+        if self.metrics is not None:
+            self.metrics._started(info)
+        for hook in self.hooks["before_request"]:
+            hook(info)
+        return info
+
+    def after(self, info: RequestInfo, response) -> None:
+        info.response = response
+        self._finish(info)
+        for hook in self.hooks["after_response"]:
+            hook(info)
+
+    def error(self, info: RequestInfo, error: BaseException) -> None:
+        info.error = error
+        if info.response is None and getattr(error, "response", None) is not None:
+            info.response = error.response
+        self._finish(info)
+        if self.metrics is not None:
+            self.metrics._errored(info)
+        for hook in self.hooks["on_error"]:
+            hook(info)
+
+    def _finish(self, info: RequestInfo) -> None:
+        if info._finished:
+            return
+        info._finished = True
+        info.elapsed = time.perf_counter() - info.start
+        if self.metrics is not None:
+            self.metrics._finished(info)
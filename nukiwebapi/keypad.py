@@ -0,0 +1,217 @@
+import random
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+#: Authorization type of keypad codes.
+KEYPAD_AUTH_TYPE = 13
+
+_DIGITS = "123456789"
+
+
+def is_valid_code(code: Any) -> bool:
+    """
+    Return True if `code` follows Nuki's keypad code rules.
+
+    A code has exactly 6 digits from 1-9 (no 0) and must not start with ``12``.
+    """
+    text = str(code)
+    return len(text) == 6 and all(c in _DIGITS for c in text) and not text.startswith("12")
+
+
+def validate_code(code: Any) -> int:
+    """
+    Check a keypad code and return it as an int.
+
+    Raises:
+        ValueError: If the code breaks the keypad code rules (see `is_valid_code`).
+    """
+    if not is_valid_code(code):
+        raise ValueError(f"Invalid keypad code {code!r}: use 6 digits 1-9, not starting with 12")
+    return int(code)
+
+
+def random_code(rng: Optional[random.Random] = None) -> int:
+    """Return a random valid keypad code."""
+    choice = (rng or random).choice
+    while True:
+        text = "".join(choice(_DIGITS) for _ in range(6))
+        if not text.startswith("12"):
+            return int(text)
+
+
+class KeypadCodeIndex:
+    """
+    Local index of keypad codes (authorization type 13) per smartlock.
+
+    Checks whether a code is already used on a lock in O(1) and generates
+    codes that are free on every target lock, so code provisioning does not
+    have to learn about conflicts from failed asynchronous API calls.
+
+    Example:
+        >>> index = KeypadCodeIndex(client).refresh()
+        >>> code = index.provision([lock_a, lock_b], name="Guest 42")
+
+    Args:
+        client (NukiWebAPI, optional): Client used by `refresh` and `provision`.
+    """
+
+    def __init__(self, client=None):
+        self.client = client
+        self._codes: Dict[int, Set[int]] = {}
+        self._auth_ids: Dict[Tuple[int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self, page_size: int = 100) -> "KeypadCodeIndex":
+        """
+        Rebuild the index from all keypad authorizations of the account.
+
+        Uses `SmartlockAuth.iter_auths` with ``types="13"``.
+
+        Returns:
+            KeypadCodeIndex: The index itself.
+        """
+        auths = self.client.smartlock_auth.iter_auths(page_size=page_size, types=str(KEYPAD_AUTH_TYPE))
+        with self._lock:
+            self._codes.clear()
+            self._auth_ids.clear()
+        self.load(auths)
+        return self
+
+    def load(self, auths: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add the keypad codes of authorization dicts to the index.
+
+        Entries of other types or without a code are skipped.
+
+        Returns:
+            int: Number of codes added.
+        """
+        added = 0
+        with self._lock:
+            for auth in auths:
+                if auth.get("type") != KEYPAD_AUTH_TYPE or auth.get("code") is None:
+                    continue
+                smartlock_id, code = auth["smartlockId"], int(auth["code"])
+                self._codes.setdefault(smartlock_id, set()).add(code)
+                if auth.get("id") is not None:
+                    self._auth_ids[(smartlock_id, code)] = auth["id"]
+                added += 1
+        return added
+
+    def add(self, smartlock_id: int, code: int, auth_id: Optional[str] = None) -> None:
+        """Mark `code` as used on a smartlock."""
+        code = int(code)
+        with self._lock:
+            self._codes.setdefault(smartlock_id, set()).add(code)
+            if auth_id is not None:
+                self._auth_ids[(smartlock_id, code)] = auth_id
+
+    def remove(self, smartlock_id: int, code: int) -> None:
+        """Mark `code` as free on a smartlock."""
+        code = int(code)
+        with self._lock:
+            self._codes.get(smartlock_id, set()).discard(code)
+            self._auth_ids.pop((smartlock_id, code), None)
+
+    def is_taken(self, smartlock_id: int, code: int) -> bool:
+        """Return True if `code` is used on the smartlock."""
+        return int(code) in self._codes.get(smartlock_id, ())
+
+    def conflicts(self, code: int, smartlock_ids: Iterable[int]) -> List[int]:
+        """Return the smartlocks among `smartlock_ids` on which `code` is already used."""
+        code = int(code)
+        return [s for s in smartlock_ids if code in self._codes.get(s, ())]
+
+    def auth_id(self, smartlock_id: int, code: int) -> Optional[str]:
+        """Return the ID of the authorization using `code` on a smartlock, if known."""
+        return self._auth_ids.get((smartlock_id, int(code)))
+
+    def codes(self, smartlock_id: int) -> Set[int]:
+        """Return a copy of the codes used on a smartlock."""
+        return set(self._codes.get(smartlock_id, ()))
+
+    def __len__(self) -> int:
+        return sum(len(codes) for codes in self._codes.values())
+
+    def generate(
+        self,
+        smartlock_ids: Iterable[int],
+        count: int = 1,
+        reserve: bool = True,
+        rng: Optional[random.Random] = None,
+        max_attempts: int = 1000,
+    ) -> List[int]:
+        """
+        Generate distinct random codes that are free on all given smartlocks.
+
+        Args:
+            smartlock_ids (iterable[int]): Locks the codes must be free on.
+            count (int): Number of codes.
+            reserve (bool): Mark the codes as used right away, so concurrent or
+                later calls never hand them out again.
+            rng (random.Random, optional): Random generator, e.g. a seeded one.
+            max_attempts (int): Random draws allowed per code before giving up.
+
+        Returns:
+            list[int]: The codes.
+
+        Raises:
+            ValueError: If no free code was found within `max_attempts` draws.
+        """
+        smartlock_ids = list(smartlock_ids)
+        result: List[int] = []
+        with self._lock:
+            used = [self._codes.setdefault(s, set()) for s in smartlock_ids]
+            for _ in range(count):
+                for _ in range(max_attempts):
+                    code = random_code(rng)
+                    if code not in result and not any(code in codes for codes in used):
+                        break
+                else:
+                    raise ValueError("No free keypad code found; the code space of these locks is nearly full")
+                result.append(code)
+                if reserve:
+                    for codes in used:
+                        codes.add(code)
+        return result
+
+    def provision(self, smartlock_ids: List[int], name: str, code: Optional[int] = None, **kwargs) -> int:
+        """
+        Create a keypad code authorization on several smartlocks without conflicts.
+
+        Checks `code` against the index (or generates a free one), reserves it
+        and calls `SmartlockAuth.create_auth_for_smartlocks` with ``type=13``.
+
+        Args:
+            smartlock_ids (list[int]): Target smartlocks.
+            name (str): Authorization name.
+            code (int, optional): Code to use. A free random code if omitted.
+            **kwargs: Further arguments for `create_auth_for_smartlocks`
+                (``remote_allowed`` defaults to False).
+
+        Returns:
+            int: The code that was provisioned.
+
+        Raises:
+            ValueError: If the code is invalid or already used on one of the locks.
+        """
+        if code is None:
+            [code] = self.generate(smartlock_ids)
+        else:
+            code = validate_code(code)
+            with self._lock:
+                taken = [s for s in smartlock_ids if code in self._codes.get(s, ())]
+                if taken:
+                    raise ValueError(f"Keypad code already in use on smartlocks {taken}")
+                for s in smartlock_ids:
+                    self._codes.setdefault(s, set()).add(code)
+        kwargs.setdefault("remote_allowed", False)
+        try:
+            self.client.smartlock_auth.create_auth_for_smartlocks(
+                name=name, smartlock_ids=smartlock_ids, type=KEYPAD_AUTH_TYPE, code=code, **kwargs
+            )
+        except Exception:
+            for s in smartlock_ids:
+                self.remove(s, code)
+            raise
+        return code
@@ -1,43 +1,120 @@
-import requests
-
-from nukiwebapi.account import Account
-from nukiwebapi.account_user import AccountUser
-from nukiwebapi.address import Address
-from nukiwebapi.address_reservation import AddressReservation
-from nukiwebapi.address_token import AddressToken
-from nukiwebapi.advanced_api import AdvancedApi
-from nukiwebapi.api_key import ApiKey
-from nukiwebapi.company import Company
-from nukiwebapi.notification import Notification
-from nukiwebapi.opener import Opener
-from nukiwebapi.service import Service
-from nukiwebapi.smartlock import Smartlock
-from nukiwebapi.smartlock_instance import SmartlockInstance
-from nukiwebapi.smartlock_auth import SmartlockAuth
-from nukiwebapi.smartlock_log import SmartlockLog
+import importlib
+import re
+import time
+from typing import TYPE_CHECKING
+
+from nukiwebapi.cache import TTLCache
+from nukiwebapi.deadline import DEFAULT_TIMEOUT, DeadlineExceeded, cap_timeout, remaining_time
+from nukiwebapi.tracing import NOOP_TRACER
+
+if TYPE_CHECKING:
+    import requests
+
+    from nukiwebapi.circuit_breaker import CircuitBreaker
+    from nukiwebapi.deadline import Timeout
+    from nukiwebapi.instrumentation import Instrumentation
+    from nukiwebapi.recording import Recorder
+    from nukiwebapi.scheduler import RequestScheduler
+    from nukiwebapi.tracing import Tracer
+    from nukiwebapi.transport import Transport
+
+# Sub-clients are imported and instantiated on first attribute access.
+_SUB_CLIENTS = {
+    "account": ("nukiwebapi.account", "Account"),
+    "account_user": ("nukiwebapi.account_user", "AccountUser"),
+    "address": ("nukiwebapi.address", "Address"),
+    "address_reservation": ("nukiwebapi.address_reservation", "AddressReservation"),
+    "address_token": ("nukiwebapi.address_token", "AddressToken"),
+    "advanced_api": ("nukiwebapi.advanced_api", "AdvancedApi"),
+    "api_key": ("nukiwebapi.api_key", "ApiKey"),
+    "company": ("nukiwebapi.company", "Company"),
+    "fleet": ("nukiwebapi.fleet", "Fleet"),
+    "notification": ("nukiwebapi.notification", "Notification"),
+    "opener": ("nukiwebapi.opener", "Opener"),
+    "service": ("nukiwebapi.service", "Service"),
+    "smartlock": ("nukiwebapi.smartlock", "Smartlock"),
+    "smartlock_auth": ("nukiwebapi.smartlock_auth", "SmartlockAuth"),
+    "smartlock_log": ("nukiwebapi.smartlock_log", "SmartlockLog"),
+}
+
+_SMARTLOCK_ID = re.compile(r"/smartlock/(\d+)")
 
 
 class NukiWebAPI:
     """Main Nuki Web API client."""
 
-    def __init__(self, access_token: str, base_url: str = "https://api.nuki.io", smartlock_ids: list[str] = None):
+    def __init__(
+        self,
+        access_token: str,
+        base_url: str = "https://api.nuki.io",
+        smartlock_ids: list[str] = None,
+        scheduler: "RequestScheduler" = None,
+        session: "requests.Session" = None,
+        cache=None,
+        instrumentation: "Instrumentation" = None,
+        tracer: "Tracer" = None,
+        transport: "Transport | str" = None,
+        recorder: "Recorder" = None,
+        http2: bool = False,
+        circuit_breaker: "CircuitBreaker" = None,
+        timeout: "Timeout" = DEFAULT_TIMEOUT,
+    ):
         self.base_url = base_url.rstrip("/")
         self.access_token = access_token
-        self.account = Account(self)
-        self.account_user = AccountUser(self)
-        self.address = Address(self)
-        self.address_reservation = AddressReservation(self)
-        self.address_token = AddressToken(self)
-        self.api_key = ApiKey(self)
-        self.smartlock = Smartlock(self)
+        self.scheduler = scheduler
+        self.session = session
+        self.cache = cache if cache is not None else TTLCache()
+        self.instrumentation = instrumentation
+        self.tracer = tracer if tracer is not None else NOOP_TRACER
+        if http2:
+            if transport is not None:
+                raise ValueError("http2=True cannot be combined with a transport; configure HTTP/2 on the transport")
+            transport = "httpx"
+        # Transports created here (from a name or http2=True) are closed by `close`.
+        self._owns_transport = isinstance(transport, str)
+        if isinstance(transport, str):
+            from nukiwebapi.transport import make_transport
+
+            transport = make_transport(transport, **({"http2": True} if http2 else {}))
+        self.transport = transport
+        self.recorder = recorder
+        self.circuit_breaker = circuit_breaker
+        self.timeout = timeout
         self._lock_instances = None
-        self.advanced_api = AdvancedApi(self)
-        self.company = Company(self)
-        self.notification = Notification(self)
-        self.opener = Opener(self)
-        self.service = Service(self)
-        self.smartlock_auth = SmartlockAuth(self)
-        self.smartlock_log = SmartlockLog(self)
+        if instrumentation is not None and instrumentation.metrics is not None and scheduler is not None:
+            instrumentation.metrics.register_gauge("scheduler_in_flight", lambda: scheduler.in_flight)
+            instrumentation.metrics.register_gauge("scheduler_queued", lambda: scheduler.queued)
+        if instrumentation is not None and instrumentation.metrics is not None and circuit_breaker is not None:
+            circuit_breaker.register_metrics(instrumentation.metrics)
+
+    def __getattr__(self, name: str):
+        """Create sub-clients (``client.smartlock``, ``client.account``, ...) on first access."""
+        try:
+            module_name, class_name = _SUB_CLIENTS[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        sub_client = getattr(importlib.import_module(module_name), class_name)(self)
+        # Cache on the instance so later lookups bypass __getattr__ entirely.
+        return self.__dict__.setdefault(name, sub_client)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_SUB_CLIENTS))
+
+    def close(self) -> None:
+        """
+        Close the transport if the client created it (from a name or ``http2=True``).
+
+        Transports and sessions passed in by the caller are left open, since
+        they may be shared with other clients.
+        """
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     @property
     def lock_instances(self):
@@ -47,6 +124,8 @@ class NukiWebAPI:
         
     def _fetch_smartlocks(self):
         """Fetch all smartlocks and create Smartlock objects mapped by ID."""
+        from nukiwebapi.smartlock_instance import SmartlockInstance
+
         response = self._request("GET", "/smartlock")
         smartlocks = {}
         if response.json():
@@ -69,8 +148,83 @@ class NukiWebAPI:
         headers = kwargs.pop("headers", {})
         headers["Authorization"] = f"Bearer {self.access_token}"
         headers["Accept"] = "application/json"
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+
+        if not self.tracer.enabled:
+            return self._perform(method, endpoint, url, headers, kwargs)
 
-        response = requests.request(method, url, headers=headers, **kwargs)
+        from nukiwebapi.instrumentation import endpoint_template
+
+        attributes = {"http.method": method, "http.url": url, "nuki.endpoint": endpoint_template(endpoint)}
+        match = _SMARTLOCK_ID.match(endpoint)
+        if match:
+            attributes["nuki.smartlock_id"] = int(match.group(1))
+        with self.tracer.start_span(f"{method} {attributes['nuki.endpoint']}", attributes) as span:
+            self.tracer.inject(headers)
+            try:
+                response = self._perform(method, endpoint, url, headers, kwargs)
+            except Exception as e:
+                status_code = getattr(getattr(e, "response", None), "status_code", None)
+                if status_code is not None:
+                    span.set_attribute("http.status_code", status_code)
+                raise
+            span.set_attribute("http.status_code", response.status_code)
+            return response
+
+    def _perform(self, method: str, endpoint: str, url: str, headers: dict, kwargs: dict):
+        """Send the request through the circuit breaker and instrumentation hooks and check its status."""
+        remaining = remaining_time()
+        if remaining is not None:
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Deadline exceeded before {method} {endpoint}")
+            kwargs["timeout"] = cap_timeout(kwargs.get("timeout"), remaining)
+        breaker = self.circuit_breaker
+        circuit = breaker.before(method, endpoint) if breaker is not None else None
+        instrumentation = self.instrumentation
+        info = instrumentation.before(method, endpoint, url, kwargs) if instrumentation is not None else None
+        try:
+            if self.recorder is None:
+                response = self._send(method, url, headers=headers, **kwargs)
+            else:
+                start = time.perf_counter()
+                response = self._send(method, url, headers=headers, **kwargs)
+                self.recorder.record(method, endpoint, kwargs, response, time.perf_counter() - start)
+            if info is not None:
+                instrumentation.after(info, response)
+            self._raise_for_status(response)
+        except Exception as e:
+            if circuit is not None:
+                breaker.record_failure(circuit, e)
+            if info is not None:
+                instrumentation.error(info, e)
+            if remaining is not None and _is_timeout(e) and remaining_time() <= 0:
+                raise DeadlineExceeded(f"Deadline exceeded during {method} {endpoint}") from e
+            raise
+
+        if circuit is not None:
+            breaker.record_success(circuit)
+        return response
+
+    def _send(self, method: str, url: str, **kwargs):
+        """Perform the HTTP call, honoring the transport, shared session and scheduler."""
+        if self.transport is not None:
+            send = self.transport.request
+        elif self.session is not None:
+            send = self.session.request
+        else:
+            import requests
+
+            send = requests.request
+        if self.scheduler is not None:
+            with self.scheduler.slot():
+                return send(method, url, **kwargs)
+        return send(method, url, **kwargs)
+
+    @staticmethod
+    def _raise_for_status(response) -> None:
+        """Raise `requests.HTTPError` with the API's ``detailMessage`` for error responses."""
+        import requests
 
         try:
             response.raise_for_status()
@@ -88,5 +242,8 @@ class NukiWebAPI:
                 response=response
             ) from None
 
-        return response
 
+def _is_timeout(exc: BaseException) -> bool:
+    import requests
+
+    return isinstance(exc, requests.Timeout)
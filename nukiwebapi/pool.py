@@ -0,0 +1,305 @@
+import contextvars
+import hashlib
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nukiwebapi.batch import BatchItemResult, is_transient_error, retry_delay, run_batch
+from nukiwebapi.cache import TTLCache
+from nukiwebapi.circuit_breaker import CircuitBreaker
+from nukiwebapi.deadline import remaining_time
+from nukiwebapi.nuki_web_api import NukiWebAPI
+from nukiwebapi.scheduler import RequestScheduler
+from nukiwebapi.transport import HttpxTransport, Transport, make_transport
+
+
+def account_key_for_token(access_token: str) -> str:
+    """Return a stable, non-secret key identifying an access token."""
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()[:12]
+
+
+class NukiWebAPIPool:
+    """
+    Pool of `NukiWebAPI` clients for operators managing many accounts.
+
+    All clients share one HTTP session (and therefore one connection pool),
+    one `RequestScheduler` (in-flight and rate budget) and one `TTLCache`
+    whose entries are namespaced per account. With ``http2=True`` they share
+    one HTTP/2 `HttpxTransport` instead, so concurrent requests are
+    multiplexed over a few connections.
+
+    Args:
+        tokens (dict or iterable): ``{account_key: access_token}`` mapping, or
+            plain access tokens (keyed by `account_key_for_token`).
+        base_url (str): API base URL.
+        max_connections (int): Size of the shared HTTP connection pool.
+        max_in_flight (int): Maximum concurrent requests across all accounts.
+        rate (float, optional): Maximum requests per second across all accounts.
+        cache_ttl (float): Default TTL of the shared cache in seconds.
+        transport (str or Transport, optional): Transport shared by all clients
+            instead of the session (see `NukiWebAPI`). No session is created
+            then, and `session` is None.
+        http2 (bool): Share an HTTP/2 `HttpxTransport` (requires ``httpx[http2]``).
+        circuit_breaker (CircuitBreaker, optional): Breaker shared by all clients.
+    """
+
+    def __init__(
+        self,
+        tokens: Optional[Iterable[Any]] = None,
+        base_url: str = "https://api.nuki.io",
+        max_connections: int = 32,
+        max_in_flight: int = 32,
+        rate: Optional[float] = None,
+        cache_ttl: float = 60.0,
+        transport: Optional[Any] = None,
+        http2: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        if http2:
+            if transport is not None:
+                raise ValueError("http2=True cannot be combined with a transport; configure HTTP/2 on the transport")
+            transport = HttpxTransport(http2=True, max_connections=max_connections)
+        self.base_url = base_url
+        self._owns_transport = http2 or isinstance(transport, str)
+        self.transport: Optional[Transport] = make_transport(transport)
+        self.session: Optional[requests.Session] = None
+        if self.transport is None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        self.circuit_breaker = circuit_breaker
+        self.scheduler = RequestScheduler(max_in_flight=max_in_flight, rate=rate)
+        self.cache = TTLCache(ttl=cache_ttl)
+        self._clients: Dict[Hashable, NukiWebAPI] = {}
+        self._lock = threading.Lock()
+
+        if isinstance(tokens, dict):
+            for key, token in tokens.items():
+                self.add(token, key)
+        elif tokens is not None:
+            for token in tokens:
+                self.add(token)
+
+    def add(self, access_token: str, account_key: Optional[Hashable] = None) -> NukiWebAPI:
+        """
+        Register an account and return its client.
+
+        Args:
+            access_token (str): API token of the account.
+            account_key (hashable, optional): Key to address the account by.
+
+        Returns:
+            NukiWebAPI: Client sharing the pool's session (or transport),
+            scheduler and cache.
+        """
+        key = account_key if account_key is not None else account_key_for_token(access_token)
+        client = NukiWebAPI(
+            access_token,
+            base_url=self.base_url,
+            scheduler=self.scheduler,
+            session=self.session,
+            transport=self.transport,
+            circuit_breaker=self.circuit_breaker,
+            cache=self.cache.namespace(key),
+        )
+        with self._lock:
+            self._clients[key] = client
+        return client
+
+    def remove(self, account_key: Hashable) -> None:
+        """Forget an account and drop its cache entries."""
+        with self._lock:
+            self._clients.pop(account_key, None)
+        self.cache.invalidate_prefix((account_key,))
+
+    def get(self, account_key: Hashable) -> NukiWebAPI:
+        """Return the client registered under `account_key`."""
+        return self._clients[account_key]
+
+    __getitem__ = get
+
+    @property
+    def accounts(self) -> List[Hashable]:
+        """Keys of all registered accounts."""
+        return list(self._clients)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __iter__(self) -> Iterator[Tuple[Hashable, NukiWebAPI]]:
+        return iter(list(self._clients.items()))
+
+    def close(self) -> None:
+        """Close the shared HTTP session and any transport created by the pool."""
+        if self.session is not None:
+            self.session.close()
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---- Fan-out ----
+    def fan_out(
+        self, func: Callable[[Hashable, NukiWebAPI], Any], max_workers: int = 16, retries: int = 0
+    ) -> Dict[Hashable, BatchItemResult]:
+        """
+        Call ``func(account_key, client)`` for every account concurrently.
+
+        Errors are isolated per account and recorded on the results.
+
+        Returns:
+            dict: Account key to `BatchItemResult`.
+        """
+        accounts = list(self)
+        results = run_batch(lambda pair: func(*pair), accounts, max_workers=max_workers, retries=retries)
+        return {r.item[0]: r for r in results}
+
+    def map_fair(
+        self,
+        tasks: Dict[Hashable, Iterable[Any]],
+        func: Callable[[Hashable, NukiWebAPI, Any], Any],
+        max_workers: int = 16,
+        max_per_account: int = 4,
+        retries: int = 0,
+        backoff: float = 0.5,
+    ) -> Iterator[BatchItemResult]:
+        """
+        Run many per-account tasks with per-account concurrency fairness.
+
+        Tasks are interleaved round-robin across accounts and no account may
+        occupy more than `max_per_account` workers, so one account with a huge
+        fleet cannot starve the others. Scheduling happens in the calling
+        thread: an account's next task is only submitted once one of its
+        slots is free, so workers never wait on a busy account. A task waiting
+        for a retry (see `retry_delay`) holds neither a worker nor a slot.
+
+        Args:
+            tasks (dict): Account key to an iterable of task items.
+            func (callable): Called as ``func(account_key, client, item)``.
+            max_workers (int): Total concurrent calls.
+            max_per_account (int): Concurrent calls per account.
+            retries (int): Retries for transient errors (see `is_transient_error`).
+            backoff (float): Base delay in seconds for exponential backoff.
+
+        Yields:
+            BatchItemResult: Results whose ``item`` is ``(account_key, task_item)``,
+            in completion order.
+        """
+        if max_workers < 1 or max_per_account < 1:
+            raise ValueError("max_workers and max_per_account must be at least 1")
+        groups = [[(key, item) for item in items] for key, items in tasks.items()]
+        interleaved = [t for group in itertools.zip_longest(*groups) for t in group if t is not None]
+        queues: Dict[Hashable, Deque[BatchItemResult]] = {key: deque() for key in tasks}
+        for index, task in enumerate(interleaved):
+            queues[task[0]].append(BatchItemResult(index, task))
+
+        running = dict.fromkeys(queues, 0)
+        ready: Deque[Hashable] = deque()  # accounts with queued tasks and a free slot, round-robin
+        in_ready: Set[Hashable] = set()
+        delayed: List[Tuple[float, int, BatchItemResult]] = []  # heap of (due, index, outcome)
+        started: Dict[int, float] = {}
+
+        def schedule(key):
+            if queues[key] and running[key] < max_per_account and key not in in_ready:
+                ready.append(key)
+                in_ready.add(key)
+
+        def attempt(outcome):
+            key, item = outcome.item
+            outcome.attempts += 1
+            try:
+                outcome.result = func(key, self.get(key), item)
+                outcome.error = None
+            except Exception as e:
+                outcome.error = e
+            return outcome
+
+        for key in queues:
+            schedule(key)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: Dict[Future, Hashable] = {}
+            while ready or futures or delayed:
+                while delayed and delayed[0][0] <= time.monotonic():
+                    outcome = heapq.heappop(delayed)[2]
+                    queues[outcome.item[0]].appendleft(outcome)
+                    schedule(outcome.item[0])
+                while ready and len(futures) < max_workers:
+                    key = ready.popleft()
+                    in_ready.discard(key)
+                    outcome = queues[key].popleft()
+                    started.setdefault(outcome.index, time.perf_counter())
+                    futures[executor.submit(contextvars.copy_context().run, attempt, outcome)] = key
+                    running[key] += 1
+                    schedule(key)
+                timeout = max(0.0, delayed[0][0] - time.monotonic()) if delayed else None
+                if not futures:
+                    # Only retries are left; wait() would return at once on an empty set.
+                    time.sleep(timeout)
+                    continue
+                done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = futures.pop(future)
+                    running[key] -= 1
+                    outcome = future.result()
+                    if (outcome.error is not None and outcome.attempts <= retries
+                            and is_transient_error(outcome.error)):
+                        delay = retry_delay(outcome.error, outcome.attempts, backoff)
+                        remaining = remaining_time()
+                        if remaining is None or delay < remaining:
+                            heapq.heappush(delayed, (time.monotonic() + delay, outcome.index, outcome))
+                            schedule(key)
+                            continue
+                    outcome.duration = time.perf_counter() - started.pop(outcome.index)
+                    schedule(key)
+                    yield outcome
+
+    def refresh_all_locks(self, max_workers: int = 16) -> Dict[Hashable, BatchItemResult]:
+        """
+        Re-fetch the smartlocks of every account concurrently.
+
+        Updates each client's `lock_instances` and caches the raw list under
+        ``"smartlocks"`` in the account's cache namespace.
+
+        Returns:
+            dict: Account key to `BatchItemResult` whose result is the
+            account's ``{smartlock_id: SmartlockInstance}`` mapping.
+        """
+        def refresh(key, client):
+            client._lock_instances = client._fetch_smartlocks()
+            client.cache.set("smartlocks", [lock.raw_data for lock in client._lock_instances.values()])
+            return client._lock_instances
+
+        return self.fan_out(refresh, max_workers=max_workers)
+
+    def map_locks(
+        self,
+        func: Callable[[Any], Any],
+        max_workers: int = 16,
+        max_per_account: int = 4,
+        retries: int = 0,
+    ) -> Iterator[BatchItemResult]:
+        """
+        Call ``func(lock)`` for every `SmartlockInstance` across all accounts.
+
+        Uses `map_fair`, so accounts are served round-robin.
+
+        Yields:
+            BatchItemResult: Results whose ``item`` is ``(account_key, lock)``.
+        """
+        tasks = {key: list(client.lock_instances.values()) for key, client in self}
+        return self.map_fair(
+            tasks, lambda key, client, lock: func(lock),
+            max_workers=max_workers, max_per_account=max_per_account, retries=retries,
+        )
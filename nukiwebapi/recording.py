@@ -0,0 +1,192 @@
+import gzip
+import json
+import re
+import threading
+import time
+from collections import deque
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from nukiwebapi.transport import Transport, build_response
+
+REDACTED = "***"
+
+_SECRET_KEY = re.compile(r"(token|secret|password|passphrase|apikey)$|^code$", re.IGNORECASE)
+
+# Address token IDs grant access to an address, so they are secrets too.
+_SECRET_PATH = re.compile(r"^(/address/token/)[^/]+")
+
+# Response headers worth keeping; everything else is dropped to keep files small.
+_KEPT_HEADERS = ("Content-Type", "Retry-After")
+
+
+def redact(value: Any) -> Any:
+    """
+    Return a copy of `value` with secrets replaced by ``"***"``.
+
+    Dict keys ending in ``token``, ``secret``, ``password``, ``passphrase`` or
+    ``apiKey``, and keys named ``code`` (keypad codes), are redacted at any
+    nesting depth (case-insensitive).
+    """
+    if isinstance(value, dict):
+        return {k: REDACTED if _SECRET_KEY.search(str(k)) and v is not None else redact(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+def redact_path(endpoint: str) -> str:
+    """Return `endpoint` with the token ID of ``/address/token/{id}`` paths replaced by ``"***"``."""
+    return _SECRET_PATH.sub(r"\g<1>" + REDACTED, endpoint)
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Recorder:
+    """
+    Capture request/response pairs made by `NukiWebAPI` as JSON lines.
+
+    Pass it as ``NukiWebAPI(..., recorder=Recorder("traffic.jsonl.gz"))``.
+    Each line holds the method, endpoint, query parameters and JSON body of the
+    request, the response status, selected headers and body, and the time the
+    server took to answer. The bearer token is never written, secret-looking
+    fields are redacted (see `redact`) and so are address token IDs in paths
+    (see `redact_path`). Files ending in ``.gz`` are gzipped.
+
+    Args:
+        path (str): File to write.
+        mode (str): ``"w"`` to overwrite or ``"a"`` to append.
+    """
+
+    def __init__(self, path: str, mode: str = "w"):
+        if mode not in ("w", "a"):
+            raise ValueError("mode must be 'w' or 'a'")
+        self.path = path
+        self.count = 0
+        self._file = _open(path, mode)
+        self._lock = threading.Lock()
+
+    def record(self, method: str, endpoint: str, kwargs: Dict[str, Any], response, elapsed: float) -> None:
+        """
+        Append one exchange to the file.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Endpoint path, e.g. ``/smartlock/123``.
+            kwargs (dict): Keyword arguments of the HTTP call (``params``, ``json``, ...).
+            response (requests.Response): The response received.
+            elapsed (float): Seconds between sending the request and receiving the response.
+        """
+        entry: Dict[str, Any] = {"method": method, "endpoint": redact_path(endpoint)}
+        if kwargs.get("params"):
+            entry["params"] = redact(kwargs["params"])
+        if kwargs.get("json") is not None:
+            entry["json"] = redact(kwargs["json"])
+        entry["status"] = response.status_code
+        headers = {k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers}
+        if headers:
+            entry["headers"] = headers
+        if response.content:
+            try:
+                entry["body"] = redact(json.loads(response.content))
+            except ValueError:
+                entry["text"] = response.content.decode("utf-8", "replace")
+        entry["elapsed"] = round(elapsed, 6)
+        line = json.dumps(entry, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self.count += 1
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_recording(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of a file written by `Recorder`."""
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None))
+
+
+class ReplayTransport(Transport):
+    """
+    Serve recorded responses instead of making HTTP calls.
+
+    Requests are matched on method, endpoint path (redacted like the
+    recording, see `redact_path`) and query parameters.
+    Repeated requests get the recorded responses in order; once they are used
+    up the last one is served again. The `base_url` of the client is ignored,
+    so a recording made against production replays on any client.
+
+    Example:
+        >>> client = NukiWebAPI("TOKEN", transport=ReplayTransport("traffic.jsonl.gz", speed=10))
+
+    Args:
+        source (str or list[dict]): Recording file or already loaded entries.
+        speed (float, optional): Replay the recorded server time divided by
+            `speed` (``1.0`` = original timing). ``None`` answers immediately.
+    """
+
+    def __init__(self, source: Union[str, List[Dict[str, Any]]], speed: Optional[float] = None):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self._entries: Dict[Tuple[str, str, Tuple], deque] = {}
+        self._last: Dict[Tuple[str, str, Tuple], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        entries = load_recording(source) if isinstance(source, str) else source
+        for entry in entries:
+            key = (entry["method"], entry["endpoint"], _params_key(entry.get("params")))
+            self._entries.setdefault(key, deque()).append(entry)
+
+    def __len__(self) -> int:
+        return sum(len(q) for q in self._entries.values())
+
+    def _next(self, key: Tuple[str, str, Tuple]) -> Dict[str, Any]:
+        with self._lock:
+            queue = self._entries.get(key)
+            if queue:
+                self._last[key] = entry = queue.popleft()
+                return entry
+            if key in self._last:
+                return self._last[key]
+        raise KeyError(f"No recorded response for {key[0]} {key[1]} {dict(key[2]) or ''}".rstrip())
+
+    def request(self, method: str, url: str, **kwargs):
+        """
+        Return the recorded response for a request (same signature as `requests.request`).
+
+        Raises:
+            KeyError: If nothing was recorded for the request.
+        """
+        endpoint = redact_path(urlsplit(url).path)
+        entry = self._next((method, endpoint, _params_key(kwargs.get("params"))))
+        if self.speed is not None:
+            time.sleep(entry.get("elapsed", 0) / self.speed)
+
+        if "body" in entry:
+            content = json.dumps(entry["body"], separators=(",", ":")).encode("utf-8")
+        else:
+            content = entry.get("text", "").encode("utf-8")
+        body = kwargs.get("json")
+        return build_response(
+            method, url, entry["status"], entry.get("headers"), content,
+            kwargs.get("headers"), json.dumps(body).encode("utf-8") if body is not None else None,
+        )
@@ -0,0 +1,309 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from nukiwebapi.access import parse_date
+from nukiwebapi.batch import iter_batch, run_batch
+from nukiwebapi.deadline import request_deadline
+from nukiwebapi.rate_limit import RateLimiter
+
+ISSUE, REVOKE, UPDATE_ACCESS_TIMES = "issue", "revoke", "update_access_times"
+
+#: Reservation states that never get (or keep) authorizations.
+INACTIVE_STATES = frozenset({"CANCELLED", "CANCELED", "DECLINED", "DELETED"})
+
+
+def default_access_times(reservation: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return ``checkInTime``/``checkOutTime`` of a reservation, or None if it has none."""
+    if "checkInTime" in reservation and "checkOutTime" in reservation:
+        return {"checkInTime": reservation["checkInTime"], "checkOutTime": reservation["checkOutTime"]}
+    return reservation.get("accessTimes")
+
+
+class ReservationChange:
+    """
+    A single change planned by `ReservationSync`.
+
+    Attributes:
+        kind (str): ``"issue"``, ``"revoke"`` or ``"update_access_times"``.
+        address_id (int): Address of the reservation.
+        reservation_id (str): The reservation.
+        access_times (dict, optional): New access times for time updates.
+    """
+
+    __slots__ = ("kind", "address_id", "reservation_id", "access_times")
+
+    def __init__(self, kind: str, address_id: int, reservation_id: str, access_times: Optional[Dict[str, Any]] = None):
+        self.kind = kind
+        self.address_id = address_id
+        self.reservation_id = reservation_id
+        self.access_times = access_times
+
+    @property
+    def key(self) -> Tuple[int, str]:
+        return self.address_id, self.reservation_id
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ReservationChange) and (
+            (self.kind, self.address_id, self.reservation_id, self.access_times)
+            == (other.kind, other.address_id, other.reservation_id, other.access_times)
+        )
+
+    def __repr__(self) -> str:
+        return f"ReservationChange({self.kind!r}, {self.address_id!r}, {self.reservation_id!r})"
+
+
+class ReservationSyncReport:
+    """
+    Outcome of a `ReservationSync.run`.
+
+    Attributes:
+        addresses (int): Addresses whose reservations were fetched.
+        reservations (int): Reservations seen.
+        changes (list[ReservationChange]): Planned changes.
+        applied (list[ReservationChange]): Changes that succeeded.
+        failed (list[tuple[ReservationChange, Exception]]): Changes that failed.
+        fetch_errors (dict): Address ID to the error of its failed listing.
+        dry_run (bool): True if changes were only planned.
+        elapsed (float): Seconds spent.
+    """
+
+    def __init__(self):
+        self.addresses = 0
+        self.reservations = 0
+        self.changes: List[ReservationChange] = []
+        self.applied: List[ReservationChange] = []
+        self.failed: List[Tuple[ReservationChange, BaseException]] = []
+        self.fetch_errors: Dict[int, BaseException] = {}
+        self.dry_run = True
+        self.elapsed = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the report as a plain dict."""
+        by_kind: Dict[str, int] = {}
+        for change in self.changes:
+            by_kind[change.kind] = by_kind.get(change.kind, 0) + 1
+        return {
+            "dry_run": self.dry_run,
+            "addresses": self.addresses,
+            "reservations": self.reservations,
+            "changes": by_kind,
+            "applied": len(self.applied),
+            "failed": len(self.failed),
+            "fetch_errors": len(self.fetch_errors),
+            "elapsed": self.elapsed,
+        }
+
+
+class ReservationSync:
+    """
+    Keep reservation authorizations of many addresses in sync with their check-in windows.
+
+    Every `run` lists the reservations of all addresses concurrently, compares
+    them with the snapshot of the previous run and applies only the needed
+    changes, concurrently and rate limited:
+
+    - issue: an active reservation whose window (starting `issue_ahead`
+      before ``startDate``) has begun and that has no authorizations yet.
+    - revoke: an issued reservation that was cancelled or whose ``endDate``
+      has passed.
+    - update_access_times: an issued reservation whose access times (see
+      `access_times`) differ from the ones last applied. Issuing applies the
+      reservation's own times; for reservations not in the snapshot yet, the
+      fetched ``accessTimes`` (if any) count as applied.
+
+    Addresses whose listing failed are left untouched. The snapshot is a
+    plain dict (`snapshot`) that can be persisted and passed back in.
+
+    Example:
+        >>> sync = ReservationSync(client, issue_ahead=timedelta(hours=2))
+        >>> report = sync.run()
+        >>> print(report.summary())
+
+    Args:
+        client (NukiWebAPI): Client of the account.
+        address_ids (iterable[int], optional): Addresses to sync. Defaults to
+            all addresses from `Address.list_addresses`.
+        snapshot (dict, optional): Snapshot of a previous run.
+        issue_ahead (timedelta): How long before ``startDate`` to issue.
+        access_times (callable): ``access_times(reservation)`` returning the
+            desired access times dict, or None to leave them alone.
+        max_workers (int): Concurrent requests.
+        rate (float, optional): Maximum change requests per second.
+        retries (int): Retries per reservation listing for transient errors.
+        write_retries (int): Retries per issue/revoke/update request. These
+            calls are not idempotent (a timed-out issue may have succeeded),
+            so they are not retried by default.
+        backoff (float): Base delay in seconds between retries.
+    """
+
+    def __init__(
+        self,
+        client,
+        address_ids: Optional[Iterable[int]] = None,
+        snapshot: Optional[Dict[str, Dict[str, Any]]] = None,
+        issue_ahead: timedelta = timedelta(0),
+        access_times: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]] = default_access_times,
+        max_workers: int = 8,
+        rate: Optional[float] = 10.0,
+        retries: int = 2,
+        write_retries: int = 0,
+        backoff: float = 0.5,
+    ):
+        self.client = client
+        self.address_ids = list(address_ids) if address_ids is not None else None
+        self.snapshot: Dict[str, Dict[str, Any]] = dict(snapshot or {})
+        self.issue_ahead = issue_ahead
+        self.access_times = access_times
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate) if rate else None
+        self.retries = retries
+        self.write_retries = write_retries
+        self.backoff = backoff
+
+    @staticmethod
+    def _key(address_id: int, reservation_id: str) -> str:
+        return f"{address_id}/{reservation_id}"
+
+    def _applied_access_times(self, reservation: Dict[str, Any], previous: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Access times the reservation currently has: as last applied, else as fetched, else the desired ones."""
+        if "accessTimes" in previous:
+            return previous["accessTimes"]
+        return reservation.get("accessTimes", self.access_times(reservation))
+
+    def fetch(self, report: Optional[ReservationSyncReport] = None) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        List the reservations of all addresses concurrently.
+
+        Returns:
+            dict: Address ID to its reservations; failed addresses are missing
+            and recorded in `report.fetch_errors`.
+        """
+        address_ids = self.address_ids
+        if address_ids is None:
+            address_ids = [a["addressId"] for a in self.client.address.list_addresses()]
+        reservations: Dict[int, List[Dict[str, Any]]] = {}
+        for result in iter_batch(
+            self.client.address_reservation.list_reservations, address_ids,
+            max_workers=self.max_workers, retries=self.retries, backoff=self.backoff,
+        ):
+            if result.ok:
+                reservations[result.item] = result.result or []
+            elif report is not None:
+                report.fetch_errors[result.item] = result.error
+        return reservations
+
+    def plan(self, reservations: Dict[int, List[Dict[str, Any]]], now: Optional[datetime] = None) -> List[ReservationChange]:
+        """
+        Compute the changes for the given reservations against the snapshot.
+
+        Args:
+            reservations (dict): Address ID to its reservations, as from `fetch`.
+            now (datetime, optional): Reference time (default: current UTC time).
+
+        Returns:
+            list[ReservationChange]: Changes, ordered by address.
+        """
+        now = now or datetime.now(timezone.utc)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        ts = now.timestamp()
+        ahead = self.issue_ahead.total_seconds()
+        changes: List[ReservationChange] = []
+        for address_id in sorted(reservations):
+            for reservation in reservations[address_id]:
+                reservation_id = reservation["id"]
+                previous = self.snapshot.get(self._key(address_id, reservation_id), {})
+                issued = reservation.get("authsIssued", previous.get("issued", False))
+                start = parse_date(reservation.get("startDate"))
+                end = parse_date(reservation.get("endDate"))
+                inactive = reservation.get("state") in INACTIVE_STATES or (end is not None and ts >= end)
+                if inactive:
+                    if issued:
+                        changes.append(ReservationChange(REVOKE, address_id, reservation_id))
+                    continue
+                if not issued:
+                    if start is None or ts >= start - ahead:
+                        changes.append(ReservationChange(ISSUE, address_id, reservation_id))
+                    continue
+                desired = self.access_times(reservation)
+                if desired is not None and desired != self._applied_access_times(reservation, previous):
+                    changes.append(ReservationChange(UPDATE_ACCESS_TIMES, address_id, reservation_id, desired))
+        return changes
+
+    def _apply_change(self, change: ReservationChange) -> Any:
+        api = self.client.address_reservation
+        if change.kind == ISSUE:
+            return api.issue_reservation(change.address_id, change.reservation_id)
+        if change.kind == REVOKE:
+            return api.revoke_reservation(change.address_id, change.reservation_id)
+        return api.update_reservation_access_times(change.address_id, change.reservation_id, change.access_times)
+
+    def _update_snapshot(self, reservations: Dict[int, List[Dict[str, Any]]], applied: List[ReservationChange]) -> None:
+        current = {}
+        by_key = {}
+        for address_id, entries in reservations.items():
+            for reservation in entries:
+                key = self._key(address_id, reservation["id"])
+                previous = self.snapshot.get(key, {})
+                by_key[key] = reservation
+                current[key] = {
+                    "issued": reservation.get("authsIssued", previous.get("issued", False)),
+                    "accessTimes": self._applied_access_times(reservation, previous),
+                }
+        for change in applied:
+            key = self._key(*change.key)
+            entry = current[key]
+            if change.kind == ISSUE:
+                # Issuing applies the reservation's own access times.
+                entry["issued"] = True
+                entry["accessTimes"] = self.access_times(by_key[key])
+            elif change.kind == REVOKE:
+                entry["issued"] = False
+            else:
+                entry["accessTimes"] = change.access_times
+        fetched = {str(address_id) for address_id in reservations}
+        for key, entry in self.snapshot.items():
+            if key.split("/", 1)[0] not in fetched:
+                current[key] = entry
+        self.snapshot = current
+
+    def run(self, now: Optional[datetime] = None, dry_run: bool = False,
+            deadline: Optional[float] = None) -> ReservationSyncReport:
+        """
+        Fetch, diff and apply in one go.
+
+        Args:
+            now (datetime, optional): Reference time (default: current UTC time).
+            dry_run (bool): Only plan; neither apply changes nor update the snapshot.
+            deadline (float, optional): Seconds the whole run may take.
+                Listings and changes not done in time fail with
+                `DeadlineExceeded`.
+
+        Returns:
+            ReservationSyncReport: What was planned, applied and failed.
+        """
+        with request_deadline(deadline):
+            return self._run(now, dry_run)
+
+    def _run(self, now: Optional[datetime], dry_run: bool) -> ReservationSyncReport:
+        report = ReservationSyncReport()
+        start = time.perf_counter()
+        reservations = self.fetch(report)
+        report.addresses = len(reservations)
+        report.reservations = sum(len(entries) for entries in reservations.values())
+        report.changes = self.plan(reservations, now)
+        if not dry_run:
+            for result in run_batch(
+                self._apply_change, report.changes,
+                max_workers=self.max_workers, rate_limiter=self.rate_limiter,
+                retries=self.write_retries, backoff=self.backoff,
+            ):
+                if result.ok:
+                    report.applied.append(result.item)
+                else:
+                    report.failed.append((result.item, result.error))
+            report.dry_run = False
+            self._update_snapshot(reservations, report.applied)
+        report.elapsed = time.perf_counter() - start
+        return report
@@ -0,0 +1,157 @@
+import functools
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Dict, Iterator, Optional
+
+from nukiwebapi.deadline import DeadlineExceeded, remaining_time
+from nukiwebapi.rate_limit import RateLimiter
+from nukiwebapi.stats import Histogram
+
+
+class Priority(IntEnum):
+    """Request priorities; lower values are served first."""
+
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BACKGROUND = 2
+
+
+_current_priority: ContextVar[Priority] = ContextVar("nukiwebapi_request_priority", default=Priority.DEFAULT)
+
+
+def current_priority() -> Priority:
+    """Return the request priority active in the current context."""
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """
+    Run all requests made inside the block with the given priority.
+
+    The setting is context-local, so it follows the caller into worker threads
+    started through `nukiwebapi.batch`.
+
+    Example:
+        with request_priority(Priority.BACKGROUND):
+            client.smartlock_auth.list_auths()
+    """
+    token = _current_priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def interactive(func):
+    """Decorator marking every request made by `func` as `Priority.INTERACTIVE`."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with request_priority(Priority.INTERACTIVE):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class RequestScheduler:
+    """
+    Priority-aware gate in front of every HTTP request of a client.
+
+    Limits the number of requests in flight and, optionally, the request rate.
+    When the budget is exhausted, waiting requests are admitted strictly by
+    priority (then FIFO), so interactive calls such as lock actions overtake
+    queued background work sharing the same budget.
+
+    Args:
+        max_in_flight (int): Maximum number of concurrent requests.
+        rate (float, optional): Maximum requests per second.
+        burst (int, optional): Token bucket size for `rate`.
+    """
+
+    def __init__(self, max_in_flight: int = 8, rate: Optional[float] = None, burst: Optional[int] = None):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self.rate_limiter = RateLimiter(rate, burst) if rate else None
+        self.in_flight = 0
+        self._waiting: list = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self.wait_times: Dict[Priority, Histogram] = {p: Histogram() for p in Priority}
+
+    @property
+    def queued(self) -> int:
+        """Number of requests currently waiting for a slot."""
+        return len(self._waiting)
+
+    def acquire(self, priority: Optional[Priority] = None) -> None:
+        """
+        Block until the caller may send a request.
+
+        Raises `DeadlineExceeded` if the active `request_deadline` passes while
+        waiting.
+
+        Args:
+            priority (Priority, optional): Defaults to `current_priority()`.
+        """
+        priority = Priority(current_priority() if priority is None else priority)
+        entry = (priority, next(self._seq))
+        start = time.perf_counter()
+        with self._cond:
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    remaining = remaining_time()
+                    if remaining is not None and remaining <= 0:
+                        raise DeadlineExceeded("Deadline exceeded while waiting for a request slot")
+                    if self._waiting[0] == entry and self.in_flight < self.max_in_flight:
+                        wait = self.rate_limiter.try_acquire() if self.rate_limiter else 0.0
+                        if not wait:
+                            heapq.heappop(self._waiting)
+                            self.in_flight += 1
+                            self._cond.notify_all()
+                            break
+                        self._cond.wait(wait if remaining is None else min(wait, remaining))
+                    else:
+                        self._cond.wait(remaining)
+            except BaseException:
+                if entry in self._waiting:
+                    self._waiting.remove(entry)
+                    heapq.heapify(self._waiting)
+                    self._cond.notify_all()
+                raise
+        self.wait_times[priority].observe(time.perf_counter() - start)
+
+    def release(self) -> None:
+        """Return a slot taken by `acquire`."""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority: Optional[Priority] = None) -> Iterator[None]:
+        """Context manager wrapping `acquire` and `release`."""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return current scheduler state.
+
+        Returns:
+            dict: In-flight and queued counts plus queue wait percentiles per priority.
+        """
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "wait_times": {p.name.lower(): h.summary() for p, h in self.wait_times.items()},
+        }
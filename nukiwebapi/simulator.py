@@ -0,0 +1,586 @@
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+from nukiwebapi.rate_limit import RateLimiter
+
+Latency = Union[None, float, Tuple[float, float], Callable[[], float]]
+
+# Lock states as reported in ``state.state``.
+LOCKED, UNLOCKING, UNLOCKED, LOCKING, UNLATCHED = 1, 2, 3, 4, 5
+_ACTION_STATES = {1: UNLOCKED, 2: LOCKED, 3: UNLATCHED, 4: LOCKED, 5: LOCKED}
+
+
+def _iso(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class SimulatorState:
+    """
+    In-memory data backing a `FakeNukiServer`.
+
+    Holds smartlocks, authorizations, logs, webhook logs, addresses,
+    reservations and tokens, generated deterministically from `seed`.
+    """
+
+    def __init__(
+        self,
+        locks: int = 10,
+        auths_per_lock: int = 5,
+        logs_per_lock: int = 20,
+        webhook_logs: int = 0,
+        addresses: int = 0,
+        seed: int = 0,
+    ):
+        self.lock = threading.RLock()
+        self.rng = random.Random(seed)
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self.account = {"accountId": 1, "email": "owner@example.com", "name": "Simulated account", "type": 0}
+        self.sub_accounts: List[Dict[str, Any]] = []
+        self.account_users = [
+            {"accountUserId": 1000 + i, "email": f"user{i}@example.com", "name": f"User {i}"}
+            for i in range(max(1, auths_per_lock))
+        ]
+        self.smartlocks: Dict[int, Dict[str, Any]] = {}
+        self.auths: Dict[str, Dict[str, Any]] = {}
+        self.logs: List[Dict[str, Any]] = []
+
+        for n in range(locks):
+            smartlock_id = 0x100000000 + n + 1
+            self.smartlocks[smartlock_id] = {
+                "smartlockId": smartlock_id,
+                "accountId": 1,
+                "type": 4,
+                "name": f"Door {n + 1}",
+                "config": {"name": f"Door {n + 1}"},
+                "state": {"mode": 2, "state": LOCKED, "batteryCritical": False,
+                          "batteryCharge": self.rng.randint(20, 100), "doorState": 2},
+                "serverState": 0,
+                "adminPinState": 0,
+            }
+            for a in range(auths_per_lock):
+                user = self.account_users[a % len(self.account_users)]
+                self._add_auth({
+                    "smartlockId": smartlock_id,
+                    "accountUserId": user["accountUserId"],
+                    "type": 0,
+                    "name": user["name"],
+                    "enabled": True,
+                    "remoteAllowed": True,
+                    "creationDate": _iso(now - timedelta(days=a + 1)),
+                })
+            for i in range(logs_per_lock):
+                self.logs.append({
+                    "id": uuid.UUID(int=self.rng.getrandbits(128)).hex[:24],
+                    "smartlockId": smartlock_id,
+                    "deviceType": 0,
+                    "name": self.account_users[i % len(self.account_users)]["name"],
+                    "action": self.rng.choice([1, 2, 3]),
+                    "trigger": 0,
+                    "state": 0,
+                    "date": _iso(now - timedelta(minutes=i * 7 + n)),
+                })
+        self.logs.sort(key=lambda log: log["date"], reverse=True)
+
+        self.webhook_logs = [
+            {
+                "id": f"{webhook_logs - i:024x}",
+                "apiKeyId": 1,
+                "url": "https://hooks.example.com/nuki",
+                "request": json.dumps({"feature": self.rng.choice(["DEVICE_STATUS", "DEVICE_LOGS", "DEVICE_AUTHS"])}),
+                "responseStatus": 200 if self.rng.random() > 0.05 else 500,
+                "responseTime": self.rng.randint(20, 800),
+                "created": _iso(now - timedelta(seconds=i * 30)),
+            }
+            for i in range(webhook_logs)
+        ]
+
+        lock_ids = list(self.smartlocks)
+        self.addresses: Dict[int, Dict[str, Any]] = {}
+        self.units: Dict[int, List[Dict[str, Any]]] = {}
+        self.reservations: Dict[int, List[Dict[str, Any]]] = {}
+        self.tokens: Dict[str, Dict[str, Any]] = {}
+        for n in range(addresses):
+            address_id = 500 + n
+            self.addresses[address_id] = {
+                "addressId": address_id,
+                "name": f"Address {n + 1}",
+                "smartlockIds": lock_ids[n::addresses] if lock_ids else [],
+                "settings": {},
+            }
+            self.units[address_id] = [
+                {"id": uuid.UUID(int=self.rng.getrandbits(128)).hex, "name": f"Unit {u + 1}"} for u in range(2)
+            ]
+            self.reservations[address_id] = [
+                {"id": f"res-{address_id}-{r}", "addressId": address_id, "state": "ACCEPTED",
+                 "name": f"Guest {r}", "startDate": _iso(now + timedelta(days=r)),
+                 "endDate": _iso(now + timedelta(days=r + 2))}
+                for r in range(2)
+            ]
+            token_id = uuid.UUID(int=self.rng.getrandbits(128)).hex
+            self.tokens[token_id] = {"id": token_id, "addressId": address_id, "redeemed": False}
+
+    def _add_auth(self, auth: Dict[str, Any]) -> Dict[str, Any]:
+        auth_id = uuid.UUID(int=self.rng.getrandbits(128)).hex[:24]
+        auth = {"id": auth_id, "authId": auth_id, "lockCount": 0, **auth}
+        self.auths[auth_id] = auth
+        return auth
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # keep test output quiet
+        pass
+
+    def _handle(self):
+        sim: FakeNukiServer = self.server.simulator
+        parsed = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            return self._send(400, {"detailMessage": "invalid JSON body"})
+
+        status, payload, headers = sim.handle(self.command, parsed.path, query, body, self.headers)
+        self._send(status, payload, headers)
+
+    def _send(self, status: int, payload: Any = None, headers: Optional[Dict[str, str]] = None):
+        data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    do_GET = do_PUT = do_POST = do_DELETE = _handle
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 256  # the default backlog of 5 drops connections under fan-out
+
+
+class FakeNukiServer:
+    """
+    Local HTTP server emulating the Nuki Web API.
+
+    Runs in a background thread on ``127.0.0.1`` so a real `NukiWebAPI`
+    client can talk to it with ``base_url=server.url``, which makes pooling,
+    retry and rate-limit behaviour testable and benchmarkable offline.
+
+    Example:
+        with FakeNukiServer(locks=200, latency=(0.005, 0.02)) as server:
+            client = NukiWebAPI("any-token", base_url=server.url)
+            client.fleet.lock()
+
+    Args:
+        locks (int): Number of simulated smartlocks.
+        auths_per_lock (int): Authorizations generated per smartlock.
+        logs_per_lock (int): Log entries generated per smartlock.
+        webhook_logs (int): Webhook log entries (for API key 1).
+        addresses (int): Addresses, each with units, reservations and a token.
+        latency: Added response latency in seconds: a constant, a
+            ``(min, max)`` uniform range or a callable returning seconds.
+        error_rate (float): Probability of answering with HTTP 500.
+        rate_limit (float, optional): Requests per second before HTTP 429
+            responses (with ``Retry-After``) are returned.
+        action_delay (float): Seconds until lock actions and authorization
+            changes take effect, emulating the asynchronous API.
+        seed (int): Seed for data generation and error injection.
+    """
+
+    def __init__(
+        self,
+        locks: int = 10,
+        auths_per_lock: int = 5,
+        logs_per_lock: int = 20,
+        webhook_logs: int = 0,
+        addresses: int = 0,
+        latency: Latency = None,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        action_delay: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.state = SimulatorState(locks, auths_per_lock, logs_per_lock, webhook_logs, addresses, seed)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.action_delay = action_delay
+        self.request_count = 0
+        self.request_log: List[Tuple[str, str]] = []
+        self._forced_failures: List[int] = []
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._timers: List[threading.Timer] = []
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.simulator = self
+        self._thread: Optional[threading.Thread] = None
+
+    # ---- Lifecycle ----
+    @property
+    def url(self) -> str:
+        """Base URL to pass to `NukiWebAPI`."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeNukiServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="FakeNukiServer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and cancel pending asynchronous changes."""
+        for timer in self._timers:
+            timer.cancel()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeNukiServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ---- Fault injection ----
+    def fail_next(self, count: int = 1, status: int = 500) -> None:
+        """Answer the next `count` requests with `status`."""
+        with self._rng_lock:
+            self._forced_failures.extend([status] * count)
+
+    def _sleep(self) -> None:
+        latency = self.latency
+        if latency is None:
+            return
+        if callable(latency):
+            delay = latency()
+        elif isinstance(latency, tuple):
+            with self._rng_lock:
+                delay = self._rng.uniform(*latency)
+        else:
+            delay = latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def _later(self, func: Callable[[], None]) -> None:
+        if self.action_delay <= 0:
+            with self.state.lock:
+                func()
+            return
+
+        def apply():
+            with self.state.lock:
+                func()
+
+        timer = threading.Timer(self.action_delay, apply)
+        timer.daemon = True
+        self._timers = [t for t in self._timers if t.is_alive()]
+        self._timers.append(timer)
+        timer.start()
+
+    # ---- Dispatch ----
+    def handle(self, method: str, path: str, query: Dict[str, str], body: Any, headers) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Answer one request without going through HTTP.
+
+        Used by the HTTP handler and by `InMemoryTransport`.
+
+        Returns:
+            tuple: ``(status_code, payload, response_headers)``.
+        """
+        with self._rng_lock:
+            self.request_count += 1
+            self.request_log.append((method, path))
+            forced = self._forced_failures.pop(0) if self._forced_failures else None
+            random_error = self.error_rate and self._rng.random() < self.error_rate
+        self._sleep()
+
+        if not (headers.get("Authorization") or "").startswith("Bearer "):
+            return 401, {"detailMessage": "missing bearer token"}, {}
+        if forced is not None:
+            extra = {"Retry-After": "0"} if forced == 429 else {}
+            return forced, {"detailMessage": f"injected {forced}"}, extra
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.try_acquire()
+            if wait:
+                return 429, {"detailMessage": "too many requests"}, {"Retry-After": f"{wait:.3f}"}
+        if random_error:
+            return 500, {"detailMessage": "injected server error"}, {}
+
+        for route_method, pattern, handler in _ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.fullmatch(path)
+            if match:
+                with self.state.lock:
+                    result = handler(self, query, body, *match.groups())
+                if isinstance(result, tuple):
+                    return result[0], result[1], {}
+                return (204, None, {}) if result is None else (200, result, {})
+        return 404, {"detailMessage": f"no route for {method} {path}"}, {}
+
+    # ---- Handlers ----
+    def _lock_or_404(self, smartlock_id: str):
+        return self.state.smartlocks.get(int(smartlock_id))
+
+    def _get_account(self, query, body):
+        return self.state.account
+
+    def _list_sub_accounts(self, query, body):
+        return self.state.sub_accounts
+
+    def _list_account_users(self, query, body):
+        return self.state.account_users
+
+    def _list_smartlocks(self, query, body):
+        return list(self.state.smartlocks.values())
+
+    def _get_smartlock(self, query, body, smartlock_id):
+        lock = self._lock_or_404(smartlock_id)
+        return lock if lock is not None else (404, {"detailMessage": "smartlock not found"})
+
+    def _action(self, query, body, smartlock_id, action=None):
+        lock = self._lock_or_404(smartlock_id)
+        if lock is None:
+            return 404, {"detailMessage": "smartlock not found"}
+        code = {"lock": 2, "unlock": 1}.get(action) or (body or {}).get("action")
+        if code not in _ACTION_STATES:
+            return 400, {"detailMessage": "invalid action"}
+        lock["state"]["state"] = UNLOCKING if code in (1, 3) else LOCKING
+        self._later(lambda: lock["state"].__setitem__("state", _ACTION_STATES[code]))
+        return None
+
+    def _action_advanced(self, query, body, smartlock_id, action=None):
+        result = self._action(query, body, smartlock_id, action)
+        if isinstance(result, tuple):
+            return result
+        return {"requestId": uuid.UUID(int=self.state.rng.getrandbits(128)).hex}
+
+    def _filter_auths(self, auths, query):
+        if "accountUserId" in query:
+            auths = [a for a in auths if str(a.get("accountUserId")) == query["accountUserId"]]
+        if "types" in query:
+            types = {int(t) for t in query["types"].split(",") if t}
+            auths = [a for a in auths if a.get("type") in types]
+        return auths
+
+    def _list_auths(self, query, body):
+        return self._filter_auths(list(self.state.auths.values()), query)
+
+    def _list_auths_paged(self, query, body):
+        auths = self._filter_auths(list(self.state.auths.values()), query)
+        page, size = int(query.get("page", 0)), int(query.get("size", 100))
+        content = auths[page * size:(page + 1) * size]
+        return {
+            "content": content,
+            "number": page,
+            "size": size,
+            "totalElements": len(auths),
+            "totalPages": (len(auths) + size - 1) // size if size else 0,
+        }
+
+    def _create_auths(self, smartlock_ids, body):
+        fields = {k: v for k, v in body.items() if k != "smartlockIds"}
+        created = _iso(datetime.now(timezone.utc))
+
+        def apply():
+            for smartlock_id in smartlock_ids:
+                self.state._add_auth({"smartlockId": smartlock_id, "enabled": True, "creationDate": created, **fields})
+
+        self._later(apply)
+
+    def _create_auth_many(self, query, body):
+        if not isinstance(body, dict) or not body.get("smartlockIds"):
+            return 400, {"detailMessage": "smartlockIds required"}
+        self._create_auths([int(s) for s in body["smartlockIds"]], body)
+        return None
+
+    def _create_auth_single(self, query, body, smartlock_id):
+        if self._lock_or_404(smartlock_id) is None:
+            return 404, {"detailMessage": "smartlock not found"}
+        self._create_auths([int(smartlock_id)], body or {})
+        return None
+
+    def _update_auths(self, query, body):
+        updates = [dict(u) for u in body or []]
+        self._later(lambda: [self.state.auths[u.pop("id")].update(u) for u in updates if u.get("id") in self.state.auths])
+        return None
+
+    def _delete_auths(self, query, body):
+        ids = list(body or [])
+        self._later(lambda: [self.state.auths.pop(i, None) for i in ids])
+        return None
+
+    def _list_auths_for_smartlock(self, query, body, smartlock_id):
+        auths = [a for a in self.state.auths.values() if a["smartlockId"] == int(smartlock_id)]
+        return self._filter_auths(auths, query)
+
+    def _get_auth(self, query, body, smartlock_id, auth_id):
+        auth = self.state.auths.get(auth_id)
+        return auth if auth is not None else (404, {"detailMessage": "auth not found"})
+
+    def _update_auth(self, query, body, smartlock_id, auth_id):
+        if auth_id not in self.state.auths:
+            return 404, {"detailMessage": "auth not found"}
+        changes = dict(body or {})
+        self._later(lambda: self.state.auths.get(auth_id, {}).update(changes))
+        return None
+
+    def _delete_auth(self, query, body, smartlock_id, auth_id):
+        self._later(lambda: self.state.auths.pop(auth_id, None))
+        return None
+
+    @staticmethod
+    def _page_by_cursor(items, query, default_limit, max_limit):
+        limit = min(int(query.get("limit", default_limit)), max_limit)
+        cursor = query.get("id")
+        start = 0
+        if cursor:
+            ids = [item["id"] for item in items]
+            start = ids.index(cursor) + 1 if cursor in ids else len(items)
+        return items[start:start + limit]
+
+    def _list_logs(self, query, body, smartlock_id=None):
+        logs = self.state.logs
+        if smartlock_id is not None:
+            logs = [log for log in logs if log["smartlockId"] == int(smartlock_id)]
+        if "action" in query:
+            logs = [log for log in logs if str(log["action"]) == query["action"]]
+        return self._page_by_cursor(logs, query, 20, 50)
+
+    def _webhook_logs(self, query, body, api_key_id):
+        return self._page_by_cursor(self.state.webhook_logs, query, 50, 100)
+
+    def _list_addresses(self, query, body):
+        return list(self.state.addresses.values())
+
+    def _create_address(self, query, body):
+        address_id = max(self.state.addresses, default=499) + 1
+        address = {"addressId": address_id, "settings": {}, **(body or {})}
+        self.state.addresses[address_id] = address
+        self.state.units[address_id] = []
+        self.state.reservations[address_id] = []
+        return address
+
+    def _update_address(self, query, body, address_id):
+        address = self.state.addresses.get(int(address_id))
+        if address is None:
+            return 404, {"detailMessage": "address not found"}
+        address.update(body or {})
+        return address
+
+    def _delete_address(self, query, body, address_id):
+        self.state.addresses.pop(int(address_id), None)
+        return {}
+
+    def _list_units(self, query, body, address_id):
+        return self.state.units.get(int(address_id), [])
+
+    def _create_unit(self, query, body, address_id):
+        if int(address_id) not in self.state.addresses:
+            return 404, {"detailMessage": "address not found"}
+        unit = {"id": uuid.UUID(int=self.state.rng.getrandbits(128)).hex, "name": (body or {}).get("name")}
+        self.state.units[int(address_id)].append(unit)
+        return unit
+
+    def _delete_units(self, query, body, address_id, unit_id=None):
+        ids = {unit_id} if unit_id else set(body or [])
+        units = self.state.units.get(int(address_id), [])
+        self.state.units[int(address_id)] = [u for u in units if u["id"] not in ids]
+        return {"requestId": uuid.UUID(int=self.state.rng.getrandbits(128)).hex, "errors": []}
+
+    def _list_reservations(self, query, body, address_id):
+        return self.state.reservations.get(int(address_id), [])
+
+    def _reservation_op(self, query, body, address_id, reservation_id, op):
+        reservations = self.state.reservations.get(int(address_id), [])
+        reservation = next((r for r in reservations if r["id"] == reservation_id), None)
+        if reservation is None:
+            return 404, {"detailMessage": "reservation not found"}
+        if op == "issue":
+            reservation["authsIssued"] = True
+        elif op == "revoke":
+            reservation["authsIssued"] = False
+        else:
+            reservation["accessTimes"] = body
+        return None
+
+    def _list_tokens(self, query, body, address_id):
+        return [t for t in self.state.tokens.values() if t["addressId"] == int(address_id)]
+
+    def _get_token(self, query, body, token_id, redeem=None):
+        token = self.state.tokens.get(token_id)
+        return token if token is not None else (404, {"detailMessage": "token not found"})
+
+    def _redeem_token(self, query, body, token_id):
+        token = self.state.tokens.get(token_id)
+        if token is None:
+            return 404, {"detailMessage": "token not found"}
+        token["redeemed"] = True
+        return token
+
+
+_ID = r"(\d+)"
+_ROUTES: List[Tuple[str, "re.Pattern", Callable]] = [
+    (method, re.compile(pattern), handler)
+    for method, pattern, handler in [
+        ("GET", r"/account", FakeNukiServer._get_account),
+        ("GET", r"/account/sub", FakeNukiServer._list_sub_accounts),
+        ("GET", r"/account/user", FakeNukiServer._list_account_users),
+        ("GET", r"/smartlock", FakeNukiServer._list_smartlocks),
+        ("GET", r"/smartlock/auth", FakeNukiServer._list_auths),
+        ("PUT", r"/smartlock/auth", FakeNukiServer._create_auth_many),
+        ("POST", r"/smartlock/auth", FakeNukiServer._update_auths),
+        ("DELETE", r"/smartlock/auth", FakeNukiServer._delete_auths),
+        ("GET", r"/smartlock/auth/paged", FakeNukiServer._list_auths_paged),
+        ("GET", r"/smartlock/log", FakeNukiServer._list_logs),
+        ("GET", rf"/smartlock/{_ID}", FakeNukiServer._get_smartlock),
+        ("POST", rf"/smartlock/{_ID}/action", FakeNukiServer._action),
+        ("POST", rf"/smartlock/{_ID}/action/(lock|unlock)", FakeNukiServer._action),
+        ("POST", rf"/smartlock/{_ID}/action/advanced", FakeNukiServer._action_advanced),
+        ("POST", rf"/smartlock/{_ID}/action/(lock|unlock)/advanced", FakeNukiServer._action_advanced),
+        ("GET", rf"/smartlock/{_ID}/auth", FakeNukiServer._list_auths_for_smartlock),
+        ("PUT", rf"/smartlock/{_ID}/auth", FakeNukiServer._create_auth_single),
+        ("GET", rf"/smartlock/{_ID}/auth/(\w+)", FakeNukiServer._get_auth),
+        ("POST", rf"/smartlock/{_ID}/auth/(\w+)", FakeNukiServer._update_auth),
+        ("DELETE", rf"/smartlock/{_ID}/auth/(\w+)", FakeNukiServer._delete_auth),
+        ("GET", rf"/smartlock/{_ID}/log", FakeNukiServer._list_logs),
+        ("GET", rf"/api/key/{_ID}/webhook/logs", FakeNukiServer._webhook_logs),
+        ("GET", r"/address", FakeNukiServer._list_addresses),
+        ("PUT", r"/address", FakeNukiServer._create_address),
+        ("POST", rf"/address/{_ID}", FakeNukiServer._update_address),
+        ("DELETE", rf"/address/{_ID}", FakeNukiServer._delete_address),
+        ("GET", rf"/address/{_ID}/unit", FakeNukiServer._list_units),
+        ("PUT", rf"/address/{_ID}/unit", FakeNukiServer._create_unit),
+        ("DELETE", rf"/address/{_ID}/unit", FakeNukiServer._delete_units),
+        ("DELETE", rf"/address/{_ID}/unit/(\w+)", FakeNukiServer._delete_units),
+        ("GET", rf"/address/{_ID}/reservation", FakeNukiServer._list_reservations),
+        ("POST", rf"/address/{_ID}/reservation/([\w-]+)/(issue|revoke)", FakeNukiServer._reservation_op),
+        ("POST", rf"/address/{_ID}/reservation/([\w-]+)/update/(accesstimes)", FakeNukiServer._reservation_op),
+        ("GET", rf"/address/{_ID}/token", FakeNukiServer._list_tokens),
+        ("GET", r"/address/token/(\w+)", FakeNukiServer._get_token),
+        ("GET", r"/address/token/(\w+)/(redeem)", FakeNukiServer._get_token),
+        ("POST", r"/address/token/(\w+)/redeem", FakeNukiServer._redeem_token),
+    ]
+]
@@ -1,5 +1,6 @@
 from typing import Any
 
+from nukiwebapi.scheduler import interactive
 from nukiwebapi.smartlock_instance import SmartlockInstance
 
 
@@ -43,7 +44,7 @@ class Smartlock:
         # Fetch the full smartlock data
         data = self.client._request("GET", f"/smartlock/{smartlock_id}").json()
         # Wrap in SmartlockInstance, preserving all API fields
-        return SmartlockInstance(self, smartlock_id, data=data)
+        return SmartlockInstance(self.client, smartlock_id, data=data)
 
     def update_smartlock(self, smartlock_id: int, data: dict[str, Any] | None = None) -> None:
         """Update a smartlock.
@@ -72,6 +73,7 @@ class Smartlock:
         """
         return self.client._request("DELETE", f"/smartlock/{smartlock_id}")
 
+    @interactive
     def action(self, smartlock_id: int, data: dict[str, Any] | None = None) -> None:
         """Perform an action on a smartlock.
 
@@ -86,6 +88,7 @@ class Smartlock:
         """
         return self.client._request("POST", f"/smartlock/{smartlock_id}/action", json=data or {})
 
+    @interactive
     def lock_smartlock(self, smartlock_id: int) -> None:
         """Lock a smartlock.
 
@@ -99,6 +102,7 @@ class Smartlock:
         """
         return self.client._request("POST", f"/smartlock/{smartlock_id}/action/lock")
 
+    @interactive
     def unlock_smartlock(self, smartlock_id: int) -> None:
         """Unlock a smartlock.
 
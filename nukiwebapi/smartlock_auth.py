@@ -1,4 +1,102 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+#: Optional authorization fields: keyword argument -> API field.
+AUTH_FIELDS = {
+    "name": "name",
+    "allowed_from_date": "allowedFromDate",
+    "allowed_until_date": "allowedUntilDate",
+    "allowed_week_days": "allowedWeekDays",
+    "allowed_from_time": "allowedFromTime",
+    "allowed_until_time": "allowedUntilTime",
+    "account_user_id": "accountUserId",
+    "smart_actions_enabled": "smartActionsEnabled",
+    "enabled": "enabled",
+    "remote_allowed": "remoteAllowed",
+    "type": "type",
+    "code": "code",
+}
+
+
+def _add_fields(payload: Dict[str, Any], **fields: Any) -> Dict[str, Any]:
+    """Copy the fields that are not None into `payload` under their API names."""
+    for key, value in fields.items():
+        if value is not None:
+            payload[AUTH_FIELDS[key]] = value
+    return payload
+
+
+_CREATE_FIELDS = frozenset(AUTH_FIELDS) - {"enabled"}
+
+
+def _spec_payload(index: int, spec: Dict[str, Any]) -> Tuple[List[int], Dict[str, Any]]:
+    fields = dict(spec)
+    smartlock_ids = fields.pop("smartlock_ids", None)
+    if "smartlock_id" in fields:
+        smartlock_ids = [fields.pop("smartlock_id")] + list(smartlock_ids or [])
+    if not smartlock_ids:
+        raise ValueError(f"Auth spec {index}: smartlock_id or smartlock_ids is required")
+    unknown = fields.keys() - _CREATE_FIELDS
+    if unknown:
+        raise ValueError(f"Auth spec {index}: unknown fields {sorted(unknown)}")
+    name = fields.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"Auth spec {index}: name is required")
+    fields.setdefault("remote_allowed", False)
+    fields.setdefault("type", 0)
+    if fields["type"] == 13:
+        from nukiwebapi.keypad import validate_code
+
+        if fields.get("code") is None:
+            raise ValueError(f"Auth spec {index}: keypad authorizations (type 13) need a code")
+        fields["code"] = validate_code(fields["code"])
+    week_days = fields.get("allowed_week_days")
+    if week_days is not None and not 0 <= week_days <= 127:
+        raise ValueError(f"Auth spec {index}: allowed_week_days must be a bitmask between 0 and 127")
+    for key in ("allowed_from_time", "allowed_until_time"):
+        if fields.get(key) is not None and not 0 <= fields[key] < 1440:
+            raise ValueError(f"Auth spec {index}: {key} must be minutes of the day (0-1439)")
+    return list(smartlock_ids), _add_fields({}, **fields)
+
+
+def build_bulk_payloads(specs: Iterable[Dict[str, Any]], max_locks_per_request: int = 100) -> List[Dict[str, Any]]:
+    """
+    Validate authorization specs and merge them into ``PUT /smartlock/auth`` payloads.
+
+    A spec is a dict of `create_auth_for_smartlocks` keyword arguments with
+    ``smartlock_id`` and/or ``smartlock_ids``. Specs that only differ in their
+    smartlocks share one payload whose ``smartlockIds`` lists all of them, up
+    to `max_locks_per_request` per payload. An identical spec given twice for
+    the same smartlock stays two authorizations.
+
+    Args:
+        specs (iterable[dict]): Authorization specs.
+        max_locks_per_request (int): Maximum ``smartlockIds`` per payload.
+
+    Returns:
+        list[dict]: Payloads, in order of their first spec.
+
+    Raises:
+        ValueError: If a spec is invalid; nothing is built in that case.
+    """
+    if max_locks_per_request < 1:
+        raise ValueError("max_locks_per_request must be at least 1")
+    groups: Dict[Tuple, List[Tuple[List[int], set]]] = {}
+    order: List[Tuple[Dict[str, Any], List[int]]] = []
+    for index, spec in enumerate(specs):
+        smartlock_ids, payload = _spec_payload(index, spec)
+        key = tuple(sorted(payload.items()))
+        buckets = groups.setdefault(key, [])
+        for smartlock_id in smartlock_ids:
+            for ids, seen in buckets:
+                if smartlock_id not in seen and len(ids) < max_locks_per_request:
+                    break
+            else:
+                ids, seen = [], set()
+                buckets.append((ids, seen))
+                order.append((payload, ids))
+            ids.append(smartlock_id)
+            seen.add(smartlock_id)
+    return [{**payload, "smartlockIds": ids} for payload, ids in order]
 
 
 class SmartlockAuth:
@@ -60,25 +158,69 @@ class SmartlockAuth:
             "remoteAllowed": remote_allowed,
             "type": type,
         }
-        if allowed_from_date is not None:
-            payload["allowedFromDate"] = allowed_from_date
-        if allowed_until_date is not None:
-            payload["allowedUntilDate"] = allowed_until_date
-        if allowed_week_days is not None:
-            payload["allowedWeekDays"] = allowed_week_days
-        if allowed_from_time is not None:
-            payload["allowedFromTime"] = allowed_from_time
-        if allowed_until_time is not None:
-            payload["allowedUntilTime"] = allowed_until_time
-        if account_user_id is not None:
-            payload["accountUserId"] = account_user_id
-        if smart_actions_enabled is not None:
-            payload["smartActionsEnabled"] = smart_actions_enabled
-        if code is not None:
-            payload["code"] = code
+        _add_fields(
+            payload,
+            allowed_from_date=allowed_from_date,
+            allowed_until_date=allowed_until_date,
+            allowed_week_days=allowed_week_days,
+            allowed_from_time=allowed_from_time,
+            allowed_until_time=allowed_until_time,
+            account_user_id=account_user_id,
+            smart_actions_enabled=smart_actions_enabled,
+            code=code,
+        )
 
         self.client._request("PUT", "/smartlock/auth", json=payload)
 
+    def create_auths_bulk(
+        self,
+        specs: Iterable[Dict[str, Any]],
+        max_locks_per_request: int = 100,
+        max_workers: int = 4,
+        rate_limiter=None,
+        retries: int = 0,
+        backoff: float = 0.5,
+    ) -> List[Any]:
+        """Create many authorizations with as few requests as possible.
+
+        Specs are validated and merged with `build_bulk_payloads`; the
+        resulting ``PUT /smartlock/auth`` calls run concurrently via
+        `run_batch`. Creation stays asynchronous on the server side (see
+        `AuthOperationTracker` to wait for it).
+
+        Creating authorizations is not idempotent: after a timeout or a 5xx
+        response the server may already have accepted the request, and a
+        retry would create duplicates on every lock of the payload (colliding
+        keypad codes included). Retries are therefore off by default.
+
+        Args:
+            specs (iterable[dict]): Authorization specs, e.g.
+                ``{"smartlock_id": 1, "name": "Guest", "type": 13, "code": 245678}``.
+            max_locks_per_request (int): Maximum ``smartlockIds`` per request.
+            max_workers (int): Concurrent requests.
+            rate_limiter (RateLimiter, optional): Limits the request rate.
+            retries (int): Retries per request for transient errors. Only
+                enable them if duplicate authorizations are acceptable.
+            backoff (float): Base delay in seconds between retries.
+
+        Returns:
+            list[BatchItemResult]: One result per request; `item` is its payload.
+
+        Raises:
+            ValueError: If a spec is invalid; no request is sent in that case.
+        """
+        from nukiwebapi.batch import run_batch
+
+        payloads = build_bulk_payloads(specs, max_locks_per_request)
+        return run_batch(
+            lambda payload: self.client._request("PUT", "/smartlock/auth", json=payload),
+            payloads,
+            max_workers=max_workers,
+            rate_limiter=rate_limiter,
+            retries=retries,
+            backoff=backoff,
+        )
+
     def update_auths_bulk(self, auth_list: List[Dict[str, Any]]) -> None:
         """Update multiple authorizations asynchronously (POST /smartlock/auth).
 
@@ -142,22 +284,17 @@ class SmartlockAuth:
             "remoteAllowed": remote_allowed,
             "type": type,
         }
-        if allowed_from_date is not None:
-            payload["allowedFromDate"] = allowed_from_date
-        if allowed_until_date is not None:
-            payload["allowedUntilDate"] = allowed_until_date
-        if allowed_week_days is not None:
-            payload["allowedWeekDays"] = allowed_week_days
-        if allowed_from_time is not None:
-            payload["allowedFromTime"] = allowed_from_time
-        if allowed_until_time is not None:
-            payload["allowedUntilTime"] = allowed_until_time
-        if account_user_id is not None:
-            payload["accountUserId"] = account_user_id
-        if smart_actions_enabled is not None:
-            payload["smartActionsEnabled"] = smart_actions_enabled
-        if code is not None:
-            payload["code"] = code
+        _add_fields(
+            payload,
+            allowed_from_date=allowed_from_date,
+            allowed_until_date=allowed_until_date,
+            allowed_week_days=allowed_week_days,
+            allowed_from_time=allowed_from_time,
+            allowed_until_time=allowed_until_time,
+            account_user_id=account_user_id,
+            smart_actions_enabled=smart_actions_enabled,
+            code=code,
+        )
 
         self.client._request("PUT", f"/smartlock/{smartlock_id}/auth", json=payload)
 
@@ -194,26 +331,19 @@ class SmartlockAuth:
             None
         """
         payload = {}
-        if name is not None:
-            payload["name"] = name
-        if allowed_from_date is not None:
-            payload["allowedFromDate"] = allowed_from_date
-        if allowed_until_date is not None:
-            payload["allowedUntilDate"] = allowed_until_date
-        if allowed_week_days is not None:
-            payload["allowedWeekDays"] = allowed_week_days
-        if allowed_from_time is not None:
-            payload["allowedFromTime"] = allowed_from_time
-        if allowed_until_time is not None:
-            payload["allowedUntilTime"] = allowed_until_time
-        if account_user_id is not None:
-            payload["accountUserId"] = account_user_id
-        if enabled is not None:
-            payload["enabled"] = enabled
-        if remote_allowed is not None:
-            payload["remoteAllowed"] = remote_allowed
-        if code is not None:
-            payload["code"] = code
+        _add_fields(
+            payload,
+            name=name,
+            allowed_from_date=allowed_from_date,
+            allowed_until_date=allowed_until_date,
+            allowed_week_days=allowed_week_days,
+            allowed_from_time=allowed_from_time,
+            allowed_until_time=allowed_until_time,
+            account_user_id=account_user_id,
+            enabled=enabled,
+            remote_allowed=remote_allowed,
+            code=code,
+        )
 
         self.client._request("POST", f"/smartlock/{smartlock_id}/auth/{auth_id}", json=payload)
 
@@ -246,18 +376,15 @@ class SmartlockAuth:
             None
         """
         payload = {"name": name}
-        if allowed_from_date is not None:
-            payload["allowedFromDate"] = allowed_from_date
-        if allowed_until_date is not None:
-            payload["allowedUntilDate"] = allowed_until_date
-        if allowed_week_days is not None:
-            payload["allowedWeekDays"] = allowed_week_days
-        if allowed_from_time is not None:
-            payload["allowedFromTime"] = allowed_from_time
-        if allowed_until_time is not None:
-            payload["allowedUntilTime"] = allowed_until_time
-        if account_user_id is not None:
-            payload["accountUserId"] = account_user_id
+        _add_fields(
+            payload,
+            allowed_from_date=allowed_from_date,
+            allowed_until_date=allowed_until_date,
+            allowed_week_days=allowed_week_days,
+            allowed_from_time=allowed_from_time,
+            allowed_until_time=allowed_until_time,
+            account_user_id=account_user_id,
+        )
 
         self.client._request(
             "POST",
@@ -286,3 +413,33 @@ class SmartlockAuth:
             params["types"] = types
 
         return self.client._request("GET", "/smartlock/auth/paged", params=params)
+
+    def iter_auths(
+        self,
+        page_size: int = 100,
+        account_user_id: Optional[int] = None,
+        types: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all authorizations of the account.
+
+        Pages are fetched on demand via `list_auths_paged`, so memory stays
+        bounded by `page_size` even for accounts with many authorizations.
+
+        Args:
+            page_size (int): Authorizations per request.
+            account_user_id (int, optional): Filter by account user ID.
+            types (str, optional): Comma-separated authorization types, e.g., '13'.
+
+        Yields:
+            dict: SmartlockAuth objects.
+        """
+        page = 0
+        while True:
+            data = self.list_auths_paged(page=page, size=page_size, account_user_id=account_user_id, types=types).json()
+            content = data.get("content", []) if isinstance(data, dict) else data
+            yield from content
+            if len(content) < page_size:
+                return
+            if isinstance(data, dict) and data.get("totalPages") is not None and page + 1 >= data["totalPages"]:
+                return
+            page += 1
@@ -1,5 +1,17 @@
 from typing import Any, Dict, Optional
 
+from nukiwebapi.scheduler import interactive
+from nukiwebapi.tracing import traced
+
+_ACTION_NAMES = {1: "unlock", 2: "lock", 3: "unlatch", 4: "lock_and_go", 5: "lock_and_go_unlatch"}
+
+
+def _action_attributes(instance, action: int, option: Optional[int] = None) -> Dict[str, Any]:
+    attributes = {"nuki.smartlock_id": instance.id, "nuki.action": action}
+    if option is not None:
+        attributes["nuki.option"] = option
+    return attributes
+
 
 class SmartlockInstance:
     """
@@ -61,6 +73,11 @@ class SmartlockInstance:
 
     # --- Internal action helper ---
 
+    @traced(
+        lambda self, action, option=None: f"smartlock.{_ACTION_NAMES.get(action, 'action')}",
+        _action_attributes,
+    )
+    @interactive
     def _action(self, action: int, option: Optional[int] = None) -> Dict[str, Any]:
         """
         Send an action command to the smartlock.
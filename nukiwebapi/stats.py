@@ -0,0 +1,135 @@
+import bisect
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def _exponential_bounds(start: float, factor: float, limit: float) -> List[float]:
+    bounds = []
+    value = start
+    while value < limit:
+        bounds.append(round(value, 6))
+        value *= factor
+    bounds.append(limit)
+    return bounds
+
+
+#: Default bucket upper bounds (in seconds) used for latency histograms.
+DEFAULT_LATENCY_BUCKETS: List[float] = _exponential_bounds(0.0005, 1.25, 120.0)
+
+
+class Histogram:
+    """
+    Streaming histogram with fixed bucket boundaries.
+
+    Observations are folded into buckets as they arrive, so memory use is
+    constant no matter how many values are recorded. Percentiles are estimated
+    by interpolating inside the bucket that contains the requested rank.
+    """
+
+    def __init__(self, bounds: Optional[Iterable[float]] = None):
+        self.bounds: List[float] = sorted(bounds) if bounds is not None else list(DEFAULT_LATENCY_BUCKETS)
+        self._counts = [0] * (len(self.bounds) + 1)  # last slot is the +Inf bucket
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        """
+        Record a single observation.
+
+        Args:
+            value (float): The observed value (e.g. a duration in seconds).
+        """
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Fold another histogram with identical bounds into this one.
+
+        Args:
+            other (Histogram): Histogram to merge.
+        """
+        if other.bounds != self.bounds:
+            raise ValueError("cannot merge histograms with different bounds")
+        with self._lock:
+            for i, c in enumerate(other._counts):
+                self._counts[i] += c
+            self.count += other.count
+            self.sum += other.sum
+            if other.min is not None and (self.min is None or other.min < self.min):
+                self.min = other.min
+            if other.max is not None and (self.max is None or other.max > self.max):
+                self.max = other.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Return the arithmetic mean of all observations, if any."""
+        return self.sum / self.count if self.count else None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-th percentile.
+
+        Args:
+            q (float): Percentile between 0 and 100.
+
+        Returns:
+            float or None: Estimated value, or None if nothing was observed.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100")
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(1, math.ceil(q / 100 * self.count))
+            cumulative = 0
+            for index, bucket_count in enumerate(self._counts):
+                if cumulative + bucket_count >= rank:
+                    lower = self.bounds[index - 1] if index > 0 else self.min
+                    upper = self.bounds[index] if index < len(self.bounds) else self.max
+                    lower = max(lower, self.min)
+                    upper = min(upper, self.max)
+                    fraction = (rank - cumulative) / bucket_count
+                    return lower + (upper - lower) * fraction
+                cumulative += bucket_count
+        return self.max
+
+    def percentiles(self, qs: Iterable[float] = (50, 90, 99)) -> Dict[str, Optional[float]]:
+        """Return a ``{"p50": ..., "p90": ...}`` mapping for the given percentiles."""
+        return {f"p{q:g}": self.percentile(q) for q in qs}
+
+    def cumulative_buckets(self) -> List[tuple]:
+        """
+        Return ``(upper_bound, cumulative_count)`` pairs, Prometheus style.
+
+        The final pair uses ``math.inf`` as its upper bound.
+        """
+        with self._lock:
+            result = []
+            running = 0
+            for bound, c in zip(self.bounds + [math.inf], self._counts):
+                running += c
+                result.append((bound, running))
+            return result
+
+    def summary(self) -> Dict[str, Any]:
+        """Return count, sum, min, max, mean and p50/p90/p99 as a dict."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            **self.percentiles(),
+        }
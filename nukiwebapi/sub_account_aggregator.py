@@ -0,0 +1,153 @@
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from nukiwebapi.batch import iter_batch
+from nukiwebapi.stats import Histogram
+
+#: Built-in resources and how to fetch them from a sub-account client.
+RESOURCES: Dict[str, Callable[[Any], List[Dict[str, Any]]]] = {
+    "smartlocks": lambda c: c.smartlock.list_smartlocks(),
+    "auths": lambda c: c.smartlock_auth.list_auths(),
+    "logs": lambda c: c.smartlock_log.list_logs().json(),
+    "account_users": lambda c: c.account_user.list_account_users(),
+    "addresses": lambda c: c.address.list_addresses(),
+}
+
+
+class AggregatedItem:
+    """
+    A single resource entry tagged with the sub-account it belongs to.
+
+    Attributes:
+        account_id (int): ID of the sub-account.
+        resource (str): Resource name, e.g. ``"smartlocks"``.
+        data (dict): The entry as returned by the API.
+    """
+
+    __slots__ = ("account_id", "resource", "data")
+
+    def __init__(self, account_id: int, resource: str, data: Dict[str, Any]):
+        self.account_id = account_id
+        self.resource = resource
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"AggregatedItem(account_id={self.account_id!r}, resource={self.resource!r})"
+
+
+class AggregationMetrics:
+    """Throughput counters for an aggregation run."""
+
+    def __init__(self):
+        self.requests = 0
+        self.failed = 0
+        self.items = 0
+        self.elapsed = 0.0
+        self.latency: Dict[str, Histogram] = {}
+
+    def summary(self) -> Dict[str, Any]:
+        """Return request/item counts, throughput and fetch latency per resource."""
+        return {
+            "requests": self.requests,
+            "failed": self.failed,
+            "items": self.items,
+            "elapsed": self.elapsed,
+            "items_per_second": self.items / self.elapsed if self.elapsed else None,
+            "latency": {name: h.summary() for name, h in self.latency.items()},
+        }
+
+
+class SubAccountAggregator:
+    """
+    Gather resources of all sub-accounts into one account-tagged stream.
+
+    Sub-accounts are enumerated with `Account.list_sub_accounts`. Every
+    (sub-account, resource) pair is fetched concurrently through a client for
+    that sub-account; a failure only affects its own pair and is recorded in
+    `errors`.
+
+    Args:
+        client (NukiWebAPI): Client of the parent account.
+        client_for: Resolves a sub-account to the `NukiWebAPI` client used to
+            read its resources. Either a callable taking the sub-account dict,
+            a mapping or `NukiWebAPIPool` keyed by ``accountId``.
+        max_workers (int): Maximum number of concurrent fetches.
+    """
+
+    def __init__(self, client, client_for, max_workers: int = 8):
+        self.client = client
+        self.client_for = client_for
+        self.max_workers = max_workers
+        self.errors: Dict[Tuple[int, str], BaseException] = {}
+        self.metrics = AggregationMetrics()
+
+    def _resolve(self, sub_account: Dict[str, Any]):
+        if callable(self.client_for):
+            return self.client_for(sub_account)
+        return self.client_for[sub_account["accountId"]]
+
+    def sub_accounts(self, email: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the sub-accounts of the parent account."""
+        return self.client.account.list_sub_accounts(email=email)
+
+    def iter(
+        self,
+        resources: Iterable[str] = ("smartlocks", "auths"),
+        sub_accounts: Optional[List[Dict[str, Any]]] = None,
+    ) -> Iterator[AggregatedItem]:
+        """
+        Stream resources of all sub-accounts as they arrive.
+
+        Args:
+            resources (iterable[str]): Names from `RESOURCES`, or custom
+                ``(name, fetch)`` pairs where ``fetch(client)`` returns a list.
+            sub_accounts (list[dict], optional): Sub-accounts to include.
+                Defaults to all of them.
+
+        Yields:
+            AggregatedItem: Entries tagged with account ID and resource name,
+            in completion order.
+        """
+        fetchers = []
+        for resource in resources:
+            if isinstance(resource, tuple):
+                fetchers.append(resource)
+            else:
+                fetchers.append((resource, RESOURCES[resource]))
+        if sub_accounts is None:
+            sub_accounts = self.sub_accounts()
+
+        tasks = [(sub, name, fetch) for sub in sub_accounts for name, fetch in fetchers]
+        self.errors = {}
+        self.metrics = AggregationMetrics()
+        start = time.perf_counter()
+
+        def run(task):
+            sub, _, fetch = task
+            return fetch(self._resolve(sub))
+
+        for result in iter_batch(run, tasks, max_workers=self.max_workers):
+            sub, name, _ = result.item
+            account_id = sub.get("accountId")
+            self.metrics.requests += 1
+            self.metrics.latency.setdefault(name, Histogram()).observe(result.duration)
+            if not result.ok:
+                self.metrics.failed += 1
+                self.errors[(account_id, name)] = result.error
+                continue
+            for entry in result.result or []:
+                self.metrics.items += 1
+                yield AggregatedItem(account_id, name, entry)
+        self.metrics.elapsed = time.perf_counter() - start
+
+    def gather(self, resources: Iterable[str] = ("smartlocks", "auths"), **kwargs) -> Dict[str, List[AggregatedItem]]:
+        """
+        Collect `iter` into lists grouped by resource name.
+
+        Returns:
+            dict: Resource name to the list of tagged items across all sub-accounts.
+        """
+        grouped: Dict[str, List[AggregatedItem]] = {}
+        for item in self.iter(resources, **kwargs):
+            grouped.setdefault(item.resource, []).append(item)
+        return grouped
@@ -0,0 +1,192 @@
+import functools
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+
+class Tracer:
+    """
+    Base tracer interface used by `NukiWebAPI`.
+
+    Subclasses implement `start_span` as a context manager yielding an object
+    with ``set_attribute(key, value)`` and ``record_exception(exc)``.
+    The client skips all tracing work when `enabled` is False.
+    """
+
+    enabled = False
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        yield _NOOP_SPAN
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        """Add trace propagation headers for the current span to `headers`."""
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+#: Default tracer: disabled, adds no per-request work.
+NOOP_TRACER = Tracer()
+
+
+class Span:
+    """
+    A finished or in-progress span recorded by `RecordingTracer`.
+
+    Attributes:
+        name (str): Operation name.
+        trace_id (str): 32 hex digit trace ID shared by the whole tree.
+        span_id (str): 16 hex digit ID of this span.
+        parent_id (str, optional): ID of the parent span.
+        attributes (dict): Span attributes.
+        start_time (float): Start timestamp (`time.time()`).
+        end_time (float, optional): End timestamp.
+        status (str): ``"OK"`` or ``"ERROR"``.
+        events (list[dict]): Recorded exceptions.
+    """
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes)
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+        self.status = "OK"
+        self.events: List[Dict[str, Any]] = []
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Span duration in seconds, once finished."""
+        return None if self.end_time is None else self.end_time - self.start_time
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status = "ERROR"
+        self.events.append({"name": "exception", "type": type(exc).__name__, "message": str(exc)})
+
+    def __repr__(self) -> str:
+        return f"Span(name={self.name!r}, span_id={self.span_id!r}, parent_id={self.parent_id!r})"
+
+
+class RecordingTracer(Tracer):
+    """
+    In-memory tracer that keeps finished spans in `spans`.
+
+    Parent/child relationships follow the current context, including worker
+    threads started through `nukiwebapi.batch`. Outgoing requests carry a W3C
+    ``traceparent`` header for the active span.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._current: ContextVar[Optional[Span]] = ContextVar(f"nukiwebapi_span_{id(self)}", default=None)
+        self._lock = threading.Lock()
+
+    @property
+    def current_span(self) -> Optional[Span]:
+        """The span active in the current context, if any."""
+        return self._current.get()
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        parent = self._current.get()
+        span = Span(
+            name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes or {},
+        )
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            span.end_time = time.time()
+            self._current.reset(token)
+            with self._lock:
+                self.spans.append(span)
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        span = self._current.get()
+        if span is not None:
+            headers["traceparent"] = f"00-{span.trace_id}-{span.span_id}-01"
+
+    def children(self, span: Span) -> List[Span]:
+        """Return the finished direct children of `span`."""
+        return [s for s in self.spans if s.parent_id == span.span_id]
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Tracer backed by OpenTelemetry (requires ``opentelemetry-api``).
+
+    Args:
+        tracer (opentelemetry.trace.Tracer, optional): Tracer to use. Defaults
+            to ``trace.get_tracer("nukiwebapi")``.
+    """
+
+    enabled = True
+
+    def __init__(self, tracer=None):
+        try:
+            from opentelemetry import propagate, trace
+        except ImportError as e:
+            raise ImportError("OpenTelemetryTracer requires the 'opentelemetry-api' package") from e
+        self._tracer = tracer or trace.get_tracer("nukiwebapi")
+        self._propagate = propagate
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        self._propagate.inject(headers)
+
+
+def traced(name: Union[str, Callable[..., str]], attributes: Optional[Callable[..., Dict[str, Any]]] = None):
+    """
+    Decorator wrapping a sub-client method in a span.
+
+    The tracer is taken from ``self.client.tracer``; when it is missing or
+    disabled the method is called directly.
+
+    Args:
+        name (str or callable): Span name, or ``name(self, *args, **kwargs)``.
+        attributes (callable, optional): ``attributes(self, *args, **kwargs)``
+            returning span attributes.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            tracer = getattr(getattr(self, "client", None), "tracer", None)
+            if tracer is None or not tracer.enabled:
+                return func(self, *args, **kwargs)
+            span_name = name(self, *args, **kwargs) if callable(name) else name
+            span_attributes = attributes(self, *args, **kwargs) if attributes else None
+            with tracer.start_span(span_name, span_attributes):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,277 @@
+import abc
+import json as _json
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+
+def build_response(
+    method: str,
+    url: str,
+    status_code: int,
+    headers: Optional[Dict[str, str]] = None,
+    content: bytes = b"",
+    request_headers: Optional[Dict[str, str]] = None,
+    request_body: Optional[bytes] = None,
+):
+    """
+    Build a `requests.Response` so every transport returns the same type.
+
+    The attached ``response.request`` carries method, URL, headers and body, as
+    used by instrumentation to count bytes sent.
+    """
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    request = requests.PreparedRequest()
+    request.method = method
+    request.url = url
+    request.headers = CaseInsensitiveDict(request_headers or {})
+    request.body = request_body
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = content
+    response.encoding = "utf-8"
+    response.url = url
+    response.request = request
+    return response
+
+
+def encode_params(url: str, params: Optional[Dict[str, Any]]) -> str:
+    """Append query parameters to `url` the way `requests` does (lists repeat the key, None is dropped)."""
+    if not params:
+        return url
+    pairs = [(k, v) for k, v in params.items() if v is not None]
+    if not pairs:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{urlencode(pairs, doseq=True)}"
+
+
+def _encode_body(headers: Dict[str, str], json: Any, data: Any) -> Optional[bytes]:
+    if json is not None:
+        headers["Content-Type"] = "application/json"
+        return _json.dumps(json).encode("utf-8")
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    return data
+
+
+class Transport(abc.ABC):
+    """
+    Sends the HTTP requests of a `NukiWebAPI` client.
+
+    Subclasses implement `request` with the signature of `requests.request`
+    (``params``, ``json``, ``data``, ``headers``, ``timeout``) and return a
+    `requests.Response`. Network failures are raised as
+    `requests.ConnectionError` / `requests.Timeout` so retry logic works the
+    same with every transport.
+    """
+
+    @abc.abstractmethod
+    def request(self, method: str, url: str, **kwargs):
+        """Send a request and return its `requests.Response`."""
+
+    def close(self) -> None:
+        """Release connections held by the transport."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    Transport using a `requests.Session` with connection pooling.
+
+    Args:
+        session (requests.Session, optional): Session to use. A new one is
+            created (and closed by `close`) if omitted.
+        pool_maxsize (int): Connections kept per host when creating the session.
+    """
+
+    def __init__(self, session=None, pool_maxsize: int = 10):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def request(self, method: str, url: str, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport calling `urllib3` directly, skipping the `requests` session layer.
+
+    Args:
+        pool_manager (urllib3.PoolManager, optional): Pool manager to use.
+        maxsize (int): Connections kept per host when creating the pool manager.
+    """
+
+    def __init__(self, pool_manager=None, maxsize: int = 10):
+        import urllib3
+
+        self._urllib3 = urllib3
+        self.pool_manager = pool_manager or urllib3.PoolManager(maxsize=maxsize, retries=False)
+
+    def _timeout(self, timeout):
+        if timeout is None:
+            return self._urllib3.Timeout(connect=None, read=None)
+        if isinstance(timeout, tuple):
+            return self._urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        return self._urllib3.Timeout(connect=timeout, read=timeout)
+
+    def request(self, method: str, url: str, params=None, json=None, data=None, headers=None, timeout=None, **kwargs):
+        import requests
+
+        headers = dict(headers or {})
+        body = _encode_body(headers, json, data)
+        url = encode_params(url, params)
+        errors = self._urllib3.exceptions
+        try:
+            response = self.pool_manager.request(
+                method, url, body=body, headers=headers, timeout=self._timeout(timeout),
+                redirect=False, retries=False,
+            )
+        except errors.ConnectTimeoutError as e:
+            raise requests.ConnectTimeout(e) from e
+        except (errors.ReadTimeoutError, errors.TimeoutError) as e:
+            raise requests.ReadTimeout(e) from e
+        except errors.HTTPError as e:
+            raise requests.ConnectionError(e) from e
+        return build_response(method, url, response.status, dict(response.headers), response.data, headers, body)
+
+    def close(self) -> None:
+        self.pool_manager.clear()
+
+
+class HttpxTransport(Transport):
+    """
+    Transport using a synchronous `httpx.Client` (requires ``httpx``).
+
+    Args:
+        client (httpx.Client, optional): Client to use. A new one is created
+            (and closed by `close`) if omitted.
+        http2 (bool): Enable HTTP/2 on the created client (requires ``httpx[http2]``).
+        max_connections (int): Connection limit of the created client.
+    """
+
+    def __init__(self, client=None, http2: bool = False, max_connections: int = 100):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("HttpxTransport requires the 'httpx' package") from e
+        self._httpx = httpx
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.Client(http2=http2, limits=httpx.Limits(max_connections=max_connections), timeout=None)
+        self.client = client
+
+    def _timeout(self, timeout):
+        if isinstance(timeout, tuple):
+            return self._httpx.Timeout(timeout[1], connect=timeout[0])
+        return self._httpx.Timeout(timeout)
+
+    def request(self, method: str, url: str, params=None, json=None, data=None, headers=None, timeout=None, **kwargs):
+        import requests
+
+        headers = dict(headers or {})
+        body = _encode_body(headers, json, data)
+        url = encode_params(url, params)
+        httpx = self._httpx
+        try:
+            response = self.client.request(method, url, content=body, headers=headers, timeout=self._timeout(timeout))
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e) from e
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(e) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e) from e
+        result = build_response(method, url, response.status_code, dict(response.headers), response.content, headers, body)
+        result.http_version = response.http_version
+        return result
+
+    def close(self) -> None:
+        if self._owns_client:
+            self.client.close()
+
+
+Handler = Callable[[str, str, Dict[str, str], Any, Dict[str, str]], Tuple[int, Any, Dict[str, str]]]
+
+
+class InMemoryTransport(Transport):
+    """
+    Transport calling a Python handler instead of the network.
+
+    The handler receives ``(method, path, query, body, headers)`` with the
+    query as a dict of strings and the decoded JSON body, and returns
+    ``(status_code, payload, response_headers)``. `FakeNukiServer.handle` has
+    this signature, so the simulator can be used without starting its HTTP
+    server.
+
+    Example:
+        >>> client = NukiWebAPI("TOKEN", transport=InMemoryTransport(FakeNukiServer(locks=3)))
+
+    Args:
+        handler (callable or FakeNukiServer): Request handler.
+    """
+
+    def __init__(self, handler: Union[Handler, Any]):
+        self.handler: Handler = handler.handle if hasattr(handler, "handle") else handler
+
+    def request(self, method: str, url: str, params=None, json=None, data=None, headers=None, timeout=None, **kwargs):
+        headers = dict(headers or {})
+        body = _encode_body(headers, json, data)
+        url = encode_params(url, params)
+        parts = urlsplit(url)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        status, payload, response_headers = self.handler(
+            method, parts.path, query, _json.loads(body) if body else None, headers
+        )
+        response_headers = dict(response_headers or {})
+        content = b""
+        if payload is not None:
+            content = _json.dumps(payload).encode("utf-8")
+            response_headers.setdefault("Content-Type", "application/json")
+        return build_response(method, url, status, response_headers, content, headers, body)
+
+
+_TRANSPORTS = {
+    "requests": RequestsTransport,
+    "urllib3": Urllib3Transport,
+    "httpx": HttpxTransport,
+}
+
+
+def make_transport(transport: Union[str, Transport, None], **kwargs) -> Optional[Transport]:
+    """
+    Resolve the ``transport`` argument of `NukiWebAPI`.
+
+    Args:
+        transport (str or Transport, optional): ``"requests"``, ``"urllib3"``,
+            ``"httpx"``, a `Transport` instance, or None.
+        **kwargs: Passed to the transport class when created by name.
+
+    Returns:
+        Transport or None: The transport to use.
+    """
+    if transport is None or not isinstance(transport, str):
+        return transport
+    try:
+        cls = _TRANSPORTS[transport]
+    except KeyError:
+        raise ValueError(f"transport must be one of {sorted(_TRANSPORTS)} or a Transport instance") from None
+    return cls(**kwargs)
@@ -0,0 +1,122 @@
+import json
+from typing import Any, Dict, Iterable, Optional
+
+from nukiwebapi.stats import Histogram
+
+
+class _Counter:
+    __slots__ = ("total", "failed", "latency")
+
+    def __init__(self):
+        self.total = 0
+        self.failed = 0
+        self.latency = Histogram()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "failed": self.failed,
+            "failure_rate": self.failed / self.total if self.total else 0.0,
+            "latency": self.latency.summary(),
+        }
+
+
+class WebhookLogStats:
+    """
+    Streaming aggregate statistics over webhook delivery logs.
+
+    Logs are consumed one at a time (typically straight from
+    `AdvancedApi.iter_webhook_logs`), so arbitrarily long histories can be
+    analysed in constant memory. Delivery latency is tracked in seconds.
+
+    Args:
+        latency_field (str): Log field holding the delivery latency.
+        latency_scale (float): Factor converting `latency_field` to seconds
+            (the API reports milliseconds).
+    """
+
+    def __init__(self, latency_field: str = "responseTime", latency_scale: float = 0.001):
+        self.latency_field = latency_field
+        self.latency_scale = latency_scale
+        self.overall = _Counter()
+        self.by_feature: Dict[str, _Counter] = {}
+        self.by_endpoint: Dict[str, _Counter] = {}
+        self.newest_id: Optional[str] = None
+        self.oldest_id: Optional[str] = None
+
+    @staticmethod
+    def _feature(log: Dict[str, Any]) -> str:
+        request = log.get("request")
+        if isinstance(request, str):
+            try:
+                request = json.loads(request)
+            except ValueError:
+                request = None
+        if isinstance(request, dict) and request.get("feature"):
+            return request["feature"]
+        return log.get("webhookFeature") or "UNKNOWN"
+
+    @staticmethod
+    def is_failure(log: Dict[str, Any]) -> bool:
+        """True if the log does not record a 2xx response from the webhook endpoint."""
+        status = log.get("responseStatus")
+        return not isinstance(status, int) or not 200 <= status < 300
+
+    def add(self, log: Dict[str, Any]) -> None:
+        """
+        Fold a single webhook log entry into the statistics.
+
+        Args:
+            log (dict): Webhook log as returned by the API.
+        """
+        failed = self.is_failure(log)
+        latency = log.get(self.latency_field)
+        counters = (
+            self.overall,
+            self.by_feature.setdefault(self._feature(log), _Counter()),
+            self.by_endpoint.setdefault(log.get("url") or "UNKNOWN", _Counter()),
+        )
+        for counter in counters:
+            counter.total += 1
+            counter.failed += failed
+            if isinstance(latency, (int, float)):
+                counter.latency.observe(latency * self.latency_scale)
+
+        if self.newest_id is None:
+            self.newest_id = log.get("id")
+        self.oldest_id = log.get("id")
+
+    def consume(self, logs: Iterable[Dict[str, Any]]) -> "WebhookLogStats":
+        """Add every log from an iterable and return self."""
+        for log in logs:
+            self.add(log)
+        return self
+
+    def failure_rate(self, feature: Optional[str] = None) -> float:
+        """
+        Return the share of failed deliveries.
+
+        Args:
+            feature (str, optional): Restrict to a single webhook feature.
+
+        Returns:
+            float: Failure rate between 0 and 1.
+        """
+        counter = self.overall if feature is None else self.by_feature.get(feature)
+        if counter is None or not counter.total:
+            return 0.0
+        return counter.failed / counter.total
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return all statistics as a plain dict.
+
+        Returns:
+            dict: ``overall``, ``by_feature`` and ``by_endpoint`` sections, each with
+            total/failed counts, failure rate and latency percentiles.
+        """
+        return {
+            "overall": self.overall.as_dict(),
+            "by_feature": {k: v.as_dict() for k, v in self.by_feature.items()},
+            "by_endpoint": {k: v.as_dict() for k, v in self.by_endpoint.items()},
+        }
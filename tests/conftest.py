@@ -7,6 +7,8 @@ from unittest.mock import patch
 from tests.test_constants import API_TOKEN
 
 from nukiwebapi.nuki_web_api import NukiWebAPI
+from nukiwebapi.simulator import FakeNukiServer
+from nukiwebapi.transport import InMemoryTransport
 
 from requests.models import Response
 import json as pyjson
@@ -52,6 +54,12 @@ def _default_response(method: str, endpoint: str, json=None, **kwargs) -> Respon
 
     return resp
 
+@pytest.fixture
+def default_response():
+    """Return the builder of the `client` fixture's fake responses, for wrapping in custom fakes."""
+    return _default_response
+
+
 @pytest.fixture
 def client():
     """Return a NukiWebAPI client with _request mocked to safe defaults."""
@@ -66,3 +74,27 @@ def client():
 @pytest.fixture
 def nuki_client():
     return NukiWebAPI(API_TOKEN)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "fake_server(**options): FakeNukiServer options for the fake_server fixture"
+    )
+
+
+@pytest.fixture
+def fake_server(request):
+    """
+    Return an in-memory FakeNukiServer.
+
+    Its size and behaviour are set by a ``fake_server`` marker on the test or
+    module, e.g. ``pytestmark = pytest.mark.fake_server(locks=3, logs_per_lock=0)``.
+    """
+    marker = request.node.get_closest_marker("fake_server")
+    return FakeNukiServer(**(marker.kwargs if marker else {}))
+
+
+@pytest.fixture
+def sim_client(fake_server):
+    """Return a NukiWebAPI client talking to `fake_server` without network access."""
+    return NukiWebAPI("TOKEN", transport=InMemoryTransport(fake_server))
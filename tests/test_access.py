@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from nukiwebapi.access import AccessEvaluator, is_allowed, parse_date
+
+# 2025-03-05 is a Wednesday.
+WEDNESDAY_NOON = datetime(2025, 3, 5, 12, 0)
+
+
+def auth(id, smartlock_id=1, **fields):
+    return {"id": id, "smartlockId": smartlock_id, "enabled": True, **fields}
+
+
+def test_parse_date():
+    assert parse_date(None) is None
+    assert parse_date("2025-01-01T00:00:00.000Z") == datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.mark.parametrize("fields, allowed", [
+    ({}, True),
+    ({"enabled": False}, False),
+    ({"allowedFromDate": "2025-03-06T00:00:00Z"}, False),
+    ({"allowedUntilDate": "2025-03-05T11:59:00Z"}, False),
+    ({"allowedFromDate": "2025-03-01T00:00:00Z", "allowedUntilDate": "2025-03-31T00:00:00Z"}, True),
+    ({"allowedWeekDays": 16}, True),          # Wednesday only
+    ({"allowedWeekDays": 64 + 32}, False),    # Monday and Tuesday
+    ({"allowedFromTime": 480, "allowedUntilTime": 1080}, True),
+    ({"allowedFromTime": 780, "allowedUntilTime": 1080}, False),
+    ({"allowedFromTime": 1320, "allowedUntilTime": 360}, False),  # night shift
+])
+def test_is_allowed(fields, allowed):
+    assert is_allowed(auth("a", **fields), WEDNESDAY_NOON) is allowed
+
+
+def test_overnight_window():
+    night = auth("a", allowedFromTime=1320, allowedUntilTime=360)
+    assert is_allowed(night, datetime(2025, 3, 5, 23, 30))
+    assert is_allowed(night, datetime(2025, 3, 5, 5, 0))
+
+
+def test_who_can_open_matches_brute_force():
+    base = datetime(2025, 3, 1)
+    auths = [
+        auth(f"{i:024x}", smartlock_id=i % 3,
+             enabled=i % 11 != 0,
+             allowedFromDate=(base + timedelta(hours=i % 200)).isoformat() + "Z" if i % 4 else None,
+             allowedUntilDate=(base + timedelta(hours=i % 200 + 30)).isoformat() + "Z" if i % 5 else None,
+             allowedWeekDays=(i * 37) % 128, allowedFromTime=(i * 13) % 1440, allowedUntilTime=(i * 29) % 1440)
+        for i in range(3000)
+    ]
+    evaluator = AccessEvaluator(auths)
+    assert len(evaluator) == 3000
+    for hours in (0, 50, 120, 260):
+        at = base + timedelta(hours=hours, minutes=17)
+        for smartlock_id in range(3):
+            expected = [a["id"] for a in auths if a["smartlockId"] == smartlock_id and is_allowed(a, at)]
+            assert sorted(a["id"] for a in evaluator.who_can_open(smartlock_id, at)) == sorted(expected)
+    assert evaluator.who_can_open(99, base) == []
+
+
+def test_expired():
+    evaluator = AccessEvaluator([
+        auth("old", allowedUntilDate="2025-01-01T00:00:00Z"),
+        auth("current", allowedUntilDate="2025-12-01T00:00:00Z"),
+        auth("forever"),
+    ])
+    now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    assert [a["id"] for a in evaluator.expired(now)] == ["old"]
+    evaluator.load([auth("older", smartlock_id=2, allowedUntilDate="2024-01-01T00:00:00Z")])
+    assert evaluator.expired_ids(now) == ["older", "old"]
+    assert len(evaluator) == 4
+
+
+@pytest.mark.fake_server(locks=2, auths_per_lock=3, logs_per_lock=0)
+def test_from_client(sim_client, fake_server):
+    evaluator = AccessEvaluator.from_client(sim_client, page_size=2)
+    smartlock_id = next(iter(fake_server.state.smartlocks))
+    assert len(evaluator.who_can_open(smartlock_id, WEDNESDAY_NOON)) == 3
+    assert evaluator.expired() == []
@@ -1,5 +1,8 @@
 from time import sleep
 
+import pytest
+import requests
+
 from tests.test_constants import SMARTLOCK_ID
 
 def test_list_addresses(client):
@@ -51,4 +54,57 @@ def test_delete_address_units(client):
 def test_delete_address_unit(client):
     """Test deleting a single unit."""
     result = client.address.delete_address_unit(123, "u1")
-    assert result["status"] == "success"
\ No newline at end of file
+    assert result["status"] == "success"
+
+@pytest.mark.fake_server(locks=1, auths_per_lock=0, logs_per_lock=0, addresses=1)
+def test_create_address_units_keeps_input_order(sim_client, fake_server):
+    """Test bulk unit creation against the simulator."""
+    names = [f"Unit {i}" for i in range(50)]
+
+    report = sim_client.address.create_address_units(500, names, max_workers=8)
+
+    assert report.ok
+    by_id = {u["id"]: u["name"] for u in fake_server.state.units[500]}
+    assert [by_id[unit_id] for unit_id in report.ids] == names
+
+
+def test_create_address_units_reports_partial_failures(client, default_response):
+    """Test that failed units are reported by input index and can be rolled back."""
+    def fake_request(method, endpoint, json=None, **kwargs):
+        if method == "PUT" and json["name"] == "Broken":
+            response = requests.models.Response()
+            response.status_code = 400
+            raise requests.HTTPError("bad unit", response=response)
+        if method == "PUT":
+            json = {"id": json["name"].lower(), **json}
+        return default_response(method, endpoint, json=json, **kwargs)
+
+    client._mock_request.side_effect = fake_request
+
+    report = client.address.create_address_units(123, ["A", "Broken", "C"])
+    assert report.ids == ["a", None, "c"]
+    assert list(report.failed) == [1]
+    assert report.summary()["created"] == 2
+    assert not report.rolled_back
+
+    report = client.address.create_address_units(123, ["A", "Broken"], rollback=True)
+    assert report.rolled_back
+    assert client._mock_request.call_args.args == ("DELETE", "/address/123/unit")
+
+
+def test_create_address_units_does_not_retry_ambiguous_failures(client):
+    """Test that a timed-out unit creation is not retried, as it may have succeeded."""
+    client._mock_request.side_effect = requests.ReadTimeout("read timed out")
+
+    report = client.address.create_address_units(123, ["A"])
+
+    assert report.ids == [None]
+    assert client._mock_request.call_count == 1
+
+
+def test_create_address_units_validates_input(client):
+    """Test that invalid input is rejected before any request."""
+    with pytest.raises(ValueError):
+        client.address.create_address_units("123", ["A"])
+    with pytest.raises(ValueError):
+        client.address.create_address_units(123, ["A", ""])
@@ -0,0 +1,101 @@
+import pytest
+
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.address_hierarchy import AddressHierarchy
+from nukiwebapi.instrumentation import Instrumentation
+from nukiwebapi.transport import InMemoryTransport
+
+pytestmark = pytest.mark.fake_server(locks=6, auths_per_lock=0, logs_per_lock=0, addresses=3)
+
+
+def test_lookups_are_served_from_cache(sim_client, fake_server):
+    hierarchy = AddressHierarchy(sim_client).refresh()
+    lock = fake_server.state.addresses[501]["smartlockIds"][0]
+    unit = fake_server.state.units[501][0]
+    fake_server.request_log.clear()
+
+    assert [a["addressId"] for a in hierarchy.addresses_for_smartlock(lock)] == [501]
+    assert (501, unit) in hierarchy.units_for_smartlock(lock)
+    assert hierarchy.smartlocks(501, unit["id"]) == fake_server.state.addresses[501]["smartlockIds"]
+    assert len(hierarchy.tokens(501)) == 1
+    assert len(hierarchy.units(502)) == 2
+    assert fake_server.request_log == []
+
+
+def test_lazy_loading_fetches_only_needed_addresses(sim_client, fake_server):
+    hierarchy = AddressHierarchy(sim_client)
+
+    hierarchy.units(500)
+
+    assert fake_server.request_log == [("GET", "/address"), ("GET", "/address/500/unit")]
+
+
+def test_unit_smartlocks_override_address_smartlocks(sim_client, fake_server):
+    fake_server.state.units[500][0]["smartlockIds"] = [42]
+    hierarchy = AddressHierarchy(sim_client)
+    unit_id = fake_server.state.units[500][0]["id"]
+
+    assert hierarchy.smartlocks(500, unit_id) == [42]
+    assert hierarchy.units_for_smartlock(42) == []  # lock 42 is not part of any address
+
+
+@pytest.fixture
+def instrumented_client(fake_server):
+    return NukiWebAPI("TOKEN", transport=InMemoryTransport(fake_server), instrumentation=Instrumentation(metrics=False))
+
+
+def test_mutations_through_client_invalidate(instrumented_client, fake_server):
+    hierarchy = AddressHierarchy(instrumented_client).refresh()
+    lock = fake_server.state.addresses[500]["smartlockIds"][0]
+
+    created = instrumented_client.address.create_address_unit(500, "Penthouse")
+    assert created["id"] in [u["id"] for u in hierarchy.units(500)]
+
+    instrumented_client.address.delete_address_unit(500, created["id"])
+    assert created["id"] not in [u["id"] for u in hierarchy.units(500)]
+
+    instrumented_client.address.update_address(501, smartlock_ids=[lock])
+    assert sorted(a["addressId"] for a in hierarchy.addresses_for_smartlock(lock)) == [500, 501]
+
+    new = instrumented_client.address.create_address("Annex", [lock])
+    assert hierarchy.address(new["addressId"])["name"] == "Annex"
+
+    instrumented_client.address.delete_address(500)
+    assert hierarchy.address(500) is None
+    assert [a["addressId"] for a in hierarchy.addresses_for_smartlock(lock)] == [501, new["addressId"]]
+    assert hierarchy.units(500) == []
+
+
+def test_uses_existing_instrumentation_and_unwatch(fake_server):
+    instrumentation = Instrumentation()
+    client = NukiWebAPI("TOKEN", transport=InMemoryTransport(fake_server), instrumentation=instrumentation)
+    hierarchy = AddressHierarchy(client).refresh()
+    assert client.instrumentation is instrumentation
+
+    hierarchy.unwatch()
+    client.address.create_address_unit(500, "Ignored")
+    assert len(hierarchy.units(500)) == 2
+
+
+def test_watch_needs_instrumentation(sim_client):
+    with pytest.raises(ValueError, match="instrumentation"):
+        AddressHierarchy(sim_client, watch=True)
+
+    hierarchy = AddressHierarchy(sim_client).refresh()
+    sim_client.address.create_address_unit(500, "Unseen")
+    assert sim_client.instrumentation is None
+    assert len(hierarchy.units(500)) == 2
+
+
+def test_ttl_expires_entries(sim_client, fake_server, monkeypatch):
+    hierarchy = AddressHierarchy(sim_client, ttl=10).refresh()
+    now = [1000.0]
+    monkeypatch.setattr("nukiwebapi.address_hierarchy.time.monotonic", lambda: now[0])
+    hierarchy.refresh()
+    fake_server.request_log.clear()
+
+    hierarchy.units(500)
+    assert fake_server.request_log == []
+    now[0] += 11
+    hierarchy.units(500)
+    assert fake_server.request_log == [("GET", "/address"), ("GET", "/address/500/unit")]
@@ -63,3 +63,94 @@ def test_list_tokens(client):
         mock_request.assert_called_once_with("GET", "/address/123/token")
         assert isinstance(result, list)
         assert len(result) == 2
+
+
+def test_resolve_token_caches_info(client):
+    with patch.object(client, "_request") as mock_request:
+        mock_response = Mock()
+        mock_response.json.return_value = {"id": "T1", "redeemed": False}
+        mock_request.return_value = mock_response
+
+        assert client.address_token.resolve_token("T1") == {"id": "T1", "redeemed": False}
+        assert client.address_token.resolve_token("T1")["id"] == "T1"
+
+        mock_request.assert_called_once_with("GET", "/address/token/T1")
+
+
+def test_resolve_tokens_deduplicates_concurrent_lookups(client):
+    import threading
+
+    calls = []
+    release = threading.Event()
+
+    def slow_request(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        release.wait(1)
+        response = Mock()
+        response.json.return_value = {"id": endpoint.rsplit("/", 1)[1]}
+        return response
+
+    with patch.object(client, "_request", side_effect=slow_request):
+        threads = [threading.Thread(target=client.address_token.resolve_token, args=("T1",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        threading.Timer(0.1, release.set).start()
+        results = client.address_token.resolve_tokens(["T1", "T2", "T2", "T3"], max_workers=4)
+        for thread in threads:
+            thread.join()
+
+    assert sorted(calls) == ["/address/token/T1", "/address/token/T2", "/address/token/T3"]
+    assert list(results) == ["T1", "T2", "T3"]
+    assert all(r.ok for r in results.values())
+    assert results["T2"].result == {"id": "T2"}
+
+
+def test_redeem_tokens_redeems_each_token_once(client):
+    with patch.object(client, "_request") as mock_request:
+        mock_response = Mock()
+        mock_response.json.return_value = {"status": "redeemed"}
+        mock_request.return_value = mock_response
+        key = client.address_token._info_key("T1")
+        client.cache.set(key, {"id": "T1", "redeemed": False})
+
+        results = client.address_token.redeem_tokens(["T1", "T2", "T1"], email=False)
+
+        assert sorted(c.args[1] for c in mock_request.call_args_list) == [
+            "/address/token/T1/redeem", "/address/token/T2/redeem",
+        ]
+        assert all(r.ok for r in results.values())
+        assert client.cache.get(key) is None
+
+
+def test_lookup_overlapping_a_redeem_does_not_cache_stale_info(client):
+    import threading
+
+    tokens = client.address_token
+    fetching, redeemed = threading.Event(), threading.Event()
+
+    def get_token_info(token_id):
+        fetching.set()
+        redeemed.wait(5)
+        return {"id": token_id, "redeemed": False}
+
+    with patch.object(tokens, "get_token_info", side_effect=get_token_info), \
+            patch.object(tokens, "redeem_token", return_value={"status": "redeemed"}):
+        lookup = threading.Thread(target=tokens.resolve_token, args=("T1",))
+        lookup.start()
+        fetching.wait(5)
+        assert tokens.redeem_tokens(["T1"])["T1"].ok
+        redeemed.set()
+        lookup.join()
+
+    with patch.object(tokens, "get_token_info", return_value={"id": "T1", "redeemed": True}):
+        assert tokens.resolve_token("T1")["redeemed"] is True
+
+
+def test_redeem_tokens_does_not_retry_ambiguous_failures(client):
+    import requests
+
+    with patch.object(client, "_request", side_effect=requests.ReadTimeout("read timed out")) as mock_request:
+        results = client.address_token.redeem_tokens(["T1"])
+
+    assert not results["T1"].ok
+    assert mock_request.call_count == 1
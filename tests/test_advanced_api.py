@@ -92,3 +92,53 @@ def test_unlock_smartlock_advanced(client):
         result = client.advanced_api.unlock_smartlock_advanced("SL1", unlock_data)
         mock_request.assert_called_once_with("POST", "/smartlock/SL1/action/unlock/advanced", json=unlock_data)
         assert result["requestId"] == "U1"
+
+
+# ---- Webhook log iteration ----
+def test_iter_webhook_logs_follows_cursor(client):
+    pages = [
+        [{"id": "l3"}, {"id": "l2"}],
+        [{"id": "l1"}],
+    ]
+    with patch.object(client.advanced_api, "get_webhook_logs", side_effect=pages) as mock_get:
+        logs = list(client.advanced_api.iter_webhook_logs(42, page_size=2))
+
+    assert [log["id"] for log in logs] == ["l3", "l2", "l1"]
+    assert mock_get.call_args_list == [
+        call(42, id=None, limit=2),
+        call(42, id="l2", limit=2),
+    ]
+
+
+def test_iter_webhook_logs_is_lazy_and_respects_max_logs(client):
+    with patch.object(client.advanced_api, "get_webhook_logs", return_value=[{"id": "a"}, {"id": "b"}]) as mock_get:
+        logs = list(client.advanced_api.iter_webhook_logs(42, page_size=2, max_logs=3))
+
+    assert len(logs) == 3
+    assert mock_get.call_count == 2
+
+
+def test_iter_webhook_logs_stops_at_max_logs_on_page_boundary(client):
+    with patch.object(client.advanced_api, "get_webhook_logs", return_value=[{"id": "a"}, {"id": "b"}]) as mock_get:
+        logs = list(client.advanced_api.iter_webhook_logs(42, page_size=2, max_logs=2))
+        assert list(client.advanced_api.iter_webhook_logs(42, page_size=2, max_logs=0)) == []
+
+    assert len(logs) == 2
+    assert mock_get.call_count == 1
+
+
+def test_webhook_log_stats(client):
+    page = [
+        {"id": "l2", "url": "https://hook", "responseStatus": 200, "responseTime": 120,
+         "request": '{"feature": "DEVICE_STATUS"}'},
+        {"id": "l1", "url": "https://hook", "responseStatus": 500, "responseTime": 900,
+         "request": '{"feature": "DEVICE_LOGS"}'},
+    ]
+    with patch.object(client.advanced_api, "get_webhook_logs", return_value=page):
+        stats = client.advanced_api.webhook_log_stats(42)
+
+    assert stats.overall.total == 2
+    assert stats.failure_rate() == 0.5
+    assert stats.failure_rate("DEVICE_LOGS") == 1.0
+    assert stats.failure_rate("DEVICE_STATUS") == 0.0
+    assert stats.summary()["by_endpoint"]["https://hook"]["total"] == 2
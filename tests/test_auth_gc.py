@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from nukiwebapi.auth_gc import AuthGC
+from nukiwebapi.deadline import DeadlineExceeded
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+pytestmark = pytest.mark.fake_server(locks=2, auths_per_lock=2, logs_per_lock=0)
+
+
+@pytest.fixture(autouse=True)
+def stale_auths(fake_server):
+    state = fake_server.state
+    lock_a, lock_b = state.smartlocks
+    for i in range(25):
+        state._add_auth({"smartlockId": lock_a if i % 2 else lock_b, "type": 13, "name": f"Guest {i}",
+                         "enabled": True, "creationDate": "2025-01-01T00:00:00.000Z",
+                         "lastActiveDate": "2025-01-02T00:00:00.000Z",
+                         "allowedUntilDate": "2025-02-01T00:00:00.000Z"})
+    state._add_auth({"smartlockId": lock_a, "type": 0, "name": "Disabled", "enabled": False,
+                     "creationDate": "2025-01-01T00:00:00.000Z"})
+    state._add_auth({"smartlockId": lock_a, "type": 0, "name": "Fresh guest", "enabled": True,
+                     "creationDate": "2025-05-31T00:00:00.000Z",
+                     "allowedUntilDate": "2025-05-31T23:00:00.000Z"})
+
+
+def test_scan_is_a_dry_run(sim_client, fake_server):
+    before = len(fake_server.state.auths)
+    report = AuthGC(sim_client).scan(now=NOW, page_size=10)
+
+    assert report.dry_run
+    assert report.scanned == before
+    assert report.by_reason() == {"expired": 26}
+    assert len(fake_server.state.auths) == before
+    assert ("DELETE", "/smartlock/auth") not in fake_server.request_log
+
+
+def test_policies_and_grace(sim_client):
+    gc = AuthGC(sim_client, policies=("expired", "disabled", "never_used"), grace=timedelta(days=2),
+                unused_after=timedelta(days=30))
+    report = gc.scan(now=NOW)
+    # The fresh guest expired within the grace period; the seeded auths were never used.
+    assert report.by_reason() == {"expired": 25, "disabled": 1, "never_used": 4}
+    assert "Fresh guest" not in {auth["name"] for auth, _ in report.candidates}
+
+
+def test_protect_keeps_auths(sim_client):
+    report = AuthGC(sim_client, protect=lambda auth: auth.get("type") == 13).scan(now=NOW)
+    assert [auth["name"] for auth, _ in report.candidates] == ["Fresh guest"]
+
+
+def test_run_deletes_in_batches(sim_client, fake_server):
+    gc = AuthGC(sim_client, policies=("expired", "disabled"))
+    report = gc.run(gc.scan(now=NOW), batch_size=10, rate=None)
+
+    assert not report.dry_run
+    assert sorted(report.deleted) == sorted(report.ids)
+    assert len(report.deleted) == 27 and not report.failed
+    assert fake_server.request_log.count(("DELETE", "/smartlock/auth")) == 3
+    assert not set(report.deleted) & set(fake_server.state.auths)
+    assert report.summary()["deleted"] == 27
+
+
+def test_failed_batches_are_reported(sim_client, fake_server):
+    gc = AuthGC(sim_client)
+    report = gc.scan(now=NOW)
+    fake_server.fail_next(1, status=400)
+    report = gc.run(report, batch_size=20, max_workers=1, rate=None)
+    assert len(report.failed) == 20 and len(report.deleted) == 6
+
+
+def test_deadline_bounds_scan_and_run(sim_client, fake_server):
+    gc = AuthGC(sim_client)
+    with pytest.raises(DeadlineExceeded):
+        gc.scan(now=NOW, deadline=0)
+
+    report = gc.run(gc.scan(now=NOW), deadline=0)
+    assert report.deleted == []
+    assert all(isinstance(e, DeadlineExceeded) for e in report.failed.values())
+    assert len(fake_server.state.auths) == 31
+
+
+def test_invalid_arguments(sim_client):
+    with pytest.raises(ValueError):
+        AuthGC(sim_client, policies=("old",))
+    with pytest.raises(ValueError):
+        AuthGC(sim_client).run(batch_size=0)
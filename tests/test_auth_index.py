@@ -0,0 +1,76 @@
+import pytest
+
+from nukiwebapi.auth_index import AccountUserAuthIndex
+
+pytestmark = pytest.mark.fake_server(locks=20, auths_per_lock=3, logs_per_lock=0)
+
+
+@pytest.fixture
+def index(sim_client):
+    return AccountUserAuthIndex(sim_client).refresh(page_size=25)
+
+
+def test_refresh_indexes_all_auths(index, fake_server):
+    assert len(index) == len(fake_server.state.auths)
+    user = fake_server.state.account_users[0]
+    expected = sorted(a["id"] for a in fake_server.state.auths.values() if a["accountUserId"] == user["accountUserId"])
+    assert index.auth_ids(account_user_id=user["accountUserId"]) == expected
+    assert index.auth_ids(email=user["email"].upper()) == expected
+    assert index.auth_ids(name=user["name"]) == expected
+    assert index.auth_ids(name=user["name"].upper()) == []
+    assert len(index.smartlocks(account_user_id=user["accountUserId"])) == 20
+
+
+def test_revoke_uses_one_bulk_delete(index, fake_server):
+    user = fake_server.state.account_users[1]
+    fake_server.request_log.clear()
+
+    revoked = index.revoke(email=user["email"])
+
+    assert len(revoked) == 20
+    assert fake_server.request_log == [("DELETE", "/smartlock/auth")]
+    assert not any(a["accountUserId"] == user["accountUserId"] for a in fake_server.state.auths.values())
+    assert index.auth_ids(account_user_id=user["accountUserId"]) == []
+
+
+def test_revoke_dry_run_and_validation(index, fake_server):
+    fake_server.request_log.clear()
+    assert index.revoke(name="Nobody", match_name=True) == []
+    assert len(index.revoke(account_user_id=1000, dry_run=True)) == 20
+    assert fake_server.request_log == []
+    with pytest.raises(ValueError):
+        index.revoke()
+    with pytest.raises(ValueError, match="match_name"):
+        index.revoke(name="User 0")
+
+
+def test_revoke_leaves_other_users_with_the_same_name_alone():
+    index = AccountUserAuthIndex()
+    index.load_users([{"accountUserId": 7, "email": "guest@example.com", "name": "Guest"},
+                      {"accountUserId": 8, "email": "other@example.com", "name": "Guest"}])
+    index.load([{"id": "a", "smartlockId": 1, "accountUserId": 7, "name": "Guest"},
+                {"id": "b", "smartlockId": 1, "accountUserId": 8, "name": "Guest"},
+                {"id": "c", "smartlockId": 2, "accountUserId": 7, "name": "guest"}])
+
+    assert index.revoke(email="guest@example.com", dry_run=True) == ["a", "c"]
+    assert index.revoke(account_user_id=7, name="Guest", dry_run=True) == ["a"]
+    assert index.revoke(name="guest", dry_run=True, match_name=True) == ["c"]
+
+
+def test_incremental_updates():
+    index = AccountUserAuthIndex()
+    index.load_users([{"accountUserId": 7, "email": "ann@example.com", "name": "Ann"}])
+    index.add({"id": "a", "smartlockId": 1, "accountUserId": 7, "name": "Ann"})
+    index.add({"id": "b", "smartlockId": 2, "name": "Ann (keypad)"})
+    assert index.auth_ids(email="ann@example.com") == ["a"]
+
+    index.add({"id": "a", "smartlockId": 1, "accountUserId": 8, "name": "Bob"})
+    assert index.auth_ids(account_user_id=7) == []
+    assert index.auth_ids(name="Bob") == ["a"]
+
+    assert index.handle_webhook({"feature": "DEVICE_AUTHS", "smartlockId": 2,
+                                 "smartlockAuths": [{"id": "c", "accountUserId": 7, "name": "Ann"}]})
+    assert index.auth_ids(account_user_id=7) == ["c"]
+    assert index.remove("b") is None
+    assert len(index) == 2
+    assert not index.handle_webhook({"feature": "DEVICE_STATUS", "smartlockId": 2})
@@ -0,0 +1,151 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from nukiwebapi.auth_tracker import AuthOperationTracker
+from nukiwebapi.deadline import DeadlineExceeded
+
+pytestmark = pytest.mark.fake_server(locks=2, auths_per_lock=2, logs_per_lock=0, action_delay=0.05)
+
+LIST_AUTHS = ("GET", "/smartlock/auth")
+
+
+def test_create_resolves_once_auths_exist_on_all_locks(sim_client, fake_server):
+    tracker = AuthOperationTracker(sim_client)
+    locks = list(fake_server.state.smartlocks)
+    future = tracker.create("Guest", locks, remote_allowed=False)
+
+    assert tracker.poll() == 0
+    assert not future.done()
+    assert tracker.wait([future], timeout=5, interval=0.02)
+    created = future.result()
+    assert sorted(a["smartlockId"] for a in created) == sorted(locks)
+    assert all(a["name"] == "Guest" for a in created)
+
+
+def test_many_operations_share_one_poll(sim_client, fake_server):
+    tracker = AuthOperationTracker(sim_client)
+    lock = next(iter(fake_server.state.smartlocks))
+    futures = [tracker.create(f"Guest {i}", [lock]) for i in range(20)]
+
+    assert tracker.wait(futures, timeout=5, interval=0.1)
+    assert fake_server.request_log.count(LIST_AUTHS) <= 3
+    assert tracker.pending == 0
+
+
+def test_update_and_delete(sim_client, fake_server):
+    tracker = AuthOperationTracker(sim_client)
+    auth_a, auth_b = list(fake_server.state.auths.values())[:2]
+    update = tracker.update(auth_a["smartlockId"], auth_a["id"], name="Renamed", enabled=False)
+    delete = tracker.delete([auth_b["id"]])
+
+    assert tracker.wait(timeout=5, interval=0.02)
+    assert update.result()["name"] == "Renamed"
+    assert update.result()["enabled"] is False
+    assert delete.result() == [auth_b["id"]]
+
+
+def test_update_matches_normalized_dates(sim_client):
+    tracker = AuthOperationTracker(sim_client)
+    future = tracker.track_update("a1", {"allowedUntilDate": "2025-03-01T10:00:00Z", "enabled": True})
+
+    tracker.handle_webhook({"feature": "DEVICE_AUTHS", "smartlockId": 1, "smartlockAuths": [
+        {"id": "a1", "allowedUntilDate": "2025-03-01T10:00:00.000Z", "enabled": True},
+    ]})
+
+    assert future.result(timeout=0)["allowedUntilDate"] == "2025-03-01T10:00:00.000Z"
+
+
+def test_update_bulk_returns_future_per_entry(sim_client, fake_server):
+    tracker = AuthOperationTracker(sim_client)
+    ids = list(fake_server.state.auths)[:3]
+    futures = tracker.update_bulk([{"id": i, "enabled": False} for i in ids])
+
+    assert tracker.wait(futures, timeout=5, interval=0.02)
+    assert [f.result()["id"] for f in futures] == ids
+
+
+def test_existing_auth_with_same_name_does_not_complete_create(sim_client, fake_server):
+    tracker = AuthOperationTracker(sim_client)
+    auth = next(iter(fake_server.state.auths.values()))
+    future = tracker.track_create(auth["name"], [auth["smartlockId"]])
+
+    tracker.poll()
+    assert not future.done()
+
+
+def test_create_ignores_existing_auth_with_same_name(sim_client, fake_server):
+    lock = next(iter(fake_server.state.smartlocks))
+    old = fake_server.state._add_auth({"smartlockId": lock, "type": 0, "name": "Guest", "enabled": True})
+    tracker = AuthOperationTracker(sim_client)
+
+    future = tracker.create("Guest", [lock])
+
+    assert tracker.wait([future], timeout=5, interval=0.02)
+    assert [a["id"] for a in future.result()] != [old["id"]]
+
+
+def test_same_name_creates_claim_different_auths(sim_client, fake_server):
+    tracker = AuthOperationTracker(sim_client)
+    lock = next(iter(fake_server.state.smartlocks))
+    first = tracker.create("Twin", [lock])
+    second = tracker.create("Twin", [lock])
+
+    assert tracker.wait([first, second], timeout=5, interval=0.02)
+    assert first.result()[0]["id"] != second.result()[0]["id"]
+
+
+def test_webhook_event_resolves_without_polling(sim_client, fake_server):
+    tracker = AuthOperationTracker(sim_client)
+    lock = next(iter(fake_server.state.smartlocks))
+    future = tracker.track_create("Guest", [lock], type=13)
+
+    resolved = tracker.handle_webhook({
+        "feature": "DEVICE_AUTHS",
+        "smartlockId": lock,
+        "smartlockAuths": [{"id": "a1", "name": "Guest", "type": 13}],
+    })
+
+    assert resolved == 1
+    assert future.result()[0]["smartlockId"] == lock
+    assert fake_server.request_log.count(LIST_AUTHS) == 0
+    assert tracker.handle_webhook({"feature": "DEVICE_STATUS", "smartlockId": lock}) == 0
+
+
+def test_operation_times_out(sim_client):
+    tracker = AuthOperationTracker(sim_client, timeout=0.0)
+    future = tracker.track_delete(["missing-but-listed"])
+    tracker._apply([{"id": "missing-but-listed"}])
+
+    with pytest.raises(TimeoutError):
+        future.result()
+
+
+def test_operations_time_out_while_polling_fails(sim_client):
+    tracker = AuthOperationTracker(sim_client, timeout=0.05)
+    future = tracker.track_delete(["a1"])
+
+    with patch.object(sim_client.smartlock_auth, "list_auths", side_effect=requests.ConnectionError("down")):
+        with tracker.start(interval=0.01):
+            with pytest.raises(TimeoutError):
+                future.result(timeout=2)
+        assert tracker.pending == 0
+
+
+def test_poll_deadline(sim_client, fake_server):
+    tracker = AuthOperationTracker(sim_client)
+    future = tracker.track_delete(["a1"])
+    fake_server.request_log.clear()
+
+    with pytest.raises(DeadlineExceeded):
+        tracker.poll(deadline=0)
+    assert fake_server.request_log == []
+    assert not future.done()
+
+
+def test_background_polling(sim_client, fake_server):
+    with AuthOperationTracker(sim_client).start(interval=0.02) as tracker:
+        lock = next(iter(fake_server.state.smartlocks))
+        future = tracker.create("Background", [lock])
+        assert future.result(timeout=5)[0]["name"] == "Background"
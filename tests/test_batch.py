@@ -0,0 +1,70 @@
+import contextvars
+
+import pytest
+import requests
+
+from nukiwebapi.batch import is_transient_error, retry_delay, run_batch
+
+
+def _http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status}", response=response)
+
+
+def test_is_transient_error():
+    assert is_transient_error(requests.ConnectionError())
+    assert is_transient_error(requests.Timeout())
+    assert is_transient_error(_http_error(429))
+    assert is_transient_error(_http_error(503))
+    assert not is_transient_error(_http_error(404))
+    assert not is_transient_error(ValueError())
+
+
+def test_retry_delay_honors_retry_after():
+    assert retry_delay(_http_error(429, {"Retry-After": "2"}), 1, backoff=0.1) == 2.0
+    assert 0 <= retry_delay(requests.Timeout(), 3, backoff=0.1) <= 0.4
+
+
+def test_run_batch_preserves_order_and_isolates_errors():
+    def func(x):
+        if x == 2:
+            raise ValueError("boom")
+        return x * 10
+
+    results = run_batch(func, [1, 2, 3], max_workers=3)
+
+    assert [r.item for r in results] == [1, 2, 3]
+    assert [r.result for r in results] == [10, None, 30]
+    assert isinstance(results[1].error, ValueError)
+    assert results[1].attempts == 1  # not transient, no retry
+
+
+def test_run_batch_retries_transient_errors():
+    calls = []
+
+    def func(x):
+        calls.append(x)
+        if len(calls) < 3:
+            raise _http_error(503)
+        return "ok"
+
+    [result] = run_batch(func, ["a"], retries=2, backoff=0)
+
+    assert result.ok
+    assert result.attempts == 3
+
+
+def test_run_batch_propagates_context():
+    var = contextvars.ContextVar("var", default=None)
+    var.set("parent")
+
+    results = run_batch(lambda _: var.get(), range(4), max_workers=2)
+
+    assert all(r.result == "parent" for r in results)
+
+
+def test_run_batch_invalid_workers():
+    with pytest.raises(ValueError):
+        run_batch(lambda x: x, [1], max_workers=0)
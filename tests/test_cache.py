@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from nukiwebapi.cache import TTLCache
+
+
+def test_get_set_and_expiry():
+    cache = TTLCache(ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_get_or_set_calls_factory_once():
+    cache = TTLCache()
+    calls = []
+    factory = lambda: calls.append(1) or "value"
+    assert cache.get_or_set("k", factory) == "value"
+    assert cache.get_or_set("k", factory) == "value"
+    assert len(calls) == 1
+
+
+def test_max_entries_evicts_oldest():
+    cache = TTLCache(max_entries=2)
+    for key in "abc":
+        cache.set(key, key)
+    assert cache.get("a") is None
+    assert len(cache) == 2
+
+
+def test_namespaces_are_isolated():
+    cache = TTLCache()
+    first, second = cache.namespace("acc1"), cache.namespace("acc2")
+    first.set("smartlocks", [1])
+    second.set("smartlocks", [2])
+    first.set(("auth", 5), "x")
+
+    assert first.get("smartlocks") == [1]
+    assert second.get("smartlocks") == [2]
+
+    first.invalidate_prefix(("auth",))
+    assert first.get(("auth", 5)) is None
+    first.clear()
+    assert first.get("smartlocks") is None
+    assert second.get("smartlocks") == [2]
+
+
+def test_get_or_set_shares_concurrent_misses():
+    cache = TTLCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        started.set()
+        release.wait(1)
+        return "value"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get_or_set("k", factory)))
+    leader.start()
+    started.wait(1)
+    followers = [threading.Thread(target=lambda: results.append(cache.get_or_set("k", factory))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)  # let the followers block on the leader's call
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert results == ["value"] * 4
+    assert len(calls) == 1
+    assert cache.get("k") == "value"
+
+
+def test_get_or_set_does_not_cache_failures():
+    cache = TTLCache()
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_set("k", failing)
+    assert cache.get_or_set("k", lambda: "value") == "value"
@@ -0,0 +1,121 @@
+import time
+
+import pytest
+import requests
+
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, endpoint_class
+from nukiwebapi.instrumentation import Instrumentation
+from nukiwebapi.simulator import FakeNukiServer
+
+
+@pytest.fixture
+def server():
+    with FakeNukiServer(locks=2, auths_per_lock=1, logs_per_lock=1) as srv:
+        yield srv
+
+
+def test_endpoint_class():
+    assert endpoint_class("POST", "/smartlock/4294967297/action/lock") == "smartlock.action"
+    assert endpoint_class("POST", "/smartlock/4294967297/action") == "smartlock.action"
+    assert endpoint_class("GET", "/smartlock/auth") == "smartlock.auth"
+    assert endpoint_class("GET", "/smartlock/4294967297/log") == "smartlock.log"
+    assert endpoint_class("GET", "/smartlock/4294967297") == "smartlock"
+    assert endpoint_class("GET", "/account/user") == "account"
+
+
+def test_opens_after_threshold_and_fails_fast(server):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+    client = NukiWebAPI("TOKEN", base_url=server.url, circuit_breaker=breaker)
+    server.fail_next(3, status=503)
+
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            client.account.get()
+    assert breaker.state("account") == OPEN
+
+    before = server.request_count
+    with pytest.raises(CircuitOpenError) as exc:
+        client.account.get()
+    assert exc.value.endpoint_class == "account"
+    assert exc.value.retry_after > 0
+    assert server.request_count == before
+    # Other endpoint classes are unaffected.
+    assert client.smartlock.list_smartlocks()
+
+
+def test_client_errors_do_not_open(server):
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = NukiWebAPI("TOKEN", base_url=server.url, circuit_breaker=breaker)
+    with pytest.raises(requests.HTTPError):
+        client.smartlock.get_smartlock(1)
+    assert breaker.state("smartlock") == CLOSED
+
+
+def test_half_open_probe_closes_or_reopens(server):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    client = NukiWebAPI("TOKEN", base_url=server.url, circuit_breaker=breaker)
+
+    server.fail_next(1, status=500)
+    with pytest.raises(requests.HTTPError):
+        client.account.get()
+    assert breaker.state("account") == OPEN
+
+    time.sleep(0.06)
+    server.fail_next(1, status=500)
+    with pytest.raises(requests.HTTPError):
+        client.account.get()
+    assert breaker.state("account") == OPEN
+
+    time.sleep(0.06)
+    assert client.account.get()["accountId"]
+    assert breaker.state("account") == CLOSED
+
+
+def test_half_open_limits_concurrent_probes():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0, half_open_max_calls=1)
+    key = breaker.before("GET", "/account")
+    breaker.record_failure(key, requests.ConnectionError("down"))
+    assert breaker.before("GET", "/account") == key
+    assert breaker.state(key) == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before("GET", "/account")
+    breaker.record_success(key)
+    assert breaker.state(key) == CLOSED
+
+
+def test_connection_errors_count_as_failures():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    client = NukiWebAPI("TOKEN", base_url="http://127.0.0.1:9", circuit_breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            client.account.get()
+    with pytest.raises(CircuitOpenError):
+        client.account.get()
+
+
+def test_state_is_exposed_through_metrics(server):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    instrumentation = Instrumentation()
+    client = NukiWebAPI("TOKEN", base_url=server.url, circuit_breaker=breaker, instrumentation=instrumentation)
+    client.smartlock.list_smartlocks()
+    server.fail_next(1, status=502)
+    with pytest.raises(requests.HTTPError):
+        client.account.get()
+    with pytest.raises(CircuitOpenError):
+        client.account.get()
+
+    gauges = instrumentation.metrics.snapshot()["gauges"]
+    assert gauges["circuit_breaker_state"] == {"smartlock": 0, "account": 1}
+    assert gauges["circuit_breaker_rejections"] == {"smartlock": 0, "account": 1}
+    assert 'nukiwebapi_circuit_breaker_state{key="account"} 1' in instrumentation.metrics.to_prometheus()
+
+
+def test_reset_and_validation():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    key = breaker.before("GET", "/account")
+    breaker.record_failure(key, requests.Timeout())
+    breaker.reset(key)
+    assert breaker.state(key) == CLOSED
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
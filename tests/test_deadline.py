@@ -0,0 +1,139 @@
+import time
+
+import pytest
+import requests
+
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.circuit_breaker import CLOSED, CircuitBreaker
+from nukiwebapi.deadline import DEFAULT_TIMEOUT, DeadlineExceeded, cap_timeout, remaining_time, request_deadline
+from nukiwebapi.scheduler import RequestScheduler
+from nukiwebapi.simulator import FakeNukiServer
+from nukiwebapi.transport import InMemoryTransport
+
+
+class TimeoutRecorder(InMemoryTransport):
+    """In-memory transport remembering the timeout of every request."""
+
+    def __init__(self, handler):
+        super().__init__(handler)
+        self.timeouts = []
+
+    def request(self, method, url, **kwargs):
+        self.timeouts.append(kwargs.get("timeout"))
+        return super().request(method, url, **kwargs)
+
+
+@pytest.fixture
+def simulator():
+    return FakeNukiServer(locks=4, auths_per_lock=0, logs_per_lock=0, webhook_logs=30)
+
+
+def test_cap_timeout():
+    assert cap_timeout(None, 2) == 2
+    assert cap_timeout(5, 2) == 2
+    assert cap_timeout(1, 2) == 1
+    assert cap_timeout((3.05, 30), 2) == (2, 2)
+    assert cap_timeout((1, None), 2) == (1, 2)
+
+
+def test_nested_deadlines_only_shrink():
+    assert remaining_time() is None
+    with request_deadline(10):
+        with request_deadline(60):
+            assert remaining_time() <= 10
+        with request_deadline(1):
+            assert remaining_time() <= 1
+        with request_deadline(None):
+            assert 1 < remaining_time() <= 10
+    assert remaining_time() is None
+
+
+def test_default_and_custom_timeouts(simulator):
+    transport = TimeoutRecorder(simulator)
+    NukiWebAPI("TOKEN", transport=transport).account.get()
+    NukiWebAPI("TOKEN", transport=transport, timeout=5).account.get()
+    NukiWebAPI("TOKEN", transport=transport, timeout=None).account.get()
+    assert transport.timeouts == [DEFAULT_TIMEOUT, 5, None]
+
+
+def test_deadline_caps_timeout_and_fails_fast(simulator):
+    transport = TimeoutRecorder(simulator)
+    client = NukiWebAPI("TOKEN", transport=transport)
+    with request_deadline(1):
+        client.account.get()
+    connect, read = transport.timeouts[-1]
+    assert connect <= 1 and read <= 1
+
+    before = simulator.request_count
+    with request_deadline(0):
+        with pytest.raises(DeadlineExceeded):
+            client.account.get()
+    assert simulator.request_count == before
+
+
+def test_read_timeout_past_deadline_becomes_deadline_exceeded():
+    with FakeNukiServer(locks=1, latency=0.3) as server:
+        client = NukiWebAPI("TOKEN", base_url=server.url)
+        start = time.perf_counter()
+        with request_deadline(0.1), pytest.raises(DeadlineExceeded) as exc:
+            client.account.get()
+        assert time.perf_counter() - start < 0.3
+        assert isinstance(exc.value.__cause__, requests.Timeout)
+
+
+def test_scheduler_wait_respects_deadline(simulator):
+    scheduler = RequestScheduler(max_in_flight=1)
+    client = NukiWebAPI("TOKEN", transport=InMemoryTransport(simulator), scheduler=scheduler)
+    scheduler.acquire()
+    try:
+        with request_deadline(0.05), pytest.raises(DeadlineExceeded):
+            client.account.get()
+    finally:
+        scheduler.release()
+    assert scheduler.queued == 0
+
+
+def test_deadline_does_not_affect_circuit_breaker(simulator):
+    breaker = CircuitBreaker(failure_threshold=1)
+    scheduler = RequestScheduler(max_in_flight=1)
+    client = NukiWebAPI("TOKEN", transport=InMemoryTransport(simulator), scheduler=scheduler, circuit_breaker=breaker)
+    scheduler.acquire()
+    with request_deadline(0.01), pytest.raises(DeadlineExceeded):
+        client.account.get()
+    scheduler.release()
+    assert breaker.state("account") == CLOSED
+
+
+def test_fleet_deadline_propagates_to_workers():
+    simulator = FakeNukiServer(locks=6, auths_per_lock=0, logs_per_lock=0, latency=0.05)
+    client = NukiWebAPI("TOKEN", transport=InMemoryTransport(simulator))
+    ids = list(client.lock_instances)
+
+    report = client.fleet.lock(ids, max_workers=1, deadline=0.12)
+
+    assert 1 <= len(report.succeeded) < len(ids)
+    assert all(isinstance(e, DeadlineExceeded) for e in report.failed.values())
+    assert report.elapsed < 0.3
+
+
+def test_batch_skips_retry_that_would_outlast_deadline(monkeypatch):
+    monkeypatch.setattr("nukiwebapi.batch.retry_delay", lambda *args: 5)
+    simulator = FakeNukiServer(locks=1, auths_per_lock=0, logs_per_lock=0)
+    client = NukiWebAPI("TOKEN", transport=InMemoryTransport(simulator))
+    [smartlock_id] = client.lock_instances
+    simulator.fail_next(1, status=503)
+
+    report = client.fleet.lock([smartlock_id], retries=3, deadline=1)
+
+    assert report.failed and report.results[0].attempts == 1
+
+
+def test_webhook_log_iteration_deadline(simulator):
+    client = NukiWebAPI("TOKEN", transport=InMemoryTransport(simulator))
+    logs = client.advanced_api.iter_webhook_logs(1, page_size=10, deadline=0.05)
+    assert len([next(logs) for _ in range(10)]) == 10
+    # The deadline is scoped to the page fetches, not the consumer.
+    assert remaining_time() is None
+    time.sleep(0.06)
+    with pytest.raises(DeadlineExceeded):
+        list(logs)
@@ -0,0 +1,54 @@
+from unittest.mock import Mock, patch
+
+import requests
+
+
+def test_run_action_dispatches_to_all_locks(client):
+    with patch.object(client.smartlock, "action") as mock_action:
+        report = client.fleet.run_action(2, smartlock_ids=[1, 2, 3], option=4)
+
+    assert mock_action.call_count == 3
+    mock_action.assert_any_call(2, {"action": 2, "option": 4})
+    assert report.succeeded == [1, 2, 3]
+    assert report.failed == {}
+    assert report.summary()["total"] == 3
+    assert report.latency.count == 3
+
+
+def test_run_action_advanced_with_callback(client):
+    with patch.object(client.advanced_api, "action_smartlock_advanced") as mock_action:
+        client.fleet.run_action(1, smartlock_ids=[7], advanced=True, callback_url="https://cb")
+
+    mock_action.assert_called_once_with(7, {"action": 1, "callbackUrl": "https://cb"})
+
+
+def test_run_action_retries_and_reports_failures(client):
+    response = requests.Response()
+    response.status_code = 503
+    transient = requests.HTTPError("503", response=response)
+
+    def action(smartlock_id, payload):
+        if smartlock_id == 2:
+            raise ValueError("bad lock")
+        if action.calls.setdefault(smartlock_id, 0) == 0:
+            action.calls[smartlock_id] += 1
+            raise transient
+    action.calls = {}
+
+    completed = []
+    with patch.object(client.smartlock, "action", side_effect=action):
+        report = client.fleet.unlock([1, 2], backoff=0, on_complete=completed.append)
+
+    assert report.succeeded == [1]
+    assert isinstance(report.failed[2], ValueError)
+    assert report.retried == [1]
+    assert len(completed) == 2
+
+
+def test_lock_defaults_to_all_lock_instances(client):
+    client._lock_instances = {10: Mock(), 11: Mock()}
+    with patch.object(client.smartlock, "action") as mock_action:
+        report = client.fleet.lock(full=True, rate=1000)
+
+    assert sorted(report.succeeded) == [10, 11]
+    mock_action.assert_any_call(10, {"action": 2, "option": 4})
@@ -0,0 +1,88 @@
+import pytest
+import requests
+
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.instrumentation import Instrumentation, RequestMetrics, endpoint_template
+from nukiwebapi.scheduler import RequestScheduler
+from nukiwebapi.simulator import FakeNukiServer
+
+
+@pytest.fixture
+def server():
+    with FakeNukiServer(locks=2, auths_per_lock=1, logs_per_lock=0) as srv:
+        yield srv
+
+
+def test_endpoint_template():
+    assert endpoint_template("/smartlock/4294967297/action") == "/smartlock/{id}/action"
+    assert endpoint_template("/smartlock/12/auth/5f2b3c4d5e6f7a8b9c0d1e2f") == "/smartlock/{id}/auth/{id}"
+    assert endpoint_template("/address/token/9f86d081884c7d659a2feaa0/redeem") == "/address/token/{id}/redeem"
+    assert endpoint_template("/api/decentralWebhook") == "/api/decentralWebhook"
+    assert endpoint_template("/smartlock/auth/paged") == "/smartlock/auth/paged"
+
+
+def test_hooks_are_called_in_order(server):
+    instrumentation = Instrumentation(metrics=False)
+    events = []
+    instrumentation.add_hook("before_request", lambda info: events.append(("before", info.template)))
+    instrumentation.add_hook("after_response", lambda info: events.append(("after", info.status_code)))
+    instrumentation.add_hook("on_error", lambda info: events.append(("error", type(info.error).__name__)))
+    client = NukiWebAPI("TOKEN", base_url=server.url, instrumentation=instrumentation)
+
+    smartlock_id = next(iter(client.lock_instances))
+    client.smartlock.get_smartlock(smartlock_id)
+    server.fail_next(1, status=500)
+    with pytest.raises(requests.HTTPError):
+        client.account.get()
+
+    assert events == [
+        ("before", "/smartlock"), ("after", 200),
+        ("before", "/smartlock/{id}"), ("after", 200),
+        ("before", "/account"), ("after", 500), ("error", "HTTPError"),
+    ]
+
+
+def test_invalid_hook_event():
+    with pytest.raises(ValueError):
+        Instrumentation().add_hook("after", print)
+
+
+def test_metrics_collect_latency_counts_and_bytes(server):
+    scheduler = RequestScheduler()
+    instrumentation = Instrumentation()
+    client = NukiWebAPI("TOKEN", base_url=server.url, instrumentation=instrumentation, scheduler=scheduler)
+
+    for lock in client.lock_instances.values():
+        lock.unlock()
+    server.fail_next(1, status=503)
+    with pytest.raises(requests.HTTPError):
+        client.account.get()
+
+    snapshot = instrumentation.metrics.snapshot()
+    assert snapshot["latency"]["POST /smartlock/{id}/action"]["count"] == 2
+    assert snapshot["requests"]["GET /smartlock/{id} 200"] == 2
+    assert snapshot["requests"]["GET /account 503"] == 1
+    assert snapshot["errors"]["GET /account HTTPError"] == 1
+    assert snapshot["in_flight"] == 0
+    assert snapshot["bytes_sent"] > 0
+    assert snapshot["bytes_received"] > 0
+    assert snapshot["gauges"] == {"scheduler_in_flight": 0, "scheduler_queued": 0}
+
+
+def test_prometheus_exposition(server):
+    instrumentation = Instrumentation()
+    client = NukiWebAPI("TOKEN", base_url=server.url, instrumentation=instrumentation)
+    client.account.get()
+
+    text = instrumentation.metrics.to_prometheus()
+    assert "# TYPE nukiwebapi_request_duration_seconds histogram" in text
+    assert 'nukiwebapi_request_duration_seconds_bucket{method="GET",endpoint="/account",le="+Inf"} 1' in text
+    assert 'nukiwebapi_requests_total{method="GET",endpoint="/account",status="200"} 1' in text
+    assert "nukiwebapi_requests_in_flight 0" in text
+
+
+def test_prometheus_escapes_label_values():
+    metrics = RequestMetrics()
+    metrics.register_gauge("queue_depth", lambda: {'a\\b "c"\nd': 1})
+
+    assert 'nukiwebapi_queue_depth{key="a\\\\b \\"c\\"\\nd"} 1' in metrics.to_prometheus()
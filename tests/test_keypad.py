@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from nukiwebapi.keypad import KEYPAD_AUTH_TYPE, KeypadCodeIndex, is_valid_code, random_code, validate_code
+
+pytestmark = pytest.mark.fake_server(locks=3, auths_per_lock=2, logs_per_lock=0)
+
+
+@pytest.mark.parametrize("code, valid", [
+    (123456, False), (345678, True), (999999, True), (340567, False), (34567, False), ("3456789", False), ("abcdef", False),
+])
+def test_code_rules(code, valid):
+    assert is_valid_code(code) is valid
+
+
+def test_validate_and_random_code():
+    assert validate_code("345678") == 345678
+    with pytest.raises(ValueError):
+        validate_code(120000)
+    rng = random.Random(1)
+    assert all(is_valid_code(random_code(rng)) for _ in range(1000))
+
+
+def test_iter_auths_pages_through_everything(sim_client, fake_server):
+    auths = list(sim_client.smartlock_auth.iter_auths(page_size=4))
+    assert len(auths) == 6
+    assert {a["id"] for a in auths} == set(fake_server.state.auths)
+    assert ("GET", "/smartlock/auth/paged") in fake_server.request_log
+
+
+def test_load_and_collision_checks():
+    index = KeypadCodeIndex()
+    added = index.load([
+        {"id": "a", "smartlockId": 1, "type": 13, "code": 345678},
+        {"id": "b", "smartlockId": 2, "type": 13, "code": 345678},
+        {"id": "c", "smartlockId": 2, "type": 0},
+    ])
+    assert added == 2 and len(index) == 2
+    assert index.is_taken(1, 345678) and not index.is_taken(3, 345678)
+    assert index.conflicts(345678, [1, 2, 3]) == [1, 2]
+    assert index.auth_id(2, 345678) == "b"
+    index.remove(1, 345678)
+    assert index.conflicts(345678, [1, 2, 3]) == [2]
+
+
+def test_generate_returns_free_distinct_codes():
+    index = KeypadCodeIndex()
+    index.load({"smartlockId": 1, "type": 13, "code": c} for c in range(345600, 345700))
+    codes = index.generate([1, 2], count=200, rng=random.Random(3))
+    assert len(set(codes)) == 200
+    assert all(is_valid_code(c) and not 345600 <= c < 345700 for c in codes)
+    # Reserved codes are not handed out again.
+    assert not set(index.generate([1], count=50)) & set(codes)
+
+
+def test_generate_gives_up_when_full(monkeypatch):
+    index = KeypadCodeIndex()
+    index.add(1, 345678)
+    monkeypatch.setattr("nukiwebapi.keypad.random_code", lambda rng=None: 345678)
+    with pytest.raises(ValueError):
+        index.generate([1], max_attempts=5)
+
+
+def test_provision_and_refresh(sim_client, fake_server):
+    index = KeypadCodeIndex(sim_client).refresh()
+    locks = list(sim_client.lock_instances)
+    assert len(index) == 0
+
+    code = index.provision(locks[:2], name="Guest")
+    assert index.conflicts(code, locks) == locks[:2]
+    with pytest.raises(ValueError):
+        index.provision(locks, name="Other", code=code)
+    index.provision([locks[2]], name="Other", code=code)
+
+    created = [a for a in fake_server.state.auths.values() if a.get("type") == KEYPAD_AUTH_TYPE]
+    assert sorted(a["smartlockId"] for a in created) == sorted(locks)
+    assert all(a["code"] == code and a["remoteAllowed"] is False for a in created)
+
+    fresh = KeypadCodeIndex(sim_client).refresh(page_size=2)
+    assert fresh.conflicts(code, locks) == locks
+    assert fresh.auth_id(locks[0], code) in fake_server.state.auths
+
+
+def test_provision_releases_code_on_failure(sim_client, fake_server):
+    index = KeypadCodeIndex(sim_client)
+    fake_server.fail_next(1, status=400)
+    with pytest.raises(Exception):
+        index.provision([1, 2], name="Guest", code=345678)
+    assert index.conflicts(345678, [1, 2]) == []
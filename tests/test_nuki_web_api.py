@@ -39,4 +39,29 @@ def test_request_value_error_captured():
             res = client._request("GET", "/endpoint")
             print(res)
     # Check that the fallback text from .text is in the exception
-    assert "Not JSON content" in str(excinfo.value)
\ No newline at end of file
+    assert "Not JSON content" in str(excinfo.value)
+
+def test_sub_clients_are_created_lazily_and_cached():
+    client = NukiWebAPI("FAKE_TOKEN")
+    assert "smartlock" not in vars(client)
+
+    smartlock = client.smartlock
+    assert smartlock.client is client
+    assert client.smartlock is smartlock
+    assert "smartlock" in vars(client)
+    assert "smartlock_auth" in dir(client)
+
+
+def test_unknown_attribute_raises():
+    client = NukiWebAPI("FAKE_TOKEN")
+    with pytest.raises(AttributeError):
+        client.does_not_exist
+
+
+def test_import_does_not_load_requests():
+    import subprocess
+    import sys
+
+    code = "import sys, nukiwebapi; nukiwebapi.NukiWebAPI('T'); print('requests' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,145 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from nukiwebapi import NukiWebAPI, NukiWebAPIPool
+from nukiwebapi.pool import account_key_for_token
+from nukiwebapi.simulator import FakeNukiServer
+from nukiwebapi.transport import HttpxTransport, InMemoryTransport
+
+
+def test_clients_share_session_scheduler_and_cache():
+    pool = NukiWebAPIPool({"acme": "TOKEN_A", "globex": "TOKEN_B"})
+    acme, globex = pool["acme"], pool["globex"]
+
+    assert acme.session is globex.session is pool.session
+    assert acme.scheduler is globex.scheduler is pool.scheduler
+    acme.cache.set("k", 1)
+    assert globex.cache.get("k") is None
+    assert pool.cache.get(("acme", "k")) == 1
+
+
+def test_tokens_are_keyed_by_fingerprint():
+    pool = NukiWebAPIPool(["SECRET"])
+    [key] = pool.accounts
+    assert key == account_key_for_token("SECRET")
+    assert "SECRET" not in key
+    pool.remove(key)
+    assert len(pool) == 0
+
+
+def test_refresh_all_locks_isolates_errors():
+    pool = NukiWebAPIPool({"ok": "A", "broken": "B"})
+
+    def fetch(self):
+        if self.access_token == "B":
+            raise RuntimeError("account disabled")
+        return {1: Mock(raw_data={"smartlockId": 1})}
+
+    with patch.object(NukiWebAPI, "_fetch_smartlocks", fetch):
+        results = pool.refresh_all_locks()
+
+    assert list(results["ok"].result) == [1]
+    assert isinstance(results["broken"].error, RuntimeError)
+    assert pool["ok"].cache.get("smartlocks") == [{"smartlockId": 1}]
+
+
+def test_map_fair_limits_per_account_concurrency():
+    pool = NukiWebAPIPool({"big": "A", "small": "B"})
+    active = {"big": 0, "small": 0}
+    peak = {"big": 0, "small": 0}
+    lock = threading.Lock()
+    order = []
+
+    def work(key, client, item):
+        with lock:
+            active[key] += 1
+            peak[key] = max(peak[key], active[key])
+            order.append(key)
+        time.sleep(0.01)
+        with lock:
+            active[key] -= 1
+        return item
+
+    results = list(pool.map_fair({"big": range(10), "small": range(2)}, work, max_workers=6, max_per_account=2))
+
+    assert len(results) == 12
+    assert peak["big"] <= 2
+    assert "small" in order[:4]
+
+
+def test_map_fair_retry_wait_frees_the_account_slot():
+    pool = NukiWebAPIPool({"a": "A"})
+    response = requests.models.Response()
+    response.status_code = 503
+    response.headers["Retry-After"] = "0.2"
+    order = []
+
+    def work(key, client, item):
+        order.append(item)
+        if item == 0 and order.count(0) == 1:
+            raise requests.HTTPError("unavailable", response=response)
+        return item
+
+    results = list(pool.map_fair({"a": range(4)}, work, max_workers=2, max_per_account=1, retries=1))
+
+    assert [r.item[1] for r in results] == [1, 2, 3, 0]
+    assert all(r.ok for r in results)
+    assert results[-1].attempts == 2 and results[-1].duration >= 0.2
+
+
+def test_map_fair_sleeps_while_only_retries_are_pending():
+    pool = NukiWebAPIPool({"a": "A"})
+    response = requests.models.Response()
+    response.status_code = 503
+    response.headers["Retry-After"] = "0.5"
+    calls = []
+
+    def work(key, client, item):
+        calls.append(item)
+        if len(calls) == 1:
+            raise requests.HTTPError("unavailable", response=response)
+        return item
+
+    cpu_before = time.process_time()
+    results = list(pool.map_fair({"a": [0]}, work, retries=1))
+
+    assert results[0].ok and results[0].attempts == 2
+    assert time.process_time() - cpu_before < 0.25
+
+
+def test_map_locks_runs_across_accounts():
+    pool = NukiWebAPIPool({"a": "A", "b": "B"})
+    pool["a"]._lock_instances = {1: "lock-1"}
+    pool["b"]._lock_instances = {2: "lock-2", 3: "lock-3"}
+
+    results = list(pool.map_locks(lambda lock: lock.upper()))
+
+    assert sorted(r.result for r in results) == ["LOCK-1", "LOCK-2", "LOCK-3"]
+    assert {r.item[0] for r in results} == {"a", "b"}
+
+
+def test_http2_pool_shares_one_transport():
+    pytest.importorskip("h2")
+    with FakeNukiServer(locks=2, auths_per_lock=0, logs_per_lock=0) as server:
+        with NukiWebAPIPool({"a": "TOKEN_A", "b": "TOKEN_B"}, base_url=server.url, http2=True) as pool:
+            assert isinstance(pool.transport, HttpxTransport)
+            assert pool["a"].transport is pool["b"].transport is pool.transport
+            results = pool.refresh_all_locks()
+            assert all(r.ok for r in results.values())
+
+
+def test_transport_pool_creates_no_session():
+    transport = InMemoryTransport(FakeNukiServer(locks=1, auths_per_lock=0, logs_per_lock=0))
+    with NukiWebAPIPool({"a": "A"}, transport=transport) as pool:
+        assert pool.session is None
+        assert pool["a"].session is None
+        assert all(r.ok for r in pool.refresh_all_locks().values())
+
+
+def test_http2_pool_rejects_explicit_transport():
+    with pytest.raises(ValueError):
+        NukiWebAPIPool(transport="urllib3", http2=True)
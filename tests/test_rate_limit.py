@@ -0,0 +1,31 @@
+import time
+
+import pytest
+
+from nukiwebapi.rate_limit import RateLimiter
+
+
+def test_burst_then_wait():
+    limiter = RateLimiter(rate=100, burst=2)
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() > 0
+
+
+def test_acquire_blocks_until_refill():
+    limiter = RateLimiter(rate=50, burst=1)
+    limiter.acquire()
+    start = time.monotonic()
+    assert limiter.acquire() is True
+    assert time.monotonic() - start >= 0.015
+
+
+def test_acquire_timeout():
+    limiter = RateLimiter(rate=0.1, burst=1)
+    limiter.acquire()
+    assert limiter.acquire(timeout=0.01) is False
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+import requests
+
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.recording import Recorder, ReplayTransport, load_recording, redact, redact_path
+from nukiwebapi.simulator import FakeNukiServer
+
+
+@pytest.fixture
+def server():
+    with FakeNukiServer(locks=2, auths_per_lock=2, logs_per_lock=0, addresses=1) as srv:
+        yield srv
+
+
+def test_redact_nested_secrets():
+    data = {"name": "x", "apiToken": "abc", "nested": [{"token": "t", "id": 1, "code": 345678}], "password": None,
+            "errorCode": 4}
+    assert redact(data) == {"name": "x", "apiToken": "***", "nested": [{"token": "***", "id": 1, "code": "***"}],
+                            "password": None, "errorCode": 4}
+
+
+def test_redact_path_hides_address_token_ids():
+    assert redact_path("/address/token/abc123") == "/address/token/***"
+    assert redact_path("/address/token/abc123/redeem") == "/address/token/***/redeem"
+    assert redact_path("/address/500/token") == "/address/500/token"
+
+
+def test_address_token_ids_are_redacted_and_replayed(server, tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+    with Recorder(path) as recorder:
+        live = NukiWebAPI("TOKEN", base_url=server.url, recorder=recorder)
+        token_id = live.address_token.list_tokens(500)[0]["id"]
+        expected = live.address_token.get_token_info(token_id)
+
+    endpoints = [e["endpoint"] for e in load_recording(path)]
+    assert endpoints[-1] == "/address/token/***"
+    assert not any(token_id in endpoint for endpoint in endpoints)
+    replay = NukiWebAPI("OTHER", transport=ReplayTransport(path))
+    assert replay.address_token.get_token_info(token_id) == expected
+
+
+@pytest.mark.parametrize("filename", ["traffic.jsonl", "traffic.jsonl.gz"])
+def test_record_writes_compact_lines_without_token(server, tmp_path, filename):
+    path = str(tmp_path / filename)
+    with Recorder(path) as recorder:
+        client = NukiWebAPI("SECRET-TOKEN", base_url=server.url, recorder=recorder)
+        smartlock_id = next(iter(client.lock_instances))
+        client.smartlock_auth.list_auths(types=[0])
+        client.smartlock.action(smartlock_id, {"action": 2})
+    assert recorder.count == 3
+
+    entries = list(load_recording(path))
+    assert [(e["method"], e["endpoint"], e["status"]) for e in entries] == [
+        ("GET", "/smartlock", 200),
+        ("GET", "/smartlock/auth", 200),
+        ("POST", f"/smartlock/{smartlock_id}/action", 204),
+    ]
+    assert entries[1]["params"] == {"types": [0]}
+    assert entries[2]["json"] == {"action": 2}
+    assert entries[0]["elapsed"] > 0
+    if not filename.endswith(".gz"):
+        raw = open(path).read()
+        assert "SECRET-TOKEN" not in raw
+        assert ", " not in raw.splitlines()[0][:40]
+
+
+def test_replay_serves_recorded_responses_offline(server, tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+    with Recorder(path) as recorder:
+        live = NukiWebAPI("TOKEN", base_url=server.url, recorder=recorder)
+        expected_locks = live.smartlock.list_smartlocks()
+        expected_auths = live.smartlock_auth.list_auths()
+
+    replay = NukiWebAPI("OTHER", base_url="http://unreachable.invalid", transport=ReplayTransport(path))
+    assert replay.smartlock.list_smartlocks() == expected_locks
+    assert replay.smartlock_auth.list_auths() == expected_auths
+    # Exhausted entries keep serving the last response.
+    assert replay.smartlock.list_smartlocks() == expected_locks
+
+
+def test_replay_keeps_error_statuses():
+    entries = [{"method": "GET", "endpoint": "/account", "status": 503, "body": {"detailMessage": "down"}}]
+    client = NukiWebAPI("TOKEN", transport=ReplayTransport(entries))
+    with pytest.raises(requests.HTTPError, match="down"):
+        client.account.get()
+
+
+def test_replay_unknown_request_raises():
+    client = NukiWebAPI("TOKEN", transport=ReplayTransport([]))
+    with pytest.raises(KeyError):
+        client.account.get()
+
+
+def test_replay_scaled_timing(monkeypatch):
+    entries = [{"method": "GET", "endpoint": "/account", "status": 200, "body": {}, "elapsed": 0.2}]
+    sleeps = []
+    monkeypatch.setattr("nukiwebapi.recording.time.sleep", sleeps.append)
+    NukiWebAPI("TOKEN", transport=ReplayTransport(entries, speed=4)).account.get()
+    NukiWebAPI("TOKEN", transport=ReplayTransport(entries)).account.get()
+    assert sleeps == [0.05]
+
+
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        ReplayTransport([], speed=0)
+    with pytest.raises(ValueError):
+        Recorder(str(tmp_path / "x.jsonl"), mode="r")
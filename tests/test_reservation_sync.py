@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from nukiwebapi.deadline import DeadlineExceeded
+from nukiwebapi.reservation_sync import ISSUE, REVOKE, UPDATE_ACCESS_TIMES, ReservationChange, ReservationSync
+
+pytestmark = pytest.mark.fake_server(locks=3, auths_per_lock=0, logs_per_lock=0, addresses=3)
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)  # simulator reference time
+
+
+def now_plus(**delta):
+    return START + timedelta(**delta)
+
+
+def kinds(report):
+    return sorted((c.kind, c.reservation_id) for c in report.changes)
+
+
+def test_issues_started_reservations_once(sim_client, fake_server):
+    sync = ReservationSync(sim_client, rate=None)
+
+    report = sync.run(now=now_plus(minutes=1))
+
+    assert report.addresses == 3
+    assert report.reservations == 6
+    assert kinds(report) == [(ISSUE, f"res-{a}-0") for a in sorted(fake_server.state.addresses)]
+    assert len(report.applied) == 3
+    assert all(r["authsIssued"] for r in fake_server.state.reservations[500] if r["id"] == "res-500-0")
+
+    assert sync.run(now=now_plus(minutes=2)).changes == []
+
+
+def test_issue_ahead_and_revoke_after_end(sim_client):
+    sync = ReservationSync(sim_client, address_ids=[500], issue_ahead=timedelta(days=1, hours=1), rate=None)
+
+    assert kinds(sync.run(now=now_plus(minutes=1))) == [(ISSUE, "res-500-0"), (ISSUE, "res-500-1")]
+    assert kinds(sync.run(now=now_plus(days=2, hours=1))) == [(REVOKE, "res-500-0")]
+    assert kinds(sync.run(now=now_plus(days=3, hours=1))) == [(REVOKE, "res-500-1")]
+    assert sync.run(now=now_plus(days=4)).changes == []
+
+
+def test_cancelled_reservation_is_revoked(sim_client, fake_server):
+    sync = ReservationSync(sim_client, address_ids=[501], rate=None)
+    sync.run(now=now_plus(minutes=1))
+    fake_server.state.reservations[501][0]["state"] = "CANCELLED"
+
+    assert kinds(sync.run(now=now_plus(minutes=2))) == [(REVOKE, "res-501-0")]
+
+
+def test_access_time_changes_are_applied_once(sim_client, fake_server):
+    sync = ReservationSync(sim_client, address_ids=[500], rate=None)
+    sync.run(now=now_plus(minutes=1))
+    reservation = fake_server.state.reservations[500][0]
+    reservation.update(checkInTime=900, checkOutTime=660)
+
+    report = sync.run(now=now_plus(minutes=2))
+
+    assert report.changes == [
+        ReservationChange(UPDATE_ACCESS_TIMES, 500, "res-500-0", {"checkInTime": 900, "checkOutTime": 660})
+    ]
+    assert reservation["accessTimes"] == {"checkInTime": 900, "checkOutTime": 660}
+    assert sync.run(now=now_plus(minutes=3)).changes == []
+
+
+def test_issue_records_access_times(sim_client, fake_server):
+    reservation = fake_server.state.reservations[500][0]
+    reservation.update(checkInTime=900, checkOutTime=660)
+    sync = ReservationSync(sim_client, address_ids=[500], rate=None)
+
+    assert kinds(sync.run(now=now_plus(minutes=1))) == [(ISSUE, "res-500-0")]
+    assert sync.run(now=now_plus(minutes=2)).changes == []
+
+
+def test_first_run_keeps_access_times_of_issued_reservations(sim_client, fake_server):
+    reservation = fake_server.state.reservations[500][0]
+    reservation.update(authsIssued=True, checkInTime=900, checkOutTime=660,
+                       accessTimes={"checkInTime": 900, "checkOutTime": 660})
+    sync = ReservationSync(sim_client, address_ids=[500], rate=None)
+
+    assert sync.run(now=now_plus(minutes=1)).changes == []
+    reservation.update(checkOutTime=600)
+    assert kinds(sync.run(now=now_plus(minutes=2))) == [(UPDATE_ACCESS_TIMES, "res-500-0")]
+
+
+def test_changes_are_not_retried_by_default(sim_client):
+    sync = ReservationSync(sim_client, address_ids=[500], rate=None)
+    api = sim_client.address_reservation
+
+    with patch.object(api, "issue_reservation", side_effect=requests.ReadTimeout("read timed out")) as issue:
+        report = sync.run(now=now_plus(minutes=1))
+
+    assert [change.kind for change, _ in report.failed] == [ISSUE]
+    assert issue.call_count == 1
+
+
+def test_deadline_fails_listings_and_keeps_snapshot(sim_client):
+    sync = ReservationSync(sim_client, address_ids=[500, 501], rate=None)
+
+    report = sync.run(now=now_plus(minutes=1), deadline=0)
+
+    assert sorted(report.fetch_errors) == [500, 501]
+    assert all(isinstance(e, DeadlineExceeded) for e in report.fetch_errors.values())
+    assert report.changes == [] and sync.snapshot == {}
+
+
+def test_dry_run_and_failed_addresses_keep_snapshot(sim_client, fake_server):
+    sync = ReservationSync(sim_client, address_ids=[500, 501], rate=None)
+    sync.run(now=now_plus(minutes=1))
+    snapshot = dict(sync.snapshot)
+
+    dry = ReservationSync(sim_client, address_ids=[502], snapshot=snapshot, rate=None).run(now=now_plus(minutes=1), dry_run=True)
+    assert dry.dry_run and kinds(dry) == [(ISSUE, "res-502-0")]
+    assert not fake_server.state.reservations[502][0].get("authsIssued")
+
+    sync.address_ids = [501, 500]
+    sync.max_workers = 1  # list 501 first, so it gets the injected failure
+    fake_server.fail_next(1, status=400)
+    report = sync.run(now=now_plus(minutes=2))
+    assert list(report.fetch_errors) == [501]
+    assert sync.snapshot["501/res-501-0"] == snapshot["501/res-501-0"]
@@ -0,0 +1,98 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.scheduler import Priority, RequestScheduler, current_priority, interactive, request_priority
+from nukiwebapi.smartlock_instance import SmartlockInstance
+
+
+def _wait_for_queue(scheduler, size):
+    for _ in range(200):
+        if scheduler.queued >= size:
+            return
+        time.sleep(0.005)
+    raise AssertionError("requests were not queued")
+
+
+def test_request_priority_context():
+    assert current_priority() == Priority.DEFAULT
+    with request_priority(Priority.BACKGROUND):
+        assert current_priority() == Priority.BACKGROUND
+        assert interactive(current_priority)() == Priority.INTERACTIVE
+    assert current_priority() == Priority.DEFAULT
+
+
+def test_interactive_requests_overtake_background():
+    scheduler = RequestScheduler(max_in_flight=1)
+    order = []
+
+    def worker(priority, name):
+        with scheduler.slot(priority):
+            order.append(name)
+
+    scheduler.acquire()  # occupy the only slot
+    background = [threading.Thread(target=worker, args=(Priority.BACKGROUND, f"bg{i}")) for i in range(3)]
+    for t in background:
+        t.start()
+    _wait_for_queue(scheduler, 3)
+    urgent = threading.Thread(target=worker, args=(Priority.INTERACTIVE, "unlock"))
+    urgent.start()
+    _wait_for_queue(scheduler, 4)
+
+    scheduler.release()
+    for t in background + [urgent]:
+        t.join(timeout=2)
+
+    assert order[0] == "unlock"
+    assert sorted(order[1:]) == ["bg0", "bg1", "bg2"]
+    assert scheduler.stats()["in_flight"] == 0
+    assert scheduler.wait_times[Priority.INTERACTIVE].count == 1
+
+
+def test_scheduler_applies_rate_limit():
+    scheduler = RequestScheduler(max_in_flight=4, rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(3):
+        with scheduler.slot():
+            pass
+    assert time.monotonic() - start >= 0.03
+
+
+def test_invalid_max_in_flight():
+    with pytest.raises(ValueError):
+        RequestScheduler(max_in_flight=0)
+
+
+def test_client_request_goes_through_scheduler():
+    scheduler = RequestScheduler(max_in_flight=2)
+    client = NukiWebAPI("FAKE_TOKEN", scheduler=scheduler)
+    response = requests.Response()
+    response.status_code = 200
+
+    def fake_request(*args, **kwargs):
+        assert scheduler.in_flight == 1
+        return response
+
+    with patch("requests.request", side_effect=fake_request):
+        assert client._request("GET", "/smartlock") is response
+    assert scheduler.in_flight == 0
+
+
+def test_smartlock_action_is_interactive(client):
+    instance = SmartlockInstance(client, smartlock_id=123)
+    seen = []
+
+    def fake_request(method, endpoint, **kwargs):
+        seen.append(current_priority())
+        return Mock()
+
+    with patch.object(client, "_request", side_effect=fake_request), patch.object(instance, "refresh"):
+        with request_priority(Priority.BACKGROUND):
+            instance.unlock()
+            client.advanced_api.unlock_smartlock_advanced(123)
+            client.smartlock_auth.list_auths()
+    assert seen == [Priority.INTERACTIVE, Priority.INTERACTIVE, Priority.BACKGROUND]
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+import requests
+
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.simulator import LOCKED, UNLOCKED, FakeNukiServer
+
+
+@pytest.fixture
+def server():
+    with FakeNukiServer(locks=5, auths_per_lock=3, logs_per_lock=30, webhook_logs=120, addresses=2) as srv:
+        yield srv
+
+
+@pytest.fixture
+def sim_client(server):
+    return NukiWebAPI("SIM_TOKEN", base_url=server.url)
+
+
+def test_lists_generated_fleet(sim_client):
+    locks = sim_client.lock_instances
+    assert len(locks) == 5
+    assert all(lock.is_locked for lock in locks.values())
+    assert len(sim_client.smartlock_auth.list_auths()) == 15
+    assert len(sim_client.address.list_addresses()) == 2
+
+
+def test_action_changes_state(sim_client):
+    lock = next(iter(sim_client.lock_instances.values()))
+    lock.unlock()
+    assert lock.state["state"] == UNLOCKED
+    lock.lock()
+    assert lock.state["state"] == LOCKED
+
+
+def test_async_action_completion():
+    with FakeNukiServer(locks=1, action_delay=0.05) as server:
+        client = NukiWebAPI("SIM_TOKEN", base_url=server.url)
+        lock = next(iter(client.lock_instances.values()))
+        lock.unlock()
+        assert lock.state["state"] != UNLOCKED
+        time.sleep(0.1)
+        assert lock.refresh()["state"]["state"] == UNLOCKED
+
+
+def test_async_auth_creation_and_deletion(sim_client):
+    smartlock_id = next(iter(sim_client.lock_instances))
+    sim_client.smartlock_auth.create_auth_for_smartlocks("Guest", [smartlock_id], remote_allowed=False)
+    created = [a for a in sim_client.smartlock_auth.list_auths() if a["name"] == "Guest"]
+    assert len(created) == 1
+
+    sim_client.smartlock_auth.delete_auths([created[0]["id"]])
+    assert not [a for a in sim_client.smartlock_auth.list_auths() if a["name"] == "Guest"]
+
+
+def test_webhook_log_cursor_paging(sim_client):
+    logs = list(sim_client.advanced_api.iter_webhook_logs(1, page_size=50))
+    assert len(logs) == 120
+    assert len({log["id"] for log in logs}) == 120
+
+
+def test_injected_errors_and_retries(server, sim_client):
+    server.fail_next(1, status=503)
+    with pytest.raises(requests.HTTPError) as excinfo:
+        sim_client.account.get()
+    assert excinfo.value.response.status_code == 503
+
+    smartlock_ids = list(sim_client.lock_instances)[:1]
+    server.fail_next(2, status=429)
+    report = sim_client.fleet.lock(smartlock_ids, backoff=0)
+    assert report.succeeded and report.retried
+
+
+def test_rate_limit_returns_429():
+    with FakeNukiServer(locks=1, rate_limit=1) as server:
+        client = NukiWebAPI("SIM_TOKEN", base_url=server.url)
+        client.account.get()
+        with pytest.raises(requests.HTTPError) as excinfo:
+            client.account.get()
+        assert excinfo.value.response.status_code == 429
+        assert "Retry-After" in excinfo.value.response.headers
+
+
+def test_requires_bearer_token(server):
+    response = requests.get(f"{server.url}/smartlock")
+    assert response.status_code == 401
+
+
+def test_unknown_route_is_404(sim_client):
+    with pytest.raises(requests.HTTPError, match="no route"):
+        sim_client._request("GET", "/nope")
+
+
+def test_same_seed_gives_same_ids():
+    ids = []
+    for _ in range(2):
+        with FakeNukiServer(locks=1, auths_per_lock=0, logs_per_lock=0, addresses=1, seed=3) as server:
+            client = NukiWebAPI("SIM_TOKEN", base_url=server.url)
+            address_id = next(iter(server.state.addresses))
+            created = client.address.create_address_unit(address_id, "New unit")
+            ids.append(([u["id"] for u in server.state.units[address_id]], created["id"]))
+    assert ids[0] == ids[1]
+
+
+def test_finished_timers_are_dropped():
+    with FakeNukiServer(locks=1, action_delay=0.01) as server:
+        client = NukiWebAPI("SIM_TOKEN", base_url=server.url)
+        lock = next(iter(client.lock_instances.values()))
+        for _ in range(5):
+            lock.unlock()
+            time.sleep(0.05)
+        assert len(server._timers) <= 1
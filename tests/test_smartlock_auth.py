@@ -2,11 +2,16 @@ import os
 import random
 import time
 from time import sleep
+from unittest.mock import patch
 
 import pytest
+import requests
 from dotenv import load_dotenv
 
 from nukiwebapi import NukiWebAPI
+from nukiwebapi.simulator import FakeNukiServer
+from nukiwebapi.smartlock_auth import build_bulk_payloads
+from nukiwebapi.transport import InMemoryTransport
 
 load_dotenv()  # looks for .env in cwd
 
@@ -179,4 +184,56 @@ def test_bulk_update_auth(client):
 
     assert len(updated_auths) >= len(auth_list)
 
-    teardown(client)
\ No newline at end of file
+    teardown(client)
+
+# --- Bulk creation (offline, against the simulator) ---
+
+def test_build_bulk_payloads_groups_identical_specs():
+    specs = [{"smartlock_id": lock, "name": "Cleaner", "allowed_week_days": 31} for lock in (1, 2, 3)]
+    specs.append({"smartlock_ids": [1], "name": "Guest", "type": 13, "code": "245678"})
+    specs.append({"smartlock_id": 1, "name": "Cleaner", "allowed_week_days": 31})
+
+    payloads = build_bulk_payloads(specs, max_locks_per_request=2)
+
+    assert payloads == [
+        {"name": "Cleaner", "allowedWeekDays": 31, "remoteAllowed": False, "type": 0, "smartlockIds": [1, 2]},
+        {"name": "Cleaner", "allowedWeekDays": 31, "remoteAllowed": False, "type": 0, "smartlockIds": [3, 1]},
+        {"name": "Guest", "type": 13, "code": 245678, "remoteAllowed": False, "smartlockIds": [1]},
+    ]
+
+
+@pytest.mark.parametrize("spec", [
+    {"name": "No lock"},
+    {"smartlock_id": 1},
+    {"smartlock_id": 1, "name": "Bad field", "colour": "red"},
+    {"smartlock_id": 1, "name": "No code", "type": 13},
+    {"smartlock_id": 1, "name": "Bad code", "type": 13, "code": 123456},
+    {"smartlock_id": 1, "name": "Bad days", "allowed_week_days": 128},
+    {"smartlock_id": 1, "name": "Bad time", "allowed_from_time": 1440},
+])
+def test_build_bulk_payloads_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        build_bulk_payloads([spec])
+
+
+def test_create_auths_bulk_sends_one_request_per_group():
+    simulator = FakeNukiServer(locks=3, auths_per_lock=0, logs_per_lock=0)
+    sim_client = NukiWebAPI("TOKEN", transport=InMemoryTransport(simulator))
+    locks = list(simulator.state.smartlocks)
+    specs = [{"smartlock_id": lock, "name": f"Guest {i}"} for i in range(10) for lock in locks]
+
+    results = sim_client.smartlock_auth.create_auths_bulk(specs, max_workers=3)
+
+    assert len(results) == 10
+    assert all(r.ok for r in results)
+    assert len(simulator.state.auths) == 30
+    assert sorted(results[0].item["smartlockIds"]) == sorted(locks)
+
+
+def test_create_auths_bulk_does_not_retry_ambiguous_failures():
+    offline = NukiWebAPI("TOKEN")
+    with patch.object(offline, "_request", side_effect=requests.ReadTimeout("read timed out")) as mock_request:
+        [result] = offline.smartlock_auth.create_auths_bulk([{"smartlock_ids": [1, 2], "name": "Guest"}])
+
+    assert not result.ok
+    assert mock_request.call_count == 1
@@ -0,0 +1,43 @@
+import math
+
+import pytest
+
+from nukiwebapi.stats import Histogram
+
+
+def test_histogram_summary_and_percentiles():
+    hist = Histogram()
+    for ms in range(1, 101):
+        hist.observe(ms / 1000)
+
+    assert hist.count == 100
+    assert hist.min == 0.001
+    assert hist.max == 0.1
+    assert hist.mean == pytest.approx(0.0505)
+    # bucket interpolation keeps estimates within one bucket width (25%)
+    assert hist.percentile(50) == pytest.approx(0.05, rel=0.25)
+    assert hist.percentile(99) == pytest.approx(0.099, rel=0.25)
+    assert hist.percentile(100) == pytest.approx(0.1)
+
+
+def test_histogram_empty_and_invalid():
+    hist = Histogram()
+    assert hist.percentile(50) is None
+    assert hist.mean is None
+    with pytest.raises(ValueError):
+        hist.percentile(101)
+
+
+def test_histogram_merge_and_cumulative_buckets():
+    a = Histogram(bounds=[1, 2, 3])
+    b = Histogram(bounds=[1, 2, 3])
+    a.observe(0.5)
+    b.observe(2.5)
+    b.observe(10)
+    a.merge(b)
+
+    assert a.count == 3
+    assert a.cumulative_buckets() == [(1, 1), (2, 1), (3, 2), (math.inf, 3)]
+
+    with pytest.raises(ValueError):
+        a.merge(Histogram(bounds=[1]))
@@ -0,0 +1,44 @@
+from unittest.mock import Mock, patch
+
+from nukiwebapi.sub_account_aggregator import SubAccountAggregator
+
+
+def _sub_client(locks=None, error=None):
+    sub = Mock()
+    if error:
+        sub.smartlock.list_smartlocks.side_effect = error
+    else:
+        sub.smartlock.list_smartlocks.return_value = locks
+    sub.smartlock_auth.list_auths.return_value = [{"id": "a1"}]
+    return sub
+
+
+def test_iter_tags_items_and_isolates_errors(client):
+    subs = {
+        1: _sub_client(locks=[{"smartlockId": 10}, {"smartlockId": 11}]),
+        2: _sub_client(error=RuntimeError("token revoked")),
+    }
+    with patch.object(client.account, "list_sub_accounts", return_value=[{"accountId": 1}, {"accountId": 2}]):
+        aggregator = client.account.aggregate_sub_accounts(subs)
+        items = list(aggregator.iter(resources=("smartlocks", "auths")))
+
+    locks = sorted((i.account_id, i.data["smartlockId"]) for i in items if i.resource == "smartlocks")
+    assert locks == [(1, 10), (1, 11)]
+    assert sorted(i.account_id for i in items if i.resource == "auths") == [1, 2]
+    assert isinstance(aggregator.errors[(2, "smartlocks")], RuntimeError)
+
+    summary = aggregator.metrics.summary()
+    assert summary["requests"] == 4
+    assert summary["failed"] == 1
+    assert summary["items"] == 4
+    assert summary["latency"]["smartlocks"]["count"] == 2
+
+
+def test_gather_with_callable_and_custom_resource(client):
+    aggregator = SubAccountAggregator(client, lambda sub: sub["accountId"] * 100)
+    grouped = aggregator.gather(
+        resources=[("numbers", lambda value: [{"n": value}])],
+        sub_accounts=[{"accountId": 1}, {"accountId": 2}],
+    )
+
+    assert sorted(item.data["n"] for item in grouped["numbers"]) == [100, 200]
@@ -0,0 +1,123 @@
+import pytest
+import requests
+
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.tracing import NOOP_TRACER, OpenTelemetryTracer, RecordingTracer
+from nukiwebapi.simulator import FakeNukiServer
+
+
+@pytest.fixture
+def server():
+    with FakeNukiServer(locks=3, auths_per_lock=1, logs_per_lock=0, webhook_logs=5) as srv:
+        yield srv
+
+
+def test_noop_tracer_is_default():
+    client = NukiWebAPI("TOKEN")
+    assert client.tracer is NOOP_TRACER
+    assert not client.tracer.enabled
+
+
+def test_unlock_span_has_http_children(server):
+    tracer = RecordingTracer()
+    client = NukiWebAPI("TOKEN", base_url=server.url, tracer=tracer)
+    smartlock_id, lock = next(iter(client.lock_instances.items()))
+    tracer.spans.clear()
+
+    lock.unlock()
+
+    parent = next(s for s in tracer.spans if s.name == "smartlock.unlock")
+    assert parent.parent_id is None
+    assert parent.attributes["nuki.smartlock_id"] == smartlock_id
+    assert parent.attributes["nuki.action"] == 1
+    assert "nuki.option" not in parent.attributes
+    children = tracer.children(parent)
+    assert [c.name for c in children] == ["POST /smartlock/{id}/action", "GET /smartlock/{id}"]
+    assert all(c.trace_id == parent.trace_id for c in children)
+    assert children[0].attributes["http.status_code"] == 204
+    assert children[0].attributes["nuki.smartlock_id"] == smartlock_id
+
+
+def test_get_smartlock_instance_uses_client(server):
+    tracer = RecordingTracer()
+    client = NukiWebAPI("TOKEN", base_url=server.url, tracer=tracer)
+    smartlock_id = next(iter(client.lock_instances))
+
+    client.smartlock.get_smartlock(smartlock_id).lock()
+
+    assert any(s.name == "smartlock.lock" for s in tracer.spans)
+
+
+def test_fleet_action_spans_cover_worker_threads(server):
+    tracer = RecordingTracer()
+    client = NukiWebAPI("TOKEN", base_url=server.url, tracer=tracer)
+    ids = list(client.lock_instances)
+    tracer.spans.clear()
+
+    report = client.fleet.unlock(ids, max_workers=3)
+
+    assert len(report.succeeded) == 3
+    parent = next(s for s in tracer.spans if s.name == "fleet.action")
+    assert parent.attributes["nuki.action"] == 1
+    assert "nuki.option" not in parent.attributes
+    children = tracer.children(parent)
+    assert len(children) == 3
+    assert {c.attributes["nuki.smartlock_id"] for c in children} == set(ids)
+
+
+def test_traceparent_header_is_injected(server):
+    tracer = RecordingTracer()
+    session = requests.Session()
+    sent = []
+    session.hooks["response"].append(lambda r, *args, **kwargs: sent.append(r.request.headers.get("traceparent")))
+    client = NukiWebAPI("TOKEN", base_url=server.url, tracer=tracer, session=session)
+
+    client.account.get()
+
+    span = tracer.spans[-1]
+    assert sent == [f"00-{span.trace_id}-{span.span_id}-01"]
+
+
+def test_no_traceparent_without_tracer(server):
+    session = requests.Session()
+    sent = []
+    session.hooks["response"].append(lambda r, *args, **kwargs: sent.append(r.request.headers.get("traceparent")))
+    client = NukiWebAPI("TOKEN", base_url=server.url, session=session)
+
+    client.account.get()
+
+    assert sent == [None]
+
+
+def test_error_marks_span(server):
+    tracer = RecordingTracer()
+    client = NukiWebAPI("TOKEN", base_url=server.url, tracer=tracer)
+    server.fail_next(1, status=503)
+
+    with pytest.raises(requests.HTTPError):
+        client.account.get()
+
+    span = tracer.spans[-1]
+    assert span.status == "ERROR"
+    assert span.attributes["http.status_code"] == 503
+    assert span.events[0]["type"] == "HTTPError"
+
+
+def test_webhook_log_sync_span(server):
+    tracer = RecordingTracer()
+    client = NukiWebAPI("TOKEN", base_url=server.url, tracer=tracer)
+
+    client.advanced_api.webhook_log_stats(1, page_size=2)
+
+    parent = next(s for s in tracer.spans if s.name == "webhook_logs.sync")
+    assert len(tracer.children(parent)) >= 3
+
+
+def test_opentelemetry_tracer_requires_package():
+    try:
+        import opentelemetry  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError):
+            OpenTelemetryTracer()
+    else:
+        assert OpenTelemetryTracer().enabled
@@ -0,0 +1,166 @@
+import socket
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from nukiwebapi import NukiWebAPI
+from nukiwebapi.batch import is_transient_error
+from nukiwebapi.instrumentation import Instrumentation
+from nukiwebapi.simulator import FakeNukiServer
+from nukiwebapi.transport import (
+    HttpxTransport,
+    InMemoryTransport,
+    RequestsTransport,
+    Transport,
+    Urllib3Transport,
+    encode_params,
+    make_transport,
+)
+
+
+def _httpx():
+    pytest.importorskip("httpx")
+    return HttpxTransport()
+
+
+TRANSPORTS = {
+    "requests": RequestsTransport,
+    "urllib3": Urllib3Transport,
+    "httpx": _httpx,
+}
+
+
+@pytest.fixture
+def server():
+    with FakeNukiServer(locks=2, auths_per_lock=2, logs_per_lock=0) as srv:
+        yield srv
+
+
+@pytest.fixture(params=sorted(TRANSPORTS))
+def transport(request):
+    with TRANSPORTS[request.param]() as t:
+        yield t
+
+
+def _unused_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_encode_params():
+    assert encode_params("http://x/a", None) == "http://x/a"
+    assert encode_params("http://x/a", {"types": [0, 13], "id": None, "q": "a b"}) == "http://x/a?types=0&types=13&q=a+b"
+
+
+def test_transport_round_trip(server, transport):
+    instrumentation = Instrumentation()
+    client = NukiWebAPI("TOKEN", base_url=server.url, transport=transport, instrumentation=instrumentation)
+
+    smartlock_id = next(iter(client.lock_instances))
+    auths = client.smartlock_auth.list_auths_for_smartlock(smartlock_id, types="0")
+    response = client.smartlock.action(smartlock_id, {"action": 1})
+
+    assert {a["smartlockId"] for a in auths} == {smartlock_id}
+    assert response.status_code == 204
+    assert client.smartlock.get_smartlock(smartlock_id).state["state"] == 3
+    assert instrumentation.metrics.bytes_sent > 0
+
+
+def test_transport_error_status(server, transport):
+    client = NukiWebAPI("TOKEN", base_url=server.url, transport=transport)
+    server.fail_next(1, status=503)
+    with pytest.raises(requests.HTTPError, match="injected 503") as exc:
+        client.account.get()
+    assert is_transient_error(exc.value)
+
+
+def test_transport_connection_error_is_transient(transport):
+    client = NukiWebAPI("TOKEN", base_url=f"http://127.0.0.1:{_unused_port()}", transport=transport)
+    with pytest.raises(requests.ConnectionError) as exc:
+        client.account.get()
+    assert is_transient_error(exc.value)
+
+
+def test_transport_read_timeout(transport):
+    with FakeNukiServer(locks=1, latency=0.5) as server:
+        with pytest.raises(requests.Timeout):
+            transport.request("GET", f"{server.url}/account", headers={"Authorization": "Bearer T"}, timeout=(1, 0.05))
+
+
+def test_in_memory_transport_uses_simulator_without_http():
+    simulator = FakeNukiServer(locks=3, auths_per_lock=1, logs_per_lock=0)
+    client = NukiWebAPI("TOKEN", base_url="http://in-memory", transport=InMemoryTransport(simulator))
+
+    assert len(client.lock_instances) == 3
+    smartlock_id = next(iter(client.lock_instances))
+    client.lock_instances[smartlock_id].lock()
+    assert simulator.request_log[-2:] == [("POST", f"/smartlock/{smartlock_id}/action"), ("GET", f"/smartlock/{smartlock_id}")]
+
+    with pytest.raises(requests.HTTPError):
+        client.smartlock.get_smartlock(1)
+
+
+def test_in_memory_transport_with_handler():
+    calls = []
+
+    def handler(method, path, query, body, headers):
+        calls.append((method, path, query, body))
+        return 200, {"ok": True}, {}
+
+    client = NukiWebAPI("TOKEN", transport=InMemoryTransport(handler))
+    assert client.smartlock.action(5, {"action": 1}).json() == {"ok": True}
+    assert calls == [("POST", "/smartlock/5/action", {}, {"action": 1})]
+
+
+def test_transport_selected_by_name(server):
+    client = NukiWebAPI("TOKEN", base_url=server.url, transport="urllib3")
+    assert isinstance(client.transport, Urllib3Transport)
+    assert client.account.get()["accountId"]
+
+
+def test_make_transport():
+    assert make_transport(None) is None
+    transport = RequestsTransport()
+    assert make_transport(transport) is transport
+    assert isinstance(make_transport("requests"), RequestsTransport)
+    with pytest.raises(ValueError):
+        make_transport("curl")
+
+
+def test_transport_requires_request():
+    class Incomplete(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_client_closes_only_transports_it_created():
+    with NukiWebAPI("TOKEN", transport="requests") as client:
+        owned = client.transport
+    shared = RequestsTransport()
+    with patch.object(owned, "close") as owned_close, patch.object(shared, "close") as shared_close:
+        client.close()
+        NukiWebAPI("TOKEN", transport=shared).close()
+
+    owned_close.assert_called_once_with()
+    shared_close.assert_not_called()
+    NukiWebAPI("TOKEN").close()
+
+
+def test_http2_client_uses_httpx_transport(server):
+    pytest.importorskip("h2")
+    client = NukiWebAPI("TOKEN", base_url=server.url, http2=True)
+
+    assert isinstance(client.transport, HttpxTransport)
+    response = client._request("GET", "/account")
+    # The simulator speaks HTTP/1.1 only, so the connection falls back.
+    assert response.http_version == "HTTP/1.1"
+    client.close()
+
+
+def test_http2_conflicts_with_explicit_transport():
+    with pytest.raises(ValueError):
+        NukiWebAPI("TOKEN", transport="requests", http2=True)
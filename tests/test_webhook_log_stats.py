@@ -0,0 +1,32 @@
+from nukiwebapi.webhook_log_stats import WebhookLogStats
+
+
+def test_stats_group_by_feature_and_endpoint():
+    stats = WebhookLogStats().consume([
+        {"id": "3", "url": "https://a", "responseStatus": 204, "responseTime": 50,
+         "request": {"feature": "DEVICE_STATUS"}},
+        {"id": "2", "url": "https://b", "responseStatus": 200, "responseTime": 150,
+         "request": "not json"},
+        {"id": "1", "url": "https://a", "responseStatus": None, "responseTime": 2000,
+         "webhookFeature": "DEVICE_AUTHS"},
+    ])
+
+    assert stats.newest_id == "3"
+    assert stats.oldest_id == "1"
+    assert set(stats.by_feature) == {"DEVICE_STATUS", "UNKNOWN", "DEVICE_AUTHS"}
+    assert stats.by_endpoint["https://a"].total == 2
+    assert stats.by_endpoint["https://a"].failed == 1
+    assert stats.overall.latency.max == 2.0
+
+
+def test_failure_rate_unknown_feature_is_zero():
+    assert WebhookLogStats().failure_rate("DEVICE_STATUS") == 0.0
+
+
+def test_latency_field_is_optional():
+    stats = WebhookLogStats()
+    stats.add({"id": "1", "responseStatus": 200})
+
+    summary = stats.summary()["overall"]
+    assert summary["total"] == 1
+    assert summary["latency"]["count"] == 0